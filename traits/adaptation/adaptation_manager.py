@@ -13,15 +13,27 @@
 """ Manages all registered adaptations. """
 
 
+from abc import ABCMeta
 from heapq import heappop, heappush
 import inspect
 import itertools
 import sys
 import functools
+import threading
 
 from traits.adaptation.adaptation_error import AdaptationError
+from traits.ctraits import _adaptation_changed
 from traits.has_traits import HasTraits
-from traits.trait_types import Dict, List, Str
+from traits.trait_types import Any, Dict, Int, List, Set, Str
+
+try:
+    from abc import get_cache_token as abc_cache_token
+
+except ImportError:
+    # Python < 3.4.
+    def abc_cache_token():
+        """ Return a token which changes whenever an ABC is registered. """
+        return ABCMeta._abc_invalidation_counter
 
 
 def no_adapter_necessary(adaptee):
@@ -147,6 +159,15 @@ class AdaptationManager(HasTraits):
         )
         offers.append(offer)
 
+        # The new offer may change the offers applicable to (and so the paths
+        # used to adapt) any type.
+        self._applicable_offers.clear()
+        self._adaptation_paths.clear()
+        self._unadaptable.clear()
+
+        # Invalidate the caches of the C-level validators of adapting traits.
+        _adaptation_changed()
+
         return
 
     def register_factory(self, factory, from_protocol, to_protocol):
@@ -186,6 +207,16 @@ class AdaptationManager(HasTraits):
 
         return self.adapt(obj, protocol, None) is not None
 
+    #### 'AdaptationManager' statistics #######################################
+
+    #: The number of adaptations which failed immediately because the type of
+    #: the adaptee was known not to be adaptable to the protocol.
+    unadaptable_cache_hits = Int
+
+    #: The number of adaptations for which the type of the adaptee was not
+    #: known to be unadaptable, and so needed the adaptation paths.
+    unadaptable_cache_misses = Int
+
     #### Private protocol #####################################################
 
     #: All registered adaptation offers.
@@ -193,6 +224,29 @@ class AdaptationManager(HasTraits):
     #: list of adaptation offers.
     _adaptation_offers = Dict(Str, List)
 
+    #: The candidate adaptation paths found so far.
+    #: Keys are ( type of the adaptee, target protocol ); values are
+    #: _AdaptationPaths instances.
+    _adaptation_paths = Dict
+
+    #: The offers applicable to each protocol, sorted in order of preference.
+    #: Keys are protocols; values are lists of (mro_distance, offer) tuples.
+    _applicable_offers = Dict
+
+    #: The memoized MRO distances between types and protocols.
+    #: Keys are (type, protocol); values are the distance, or None if the
+    #: type does not provide the protocol.
+    _mro_distances = Dict
+
+    #: The (type, protocol) pairs for which no adaptation paths exist, so
+    #: that the adaptation of any instance of the type fails.
+    _unadaptable = Set
+
+    #: The ABC cache token when the adaptation paths, applicable offers, MRO
+    #: distances and unadaptable types were found (registering a class with
+    #: an ABC or Interface can change them all).
+    _adaptation_paths_token = Any
+
     def _adapt(self, adaptee, to_protocol):
         """ Returns an adapter that adapts an object to the target class.
 
@@ -200,6 +254,59 @@ class AdaptationManager(HasTraits):
 
         """
 
+        paths_cache = self._adaptation_paths
+        token = abc_cache_token()
+        if token != self._adaptation_paths_token:
+            paths_cache.clear()
+            self._applicable_offers.clear()
+            self._mro_distances.clear()
+            self._unadaptable.clear()
+            self._adaptation_paths_token = token
+
+        key = (type(adaptee), to_protocol)
+        if key in self._unadaptable:
+            self.unadaptable_cache_hits += 1
+            return None
+
+        self.unadaptable_cache_misses += 1
+
+        # The candidate paths only depend on the adaptee's type, so they are
+        # found once for each type (and protocol), in order of preference.
+        paths = paths_cache.get(key)
+        if paths is None:
+            paths = paths_cache[key] = _AdaptationPaths(
+                self._find_adaptation_paths(type(adaptee), to_protocol)
+            )
+
+        for path in paths:
+            # Walk path and create adapters
+            adapter = adaptee
+            for offer in path:
+                adapter = offer.factory(adapter)
+                if adapter is None:
+                    # This adaptation attempt failed (e.g. because of
+                    # conditional adaptation).
+                    # Discard this path and continue.
+                    break
+
+            else:
+                # We're done!
+                return adapter
+
+        # Remember the types which cannot be adapted at all. If there are any
+        # paths, the adaptation failed because of conditional adaptation, and
+        # may succeed for other instances.
+        if paths.is_empty():
+            self._unadaptable.add(key)
+
+        return None
+
+    def _find_adaptation_paths(self, from_type, to_protocol):
+        """ Generates the paths of adaptation offers adapting instances of a
+        type to the target class, most preferred first.
+
+        """
+
         # The algorithm for finding a sequence of adapters adapting 'adaptee'
         # to 'to_protocol' is based on a weighted graph.
 
@@ -214,9 +321,9 @@ class AdaptationManager(HasTraits):
         #    to go from A to offer.from_protocol, so that more specific
         #    adapters are always preferred
 
-        # The algorithm finds the shortest weighted path between 'adaptee'
-        # and 'to_protocol'. Once a candidate path is found, it tries to
-        # create the adapters using the factories in the adaptation offers
+        # The algorithm finds the shortest weighted path between 'from_type'
+        # and 'to_protocol'. Once a candidate path is found, the caller tries
+        # to create the adapters using the factories in the adaptation offers
         # that compose the path. If this fails because of conditional
         # adaptation (i.e., an adapter factory returns None), the path
         # is discarded and the algorithm looks for the next shortest path.
@@ -241,7 +348,7 @@ class AdaptationManager(HasTraits):
 
         # The priority queue containing entries of the form
         # (cumulative weight, path, current protocol) describing an
-        # adaptation path starting at `adaptee`, following a sequence
+        # adaptation path starting at `from_type`, following a sequence
         # of adaptation offers, `path`, and having weight `cumulative_weight`.
         #
         # 'cumulative weight' is a tuple of the form
@@ -252,7 +359,7 @@ class AdaptationManager(HasTraits):
         # The counter is an increasing number, and is used to make the
         # priority queue stable w.r.t insertion time
         # (see http://bit.ly/13VxILn).
-        offer_queue = [((0, 0, next(counter)), [], type(adaptee))]
+        offer_queue = [((0, 0, next(counter)), [], from_type)]
 
         while len(offer_queue) > 0:
             # Get the most specific candidate path for adaptation.
@@ -260,14 +367,6 @@ class AdaptationManager(HasTraits):
 
             edges = self._get_applicable_offers(current_protocol, path)
 
-            # Sort by weight first, then by from_protocol type.
-            if sys.version_info[0] < 3:
-                edges.sort(cmp=_by_weight_then_from_protocol_specificity)
-            else:
-                # functools.cmp_to_key is available from 2.7 and 3.2
-                edges.sort(key=functools.cmp_to_key(_by_weight_then_from_protocol_specificity))
-
-
             # At this point, the first edges are the shortest ones. Within
             # edges with the same distance, interfaces which are subclasses
             # of other interfaces in that group come first. The rest of
@@ -278,19 +377,9 @@ class AdaptationManager(HasTraits):
 
                 # Check if we arrived at the target protocol.
                 if self.provides_protocol(offer.to_protocol, to_protocol):
-                    # Walk path and create adapters
-                    adapter = adaptee
-                    for offer in new_path:
-                        adapter = offer.factory(adapter)
-                        if adapter is None:
-                            # This adaptation attempt failed (e.g. because of
-                            # conditional adaptation).
-                            # Discard this path and continue.
-                            break
-
-                    else:
-                        # We're done!
-                        return adapter
+                    # The caller tries to create the adapters, and asks for
+                    # the next path if this fails.
+                    yield new_path
 
                 else:
                     # Push the new path on the priority queue.
@@ -303,38 +392,117 @@ class AdaptationManager(HasTraits):
                         (new_weight, new_path, offer.to_protocol)
                     )
 
-        return None
-
     def _get_applicable_offers(self, current_protocol, path):
         """ Find all adaptation offers that can be applied to a protocol.
 
         Return all the applicable offers together with the number of steps
         up the MRO hierarchy that need to be taken from the protocol
         to the offer's from_protocol.
-        The returned object is a list of tuples (mro_distance, offer) .
+        The returned object is a list of tuples (mro_distance, offer), sorted
+        by weight first, then by from_protocol type.
 
         In terms of our graph algorithm, we're looking for all outgoing edges
         from the current node.
         """
 
+        edges = self._applicable_offers.get(current_protocol)
+        if edges is None:
+            edges = self._index_applicable_offers(current_protocol)
+
+        # Avoid cycles by checking that we did not consider an offer in this
+        # path.
+        return [edge for edge in edges if edge[1] not in path]
+
+    def _index_applicable_offers(self, current_protocol):
+        """ Find and cache the sorted list of all adaptation offers that can be
+        applied to a protocol.
+
+        """
+
         edges = []
 
         for from_protocol_name, offers in self._adaptation_offers.items():
             from_protocol = offers[0].from_protocol
-            mro_distance = self.mro_distance_to_protocol(
-                current_protocol, from_protocol
-            )
+            mro_distance = self._mro_distance(current_protocol, from_protocol)
 
             if mro_distance is not None:
+                edges.extend((mro_distance, offer) for offer in offers)
+
+        # Sort by weight first, then by from_protocol type.
+        if sys.version_info[0] < 3:
+            edges.sort(cmp=_by_weight_then_from_protocol_specificity)
+        else:
+            # functools.cmp_to_key is available from 2.7 and 3.2
+            edges.sort(key=functools.cmp_to_key(_by_weight_then_from_protocol_specificity))
 
-                for offer in offers:
-                    # Avoid cycles by checking that we did not consider this
-                    # offer in this path.
-                    if offer not in path:
-                        edges.append((mro_distance, offer))
+        self._applicable_offers[current_protocol] = edges
 
         return edges
 
+    def _mro_distance(self, from_type, to_protocol):
+        """ Return the (memoized) distance in the MRO from 'from_type' to
+        'to_protocol'.
+
+        See 'mro_distance_to_protocol' for details.
+
+        """
+
+        key = (from_type, to_protocol)
+        distances = self._mro_distances
+        if key in distances:
+            return distances[key]
+
+        distance = distances[key] = self.mro_distance_to_protocol(
+            from_type, to_protocol
+        )
+
+        return distance
+
+
+class _AdaptationPaths(object):
+    """ The candidate adaptation paths between a type and a protocol.
+
+    Iterating yields the paths found by a search (a generator) in order,
+    continuing the search only when all of the paths found so far have been
+    tried, so that the search is done at most once.
+
+    """
+
+    def __init__(self, search):
+        self._paths = []
+        self._search = search
+        self._lock = threading.Lock()
+
+    def __iter__(self):
+        paths = self._paths
+        index = 0
+        while True:
+            if index < len(paths):
+                yield paths[index]
+                index += 1
+                continue
+
+            with self._lock:
+                if index < len(paths):
+                    # Another thread continued the search.
+                    continue
+
+                if self._search is None:
+                    return
+
+                try:
+                    paths.append(next(self._search))
+
+                except StopIteration:
+                    self._search = None
+                    return
+
+    def is_empty(self):
+        """ Return whether the search has finished without finding any paths.
+        """
+
+        return (self._search is None) and (len(self._paths) == 0)
+
 def _by_weight_then_from_protocol_specificity(edge_1, edge_2):
     """ Comparison function for graph edges.
 
@@ -386,6 +554,7 @@ def set_global_adaptation_manager(new_adaptation_manager):
     """ Set the global adaptation manager to the given instance. """
     global adaptation_manager
     adaptation_manager = new_adaptation_manager
+    _adaptation_changed()
 
 
 def reset_global_adaptation_manager():
@@ -393,6 +562,7 @@ def reset_global_adaptation_manager():
     """
     global adaptation_manager
     adaptation_manager = AdaptationManager()
+    _adaptation_changed()
 
 
 def get_global_adaptation_manager():
@@ -13,9 +13,17 @@
 """ An adapter factory that caches adapters per instance. """
 
 
+from collections import OrderedDict
 import weakref
 
-from traits.api import Any, Bool, HasTraits, Property
+try:
+    from time import monotonic as clock
+
+except ImportError:
+    # Python < 3.3.
+    from time import time as clock
+
+from traits.api import Any, Bool, HasTraits, Int, Property
 from traits.util.api import import_symbol
 
 
@@ -25,7 +33,7 @@ class CachedAdapterFactory(HasTraits):
     We provide this class to provide the caching functionality of the
     old traits 'adapts' implementation. However, note that the cache will
     not be cleared unless you take care of cleaning the 'adaptee' trait once
-    your adapter are deleted.
+    your adapter are deleted, or bound the cache using 'max_size' or 'ttl'.
 
     This class will be removed when the 'adapts' function is removed.
 
@@ -36,10 +44,17 @@ class CachedAdapterFactory(HasTraits):
     def __call__(self, adaptee):
         """ The adapter manager uses callables for adapter factories. """
 
-        adapter = self._adapter_cache.get(adaptee, None)
+        # Only the (plain Python) cache object is used, to keep the call cheap.
+        cache = self._adapter_cache
+        adapter = cache.get(adaptee)
         if adapter is None:
-            adapter = self.factory(adaptee)
-            self._adapter_cache[adaptee] = adapter
+            factory = cache.factory
+            if factory is None:
+                factory = cache.factory = self.factory
+
+            adapter = factory(adaptee)
+            if adapter is not None:
+                cache.add(adaptee, adapter)
 
         return adapter
 
@@ -56,6 +71,15 @@ class CachedAdapterFactory(HasTraits):
     #: 'from foo.bar import baz' and imported when the trait is first accessed.
     factory = Property(Any)
 
+    #: The maximum number of adapters cached, or None for no limit.
+    #:
+    #: When the cache is full, the least recently used adapter is evicted.
+    max_size = Any
+
+    #: The number of seconds an adapter is cached for, or None to cache
+    #: adapters until they are evicted (or their adaptee is deleted).
+    ttl = Any
+
     #: True if the cache is empty, otherwise False.
     #:
     #: This method is mostly here to help testing - the framework does not
@@ -64,11 +88,33 @@ class CachedAdapterFactory(HasTraits):
     def _get_is_empty(self):
         return len(self._adapter_cache) == 0
 
+    #: The number of calls which returned a cached adapter.
+    hits = Property(Int)
+    def _get_hits(self):
+        return self._adapter_cache.hits
+
+    #: The number of calls which created an adapter.
+    misses = Property(Int)
+    def _get_misses(self):
+        return self._adapter_cache.misses
+
+    #: The number of adapters removed from the cache because it was full or
+    #: because they expired.
+    evictions = Property(Int)
+    def _get_evictions(self):
+        return self._adapter_cache.evictions
+
     #### Private protocol ######################################################
 
     _adapter_cache = Any
     def __adapter_cache_default(self):
-        return weakref.WeakKeyDictionary()
+        return _AdapterCache(self.max_size, self.ttl)
+
+    def _max_size_changed(self, new):
+        self._adapter_cache.set_max_size(new)
+
+    def _ttl_changed(self, new):
+        self._adapter_cache.ttl = new
 
     #: Shadow trait for the corresponding property.
     _factory = Any
@@ -89,7 +135,149 @@ class CachedAdapterFactory(HasTraits):
         """ Trait property setter. """
 
         self._factory = factory
+        self._factory_loaded = False
+        self._adapter_cache.factory = None
 
         return
 
+
+class _AdapterCache(object):
+    """ The adapters cached by a CachedAdapterFactory.
+
+    Adapters are keyed by the identity of their adaptee. Adaptees that support
+    weak references are referred to weakly, so that their adapters are removed
+    when they are deleted. Other adaptees are kept alive by the cache until
+    their adapter is evicted, to prevent their id from being reused.
+
+    """
+
+    def __init__(self, max_size=None, ttl=None):
+        #: The resolved adapter factory (set on first use).
+        self.factory = None
+
+        #: The maximum number of adapters cached, or None for no limit.
+        self.max_size = max_size
+
+        #: The number of seconds an adapter is cached for, or None.
+        self.ttl = ttl
+
+        #: The cache statistics.
+        self.hits = self.misses = self.evictions = 0
+
+        #: The cache entries, least recently used first.
+        #: Keys are the ids of the adaptees; values are tuples of the form
+        #: (adapter, expiry time or None, reference to the adaptee), where the
+        #: reference is a weak reference or (if the adaptee does not support
+        #: weak references) the adaptee itself.
+        self._entries = OrderedDict()
+
+        # The callback removing the entries of deleted adaptees. This only
+        # refers to the cache weakly, so that the references stored in the
+        # cache do not keep it alive.
+        self_ref = weakref.ref(self)
+        def remove(key):
+            cache = self_ref()
+            if cache is not None:
+                cache._entries.pop(key, None)
+
+        self._remove = remove
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, adaptee):
+        """ Return the cached adapter of an adaptee, or None. """
+
+        entries = self._entries
+        key = id(adaptee)
+        entry = entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        adapter, expiry, ref = entry
+        if (expiry is not None) and (clock() >= expiry):
+            del entries[key]
+            self.evictions += 1
+            self.misses += 1
+            return None
+
+        if self.max_size is not None:
+            # Mark the entry as the most recently used.
+            del entries[key]
+            entries[key] = entry
+
+        self.hits += 1
+
+        return adapter
+
+    def add(self, adaptee, adapter):
+        """ Cache the adapter of an adaptee. """
+
+        key = id(adaptee)
+        remove = self._remove
+        try:
+            ref = weakref.ref(adaptee, lambda ref: remove(key))
+
+        except TypeError:
+            # The adaptee does not support weak references, so it must be
+            # kept alive to prevent its id from being reused.
+            ref = adaptee
+
+        expiry = None
+        if self.ttl is not None:
+            expiry = clock() + self.ttl
+
+        entries = self._entries
+        entries.pop(key, None)
+        self._evict_expired()
+        entries[key] = (adapter, expiry, ref)
+        self._trim()
+
+        return
+
+    def set_max_size(self, max_size):
+        """ Change the maximum size of the cache. """
+
+        self.max_size = max_size
+        self._evict_expired()
+        self._trim()
+
+        return
+
+    #### Private protocol ######################################################
+
+    def _evict_expired(self):
+        """ Evict the expired entries at the head of the cache. """
+
+        if self.ttl is not None:
+            entries = self._entries
+            now = clock()
+            while len(entries) > 0:
+                key = next(iter(entries))
+                expiry = entries[key][1]
+                if (expiry is None) or (expiry > now):
+                    break
+
+                del entries[key]
+                self.evictions += 1
+
+        return
+
+    def _trim(self):
+        """ Evict the least recently used entries until the cache is no larger
+        than its maximum size.
+
+        """
+
+        max_size = self.max_size
+        if max_size is not None:
+            entries = self._entries
+            while len(entries) > max_size:
+                entries.popitem(last=False)
+                self.evictions += 1
+
+        return
+
+
 #### EOF #######################################################################
@@ -0,0 +1,146 @@
+""" Benchmark the adaptation manager's offer lookup with many offers.
+
+Registers 1000 adaptation offers between Interfaces, and adapts objects whose
+types are at the bottom of deep class hierarchies, comparing the indexed offer
+lookup (with memoized MRO distances) with the previous implementation, which
+scanned all the offers and walked the MRO for each node expanded by the
+search.
+
+This is not 'enforced' by any tests.
+
+"""
+
+
+import functools
+import sys
+import time
+
+from traits.adaptation.adaptation_manager import (
+    AdaptationManager, _by_weight_then_from_protocol_specificity
+)
+from traits.api import HasTraits, Interface, provides
+
+
+N_OFFERS     = 1000
+CHAIN        = 5
+DEPTH        = 20
+N_LEAVES     = 10
+N_ITERATIONS = 20
+
+
+class LegacyAdaptationManager(AdaptationManager):
+    """ Uses the offer lookup prior to the offer index. """
+
+    def _get_applicable_offers(self, current_protocol, path):
+        edges = []
+
+        for from_protocol_name, offers in self._adaptation_offers.items():
+            from_protocol = offers[0].from_protocol
+            mro_distance = self.mro_distance_to_protocol(
+                current_protocol, from_protocol
+            )
+
+            if mro_distance is not None:
+
+                for offer in offers:
+                    if offer not in path:
+                        edges.append((mro_distance, offer))
+
+        if sys.version_info[0] < 3:
+            edges.sort(cmp=_by_weight_then_from_protocol_specificity)
+        else:
+            edges.sort(key=functools.cmp_to_key(
+                _by_weight_then_from_protocol_specificity))
+
+        return edges
+
+
+# Protocols adapted by the offers unrelated to the adapted objects.
+sources = [type('ISource%d' % i, (Interface,), {}) for i in range(N_OFFERS)]
+sinks = [type('ISink%d' % i, (Interface,), {}) for i in range(N_OFFERS)]
+
+# The chain of protocols used to adapt the objects to the final target.
+chain = [type('IChain%d' % i, (Interface,), {}) for i in range(CHAIN)]
+
+
+class ITarget(Interface):
+    pass
+
+
+@provides(ITarget)
+class Target(HasTraits):
+    pass
+
+
+# Deep class hierarchies whose root provides the first protocol of the chain.
+leaves = []
+for leaf in range(N_LEAVES):
+    klass = provides(chain[0])(type('Root%d' % leaf, (HasTraits,), {}))
+    for depth in range(DEPTH):
+        klass = type('Class%d_%d' % (leaf, depth), (klass,), {})
+    leaves.append(klass)
+
+
+def create_manager(klass):
+    """ Create an adaptation manager with N_OFFERS unrelated offers and the
+    chain of offers adapting to the target registered.
+
+    """
+
+    manager = klass()
+
+    for source, sink in zip(sources, sinks):
+        manager.register_factory(
+            factory       = lambda adaptee: adaptee,
+            from_protocol = source,
+            to_protocol   = sink
+        )
+
+    for from_protocol, to_protocol in zip(chain, chain[1:]):
+        manager.register_factory(
+            factory       = lambda adaptee: adaptee,
+            from_protocol = from_protocol,
+            to_protocol   = to_protocol
+        )
+
+    manager.register_factory(
+        factory       = lambda adaptee: Target(),
+        from_protocol = chain[-1],
+        to_protocol   = ITarget
+    )
+
+    return manager
+
+
+def measure(manager, objects):
+    """ Return the average time in milliseconds of an adaptation of each
+    object, searching for its adaptation path.
+
+    """
+
+    start_time = time.time()
+    for _ in range(N_ITERATIONS):
+        # Make every adaptation search for its path.
+        manager._adaptation_paths.clear()
+        for obj in objects:
+            assert isinstance(manager.adapt(obj, ITarget), Target)
+
+    return ((time.time() - start_time) * 1000.0 /
+            (N_ITERATIONS * len(objects)))
+
+
+for klass in (LegacyAdaptationManager, AdaptationManager):
+    manager = create_manager(klass)
+    objects = [leaf() for leaf in leaves]
+
+    # The first adaptation of each type also builds the offer index.
+    start_time = time.time()
+    for obj in objects:
+        manager.adapt(obj, ITarget)
+    first = (time.time() - start_time) * 1000.0 / len(objects)
+
+    print '%-24s: %8.3f msec first adapt(), %8.3f msec uncached adapt()' % (
+        klass.__name__, first, measure(manager, objects)
+    )
+
+#### EOF #######################################################################
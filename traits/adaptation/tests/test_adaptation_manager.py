@@ -539,6 +539,169 @@ class TestAdaptationManagerWithABC(unittest.TestCase):
 
         return
 
+    def test_adaptation_paths_cached(self):
+
+        ex = self.examples
+
+        self.adaptation_manager.register_factory(
+            factory       = ex.UKStandardToEUStandard,
+            from_protocol = ex.UKStandard,
+            to_protocol   = ex.EUStandard
+        )
+
+        self.adaptation_manager.register_factory(
+            factory       = ex.EUStandardToJapanStandard,
+            from_protocol = ex.EUStandard,
+            to_protocol   = ex.JapanStandard
+        )
+
+        uk_plug = ex.UKPlug()
+        japan_plug = self.adaptation_manager.adapt(uk_plug, ex.JapanStandard)
+        self.assertIsInstance(japan_plug, ex.EUStandardToJapanStandard)
+
+        # The path is found once, then reused for other plugs.
+        paths = self.adaptation_manager._adaptation_paths
+        self.assertEqual(list(paths), [(ex.UKPlug, ex.JapanStandard)])
+        cached = paths[(ex.UKPlug, ex.JapanStandard)]
+        japan_plug = self.adaptation_manager.adapt(ex.UKPlug(),
+                                                   ex.JapanStandard)
+        self.assertIsInstance(japan_plug, ex.EUStandardToJapanStandard)
+        self.assertIs(paths[(ex.UKPlug, ex.JapanStandard)], cached)
+
+        # Registering an offer invalidates the cached paths, so the new,
+        # shorter path is used.
+        self.adaptation_manager.register_factory(
+            factory       = ex.UKStandardToJapanStandard,
+            from_protocol = ex.UKStandard,
+            to_protocol   = ex.JapanStandard
+        )
+        self.assertEqual(len(paths), 0)
+        japan_plug = self.adaptation_manager.adapt(uk_plug, ex.JapanStandard)
+        self.assertIsInstance(japan_plug, ex.UKStandardToJapanStandard)
+
+        return
+
+    def test_cached_conditional_adaptation(self):
+
+        class Source(object):
+            def __init__(self, allowed):
+                self.allowed = allowed
+
+        class Target(object):
+            pass
+
+        class Other(object):
+            pass
+
+        def conditional(adaptee):
+            return Target() if adaptee.allowed else None
+
+        def fallback(adaptee):
+            target = Target()
+            target.fallback = True
+            return target
+
+        self.adaptation_manager.register_factory(
+            factory=conditional, from_protocol=Source, to_protocol=Target
+        )
+        self.adaptation_manager.register_factory(
+            factory=lambda adaptee: Other(), from_protocol=Source,
+            to_protocol=Other
+        )
+        self.adaptation_manager.register_factory(
+            factory=fallback, from_protocol=Other, to_protocol=Target
+        )
+
+        # Each adaptation tries the cached paths in order, whatever the
+        # outcome of previous adaptations of the same type.
+        for allowed in (True, False, True, False):
+            target = self.adaptation_manager.adapt(Source(allowed), Target)
+            self.assertEqual(hasattr(target, 'fallback'), not allowed)
+
+        return
+
+    def test_unadaptable_cache(self):
+
+        ex = self.examples
+
+        manager = self.adaptation_manager
+        manager.register_factory(
+            factory       = ex.UKStandardToEUStandard,
+            from_protocol = ex.UKStandard,
+            to_protocol   = ex.EUStandard
+        )
+
+        for _ in range(3):
+            self.assertIsNone(manager.adapt(ex.UKPlug(), ex.JapanStandard,
+                                            None))
+        self.assertEqual(manager.unadaptable_cache_misses, 1)
+        self.assertEqual(manager.unadaptable_cache_hits, 2)
+        self.assertFalse(manager.supports_protocol(ex.UKPlug(),
+                                                   ex.JapanStandard))
+        self.assertEqual(manager.unadaptable_cache_hits, 3)
+
+        # Other types and protocols are not affected.
+        self.assertIsNotNone(manager.adapt(ex.UKPlug(), ex.EUStandard))
+        self.assertEqual(manager.unadaptable_cache_misses, 2)
+
+        # Registering an offer clears the cache.
+        manager.register_factory(
+            factory       = ex.EUStandardToJapanStandard,
+            from_protocol = ex.EUStandard,
+            to_protocol   = ex.JapanStandard
+        )
+        self.assertIsNotNone(manager.adapt(ex.UKPlug(), ex.JapanStandard))
+        self.assertEqual(manager.unadaptable_cache_misses, 3)
+
+        return
+
+    def test_conditional_adaptation_not_cached_as_unadaptable(self):
+
+        class Source(object):
+            def __init__(self, allowed):
+                self.allowed = allowed
+
+        class Target(object):
+            pass
+
+        def conditional(adaptee):
+            return Target() if adaptee.allowed else None
+
+        manager = self.adaptation_manager
+        manager.register_factory(
+            factory=conditional, from_protocol=Source, to_protocol=Target
+        )
+
+        self.assertIsNone(manager.adapt(Source(False), Target, None))
+        self.assertIsNone(manager.adapt(Source(False), Target, None))
+        self.assertIsInstance(manager.adapt(Source(True), Target), Target)
+        self.assertEqual(manager.unadaptable_cache_hits, 0)
+
+        return
+
+    def test_abc_registration_invalidates_cache(self):
+
+        import abc
+
+        class IFoo(object):
+            __metaclass__ = abc.ABCMeta
+
+        class Foo(object):
+            pass
+
+        class Bar(object):
+            pass
+
+        self.adaptation_manager.register_factory(
+            factory=lambda adaptee: Foo(), from_protocol=IFoo,
+            to_protocol=Foo
+        )
+        self.assertIsNone(self.adaptation_manager.adapt(Bar(), Foo, None))
+        IFoo.register(Bar)
+        self.assertIsInstance(self.adaptation_manager.adapt(Bar(), Foo), Foo)
+
+        return
+
 
 class TestAdaptationManagerWithInterfaces(TestAdaptationManagerWithABC):
     """ Test the adaptation manager with Interfaces. """
@@ -136,6 +136,120 @@ class TestCachedAdapterFactory(unittest.TestCase):
 
         self.assertTrue(factory.is_empty)
 
+    def test_cache_statistics(self):
+
+        ex = self.examples
+
+        factory = CachedAdapterFactory(factory=ex.EditorToIPrintable)
+
+        editors = [ex.Editor() for _ in range(3)]
+        adapters = [factory(editor) for editor in editors]
+        self.assertEqual([factory(editor) for editor in editors], adapters)
+        self.assertEqual((factory.hits, factory.misses, factory.evictions),
+                         (3, 3, 0))
+
+        return
+
+    def test_lru_eviction(self):
+
+        ex = self.examples
+
+        factory = CachedAdapterFactory(
+            factory=ex.EditorToIPrintable, max_size=2
+        )
+
+        editors = [ex.Editor() for _ in range(3)]
+        adapter_0 = factory(editors[0])
+        factory(editors[1])
+        self.assertIs(factory(editors[0]), adapter_0)
+
+        # The least recently used adapter (for editor 1) is evicted.
+        factory(editors[2])
+        self.assertEqual(factory.evictions, 1)
+        self.assertIs(factory(editors[0]), adapter_0)
+        factory(editors[1])
+        self.assertEqual(factory.misses, 4)
+
+        factory.max_size = 1
+        self.assertEqual(factory.evictions, 3)
+        self.assertEqual(len(factory._adapter_cache), 1)
+
+        return
+
+    def test_ttl_expiry(self):
+
+        ex = self.examples
+
+        factory = CachedAdapterFactory(factory=ex.EditorToIPrintable, ttl=60)
+
+        editor = ex.Editor()
+        adapter = factory(editor)
+        self.assertIs(factory(editor), adapter)
+
+        # Adapters cached with no time to live expire immediately.
+        factory = CachedAdapterFactory(factory=ex.EditorToIPrintable, ttl=0)
+        adapter = factory(editor)
+        self.assertIsNot(factory(editor), adapter)
+        self.assertEqual((factory.hits, factory.misses, factory.evictions),
+                         (0, 2, 1))
+
+        return
+
+    def test_unhashable_and_unreferenceable_adaptees(self):
+
+        factory = CachedAdapterFactory(factory=lambda adaptee: [adaptee])
+
+        adaptee = []
+        adapter = factory(adaptee)
+        self.assertIs(factory(adaptee), adapter)
+        self.assertIsNot(factory([]), adapter)
+
+        self.assertIs(factory(1), factory(1))
+        self.assertEqual(factory.hits, 2)
+
+        # Equal adaptees are still adapted separately.
+        adapters = [factory(adaptee) for adaptee in (1, True, 1.0)]
+        self.assertEqual([adapter[0] for adapter in adapters], [1, True, 1.0])
+        self.assertEqual(
+            [type(adapter[0]) for adapter in adapters], [int, bool, float]
+        )
+
+        return
+
+    def test_unhashable_adaptees_released(self):
+
+        class Unhashable(object):
+            __hash__ = None
+
+        factory = CachedAdapterFactory(factory=lambda adaptee: object())
+
+        adaptee = Unhashable()
+        adapter = factory(adaptee)
+        self.assertIs(factory(adaptee), adapter)
+
+        # The cache does not keep adaptees that support weak references
+        # alive.
+        del adaptee, adapter
+        self.assertTrue(factory.is_empty)
+
+        return
+
+    def test_expired_adapters_purged(self):
+
+        ex = self.examples
+
+        factory = CachedAdapterFactory(factory=ex.EditorToIPrintable, ttl=0)
+
+        editors = [ex.Editor() for _ in range(3)]
+        for editor in editors:
+            factory(editor)
+
+        # Each adapter expires before the next one is cached.
+        self.assertEqual(len(factory._adapter_cache), 1)
+        self.assertEqual(factory.evictions, 2)
+
+        return
+
 if __name__ == '__main__':
     unittest.main()
 
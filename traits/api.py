@@ -28,7 +28,8 @@ from .trait_base import Uninitialized, Undefined, Missing, Self, python_version
 from .trait_errors import TraitError, TraitNotificationError, DelegationError
 
 from .trait_notifiers import (push_exception_handler, pop_exception_handler,
-        TraitChangeNotifyWrapper)
+        TraitChangeNotifyWrapper, set_async_event_loop,
+        wait_for_async_notifications)
 
 from .category import Category
 
@@ -65,10 +66,10 @@ from .trait_types import (BaseInt, BaseLong, BaseFloat, BaseComplex, BaseStr,
 from .trait_types import UUID, ValidatedTuple
 
 from .has_traits import (HasTraits, HasStrictTraits, HasPrivateTraits,
-        Interface, SingletonHasTraits, SingletonHasStrictTraits,
-        SingletonHasPrivateTraits, MetaHasTraits, Vetoable, VetoableEvent,
-        implements, traits_super, on_trait_change, cached_property,
-        property_depends_on, provides, isinterface)
+        HasCompactTraits, Interface, SingletonHasTraits,
+        SingletonHasStrictTraits, SingletonHasPrivateTraits, MetaHasTraits,
+        Vetoable, VetoableEvent, implements, traits_super, on_trait_change,
+        cached_property, property_depends_on, provides, isinterface)
 
 try:
     from .has_traits import ABCHasTraits, ABCHasStrictTraits, ABCMetaHasTraits
@@ -79,8 +80,8 @@ from .trait_handlers import (BaseTraitHandler, TraitType, TraitHandler,
         TraitRange, TraitString, TraitCoerceType, TraitCastType, TraitInstance,
         ThisClass, TraitClass, TraitFunction, TraitEnum, TraitPrefixList,
         TraitMap, TraitPrefixMap, TraitCompound, TraitList, TraitListObject,
-        TraitListEvent, TraitSetObject, TraitSetEvent, TraitDict,
-        TraitDictObject, TraitDictEvent, TraitTuple, NO_COMPARE,
+        TraitListEvent, TraitNumericListObject, TraitSetObject, TraitSetEvent,
+        TraitDict, TraitDictObject, TraitDictEvent, TraitTuple, NO_COMPARE,
         OBJECT_IDENTITY_COMPARE, RICH_COMPARE)
 
 from .trait_value import (BaseTraitValue, TraitValue, SyncValue,
@@ -91,7 +92,8 @@ from .adaptation.adaptation_error import AdaptationError
 from .adaptation.adaptation_manager import adapt, register_factory, \
      register_provides
 
-from .trait_numeric import Array, ArrayOrNone, CArray
+from .trait_numeric import (Array, ArrayOrNone, CArray, MemmapArray,
+    NumericList, TraitArrayEvent)
 
 try:
     from . import has_traits as has_traits
@@ -35,6 +35,8 @@ static PyObject * listener_traits;     /* == "__listener_traits__" */
 static PyObject * editor_property;     /* == "editor" */
 static PyObject * class_prefix;        /* == "__prefix__" */
 static PyObject * trait_added;         /* == "trait_added" */
+static PyObject * deferred_notify;     /* == "_trait_deferred_notify" */
+static PyObject * trait_slots;         /* == "__trait_slots__" */
 static PyObject * empty_tuple;         /* == () */
 static PyObject * empty_dict;          /* == {} */
 static PyObject * Undefined;           /* Global 'Undefined' value */
@@ -47,6 +49,7 @@ static PyObject * TraitDictObject;     /* TraitDictObject class */
 static PyObject * TraitValue;          /* TraitValue class */
 static PyObject * adapt;               /* PyProtocols 'adapt' function */
 static PyObject * validate_implements; /* 'validate implementation' function */
+static long adaptation_version = 0;    /* Version of the adaptation registry */
 static PyObject * is_callable;         /* Marker for 'callable' value */
 static PyObject * _HasTraits_monitors; /* Object creation monitors. */
 static PyObject * _trait_notification_handler; /* User supplied trait */
@@ -145,6 +148,14 @@ PyDoc_STRVAR( ctraits__doc__,
    a trait: */
 #define HASTRAITS_VETO_NOTIFY 0x00000004
 
+/* Queue notifications on the object (via '_trait_deferred_notify') instead of
+   sending them immediately: */
+#define HASTRAITS_DEFER_NOTIFY 0x00000008
+
+/* Traits which differ from the class traits have been added to the object's
+   instance trait dictionary (by 'add_trait'): */
+#define HASTRAITS_INSTANCE_TRAITS 0x00000010
+
 /*-----------------------------------------------------------------------------
 |  'CHasTraits' instance definition:
 |
@@ -154,6 +165,10 @@ PyDoc_STRVAR( ctraits__doc__,
 |
 |  All 'anytrait_changed' notification handlers are stored in the instance's
 |  'notifiers' list.
+|
+|  'Compact' classes add a member slot (see '__slots__') to their instances
+|  for each statically declared trait whose value is stored in the instance
+|  itself rather than in its dictionary (see 'trait_slot').
 +----------------------------------------------------------------------------*/
 
 typedef struct {
@@ -222,6 +237,9 @@ typedef PyObject * (*delegate_attr_name_func)( a_trait_object *,
 typedef struct _trait_object {
     PyObject_HEAD                    /* Standard Python object header */
     int                flags;        /* Flag bits */
+    int                slot;         /* Offset of the object member slot
+                                        storing the value (or 0 if the value
+                                        is stored in '__dict__') */
     trait_getattr      getattr;      /* Get trait value handler */
     trait_setattr      setattr;      /* Set trait value handler */
     trait_post_setattr post_setattr; /* Optional post 'setattr' handler */
@@ -671,6 +689,25 @@ dict_getitem ( PyDictObject * dict, PyObject *key ) {
 #endif
 }
 
+/*-----------------------------------------------------------------------------
+|  Returns the address of the member slot used to store the value of a
+|  specified trait on an object (or NULL if the value is stored in the object
+|  dictionary):
++----------------------------------------------------------------------------*/
+
+static PyObject **
+trait_slot ( trait_object * trait, has_traits_object * obj ) {
+
+    int slot = trait->slot;
+
+    if ( (slot > 0) &&
+         ((slot + (Py_ssize_t) sizeof( PyObject * )) <=
+          Py_TYPE( obj )->tp_basicsize) )
+        return (PyObject **) (((char *) obj) + slot);
+
+    return NULL;
+}
+
 /*-----------------------------------------------------------------------------
 |  Gets the definition of the matching prefix based trait for a specified name:
 |
@@ -717,6 +754,7 @@ setattr_value ( trait_object      * trait,
     PyObject * trait_new, * result, * obj_dict;
     PyObject * trait_old = NULL;
     PyObject * value_old = NULL;
+    PyObject ** slot;
 
     trait_new = PyObject_CallMethod( value, "as_ctrait", "(O)", trait );
     if ( trait_new == NULL )
@@ -759,6 +797,10 @@ setattr_value ( trait_object      * trait,
         obj_dict = obj->obj_dict;
         if ( obj_dict != NULL )
             PyDict_DelItem( obj_dict, name );
+
+        slot = trait_slot( trait, obj );
+        if ( slot != NULL )
+            Py_CLEAR( *slot );
     }
 
     if ( PyDict_SetItem( (PyObject *) dict, name, trait_new ) < 0 )
@@ -844,6 +886,13 @@ has_traits_new ( PyTypeObject * type, PyObject * args, PyObject * kwds ) {
             return NULL;
         }
         Py_INCREF( obj->ctrait_dict );
+
+        /* Compact classes store their trait values in member slots, so don't
+           keep any empty instance dictionary created eagerly by the base
+           class (it is created again if it is needed): */
+        if ( (obj->obj_dict != NULL) && (PyDict_Size( obj->obj_dict ) == 0) &&
+             (_PyType_Lookup( type, trait_slots ) != NULL) )
+            Py_CLEAR( obj->obj_dict );
     }
 
     return (PyObject *) obj;
@@ -1343,6 +1392,39 @@ add_trait:
     return Py_None;
 }
 
+/*-----------------------------------------------------------------------------
+|  Returns whether setting an object's items event trait would do anything
+|  (i.e. whether the event has any notifiers), so that callers can avoid
+|  creating event objects no handler will receive:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_has_traits_items_observed ( has_traits_object * obj, PyObject * name ) {
+
+    trait_object * trait;
+    PyObject     * result = Py_True;
+
+    if ( !Py2to3_AttrNameCheck( name ) ) {
+        invalid_attribute_error( name );
+        return NULL;
+    }
+
+    if ( ((obj->itrait_dict != NULL) &&
+          ((trait = (trait_object *) dict_getitem( obj->itrait_dict, name )) !=
+            NULL)) ||
+         ((trait = (trait_object *) dict_getitem( obj->ctrait_dict, name )) !=
+            NULL) ) {
+        if ( (trait->setattr == setattr_event) &&
+             (trait->post_setattr == NULL) &&
+             !has_notifiers( trait->notifiers, obj->notifiers ) )
+            result = Py_False;
+    }
+
+    Py_INCREF( result );
+
+    return result;
+}
+
 /*-----------------------------------------------------------------------------
 |  Enables/Disables trait change notification for the object:
 +----------------------------------------------------------------------------*/
@@ -1392,6 +1474,30 @@ _has_traits_veto_notify ( has_traits_object * obj, PyObject * args ) {
     return Py_None;
 }
 
+/*-----------------------------------------------------------------------------
+|  Enables/Disables deferral of trait change notifications for the object:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_has_traits_defer_notify ( has_traits_object * obj, PyObject * args ) {
+
+    int enabled;
+
+    /* Parse arguments, which specify the new trait notification deferral
+       enabled/disabled state: */
+    if ( !PyArg_ParseTuple( args, "i", &enabled ) )
+        return NULL;
+
+    if ( enabled ) {
+        obj->flags |= HASTRAITS_DEFER_NOTIFY;
+    } else {
+        obj->flags &= (~HASTRAITS_DEFER_NOTIFY);
+    }
+
+    Py_INCREF( Py_None );
+    return Py_None;
+}
+
 /*-----------------------------------------------------------------------------
 |  This method is called at the end of a HasTraits constructor and the
 |  __setstate__ method to perform any final object initialization needed.
@@ -1427,6 +1533,30 @@ _has_traits_inited ( has_traits_object * obj, PyObject * args ) {
     return Py_False;
 }
 
+/*-----------------------------------------------------------------------------
+|  Returns (and optionally sets) whether instance-specific traits have been
+|  added to the object:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_has_traits_instance_traits_added ( has_traits_object * obj, PyObject * args ) {
+
+    int added = -1;
+
+    if ( !PyArg_ParseTuple( args, "|i", &added ) )
+        return NULL;
+
+    if ( added > 0 )
+        obj->flags |= HASTRAITS_INSTANCE_TRAITS;
+
+    if ( obj->flags & HASTRAITS_INSTANCE_TRAITS ) {
+        Py_INCREF( Py_True );
+        return Py_True;
+    }
+    Py_INCREF( Py_False );
+    return Py_False;
+}
+
 /*-----------------------------------------------------------------------------
 |  Returns the instance trait dictionary:
 +----------------------------------------------------------------------------*/
@@ -1476,6 +1606,43 @@ _has_traits_notifiers ( has_traits_object * obj, PyObject * args ) {
     return result;
 }
 
+/*-----------------------------------------------------------------------------
+|  Returns whether or not the object has an explicitly assigned (or cached
+|  default) value for a specified trait, stored either in the object's
+|  dictionary or in a member slot:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_has_traits_has_value ( has_traits_object * obj, PyObject * args ) {
+
+    PyObject * name;
+    PyObject * result;
+    PyObject * trait;
+    PyObject ** slot;
+
+    if ( !PyArg_ParseTuple( args, "O", &name ) )
+        return NULL;
+
+    result = Py_False;
+    if ( (obj->obj_dict != NULL) &&
+         (PyDict_GetItem( obj->obj_dict, name ) != NULL) ) {
+        result = Py_True;
+    } else {
+        if ( (trait = get_trait( obj, name, 0 )) == NULL )
+            return NULL;
+
+        if ( trait != Py_None ) {
+            slot = trait_slot( (trait_object *) trait, obj );
+            if ( (slot != NULL) && (*slot != NULL) )
+                result = Py_True;
+        }
+        Py_DECREF( trait );
+    }
+
+    Py_INCREF( result );
+    return result;
+}
+
 /*-----------------------------------------------------------------------------
 |  Returns the object's instance dictionary:
 +----------------------------------------------------------------------------*/
@@ -1518,12 +1685,18 @@ static PyMethodDef has_traits_methods[] = {
       PyDoc_STR( "trait_property_changed(name,old_value[,new_value])" ) },
         { "trait_items_event", (PyCFunction) _has_traits_items_event, METH_VARARGS,
       PyDoc_STR( "trait_items_event(event_trait,name,items_event)" ) },
+        { "_trait_items_observed", (PyCFunction) _has_traits_items_observed,
+      METH_O,
+      PyDoc_STR( "_trait_items_observed(name)" ) },
         { "_trait_change_notify", (PyCFunction) _has_traits_change_notify,
       METH_VARARGS,
       PyDoc_STR( "_trait_change_notify(boolean)" ) },
         { "_trait_veto_notify", (PyCFunction) _has_traits_veto_notify,
       METH_VARARGS,
       PyDoc_STR( "_trait_veto_notify(boolean)" ) },
+        { "_trait_defer_notify", (PyCFunction) _has_traits_defer_notify,
+      METH_VARARGS,
+      PyDoc_STR( "_trait_defer_notify(boolean)" ) },
         { "traits_init", (PyCFunction) _has_traits_init,
       METH_NOARGS,
       PyDoc_STR( "traits_init()" ) },
@@ -1534,8 +1707,14 @@ static PyMethodDef has_traits_methods[] = {
         { "_instance_traits", (PyCFunction) _has_traits_instance_traits,
       METH_VARARGS,
       PyDoc_STR( "_instance_traits() -> dict" ) },
+        { "_instance_traits_added",
+      (PyCFunction) _has_traits_instance_traits_added, METH_VARARGS,
+      PyDoc_STR( "_instance_traits_added([True]) -> boolean" ) },
         { "_notifiers",       (PyCFunction) _has_traits_notifiers, METH_VARARGS,
       PyDoc_STR( "_notifiers(force_create) -> list" ) },
+        { "_trait_has_value", (PyCFunction) _has_traits_has_value,
+      METH_VARARGS,
+      PyDoc_STR( "_trait_has_value(name) -> boolean" ) },
         { NULL, NULL },
 };
 
@@ -1706,12 +1885,47 @@ getattr_trait ( trait_object      * trait,
                 PyObject          * name ) {
 
     int rc;
+    PyObject ** slot;
     PyListObject * tnotifiers;
     PyListObject * onotifiers;
     PyObject * result;
     PyObject * nname;
     PyObject * dict = obj->obj_dict;
 
+    /* Handle a trait whose value is stored in one of the object's slots: */
+    slot = trait_slot( trait, obj );
+    if ( slot != NULL ) {
+        result = *slot;
+        if ( result != NULL ) {
+            Py_INCREF( result );
+            return result;
+        }
+
+        if ( (result = default_value_for( trait, obj, name )) == NULL )
+            return NULL;
+
+        *slot = result;
+        Py_INCREF( result );
+
+        rc = 0;
+        if ( (trait->post_setattr != NULL) &&
+             ((trait->flags & TRAIT_IS_MAPPED) == 0) )
+            rc = trait->post_setattr( trait, obj, name, result );
+
+        if ( rc == 0 ) {
+            tnotifiers = trait->notifiers;
+            onotifiers = obj->notifiers;
+            if ( has_notifiers( tnotifiers, onotifiers ) )
+                rc = call_notifiers( tnotifiers, onotifiers, obj, name,
+                                     Uninitialized, result );
+        }
+        if ( rc == 0 )
+            return result;
+
+        Py_DECREF( result );
+        return NULL;
+    }
+
     if ( dict == NULL ) {
         dict = PyDict_New();
         if ( dict == NULL )
@@ -2081,6 +2295,19 @@ call_notifiers ( PyListObject      * tnotifiers,
     if ( (obj->flags & HASTRAITS_NO_NOTIFY) != 0 )
        goto exit2;
 
+    // If the object is in a batch update, hand the change over to the
+    // object's deferred notification queue instead of notifying now.
+    if ( (obj->flags & HASTRAITS_DEFER_NOTIFY) != 0 ) {
+        result = PyObject_CallMethodObjArgs( (PyObject *) obj,
+                     deferred_notify, name, old_value, new_value, NULL );
+        if ( result == NULL ) {
+            rc = -1;
+        } else {
+            Py_DECREF( result );
+        }
+        goto exit2;
+    }
+
     if ( _trait_notification_handler != NULL ) {
         user_args = PyTuple_New( 2 );
         if ( user_args == NULL ) {
@@ -2233,6 +2460,7 @@ setattr_trait ( trait_object      * traito,
                 PyObject          * value ) {
 
     int rc;
+    PyObject ** slot;
     int changed;
     int do_notifiers;
     trait_post_setattr post_setattr;
@@ -2248,26 +2476,37 @@ setattr_trait ( trait_object      * traito,
 
 
     changed = (traitd->flags & TRAIT_NO_VALUE_TEST);
+    slot    = trait_slot( traito, obj );
 
     if ( value == NULL ) {
-        if ( dict == NULL )
+        if ( (dict == NULL) && (slot == NULL) )
             return 0;
 
         nname = Py2to3_NormaliseAttrName(name);
         if( nname == NULL )
             return invalid_attribute_error( name );
 
-        old_value = PyDict_GetItem( dict, nname );
-        if ( old_value == NULL ) {
-            Py2to3_FinishNormaliseAttrName( name, nname );
-            return 0;
+        if ( slot != NULL ) {
+            /* The slot's reference is transferred to 'old_value': */
+            old_value = *slot;
+            *slot     = NULL;
         }
 
-        Py_INCREF( old_value );
-        if ( PyDict_DelItem( dict, nname ) < 0 ) {
-            Py_DECREF( old_value );
-            Py2to3_FinishNormaliseAttrName( name, nname );
-            return -1;
+        if ( old_value == NULL ) {
+            if ( dict != NULL )
+                old_value = PyDict_GetItem( dict, nname );
+
+            if ( old_value == NULL ) {
+                Py2to3_FinishNormaliseAttrName( name, nname );
+                return 0;
+            }
+
+            Py_INCREF( old_value );
+            if ( PyDict_DelItem( dict, nname ) < 0 ) {
+                Py_DECREF( old_value );
+                Py2to3_FinishNormaliseAttrName( name, nname );
+                return -1;
+            }
         }
 
         rc = 0;
@@ -2325,7 +2564,7 @@ setattr_trait ( trait_object      * traito,
         Py_INCREF( value );
     }
 
-    if ( dict == NULL ) {
+    if ( (dict == NULL) && (slot == NULL) ) {
         obj->obj_dict = dict = PyDict_New();
         if ( dict == NULL ) {
             Py_DECREF( value );
@@ -2333,8 +2572,6 @@ setattr_trait ( trait_object      * traito,
         }
     }
 
-
-
     nname = Py2to3_NormaliseAttrName(name);
     if( nname == NULL ){
         Py_DECREF( value );
@@ -2351,7 +2588,7 @@ setattr_trait ( trait_object      * traito,
 
     post_setattr = traitd->post_setattr;
     if ( (post_setattr != NULL) || do_notifiers ) {
-        old_value = PyDict_GetItem( dict, nname );
+        old_value = (slot != NULL)? *slot: PyDict_GetItem( dict, nname );
         if ( old_value == NULL ) {
             if ( traitd != traito ) {
                 old_value = traito->getattr( traito, obj, nname );
@@ -2380,7 +2617,12 @@ setattr_trait ( trait_object      * traito,
         }
     }
 
-    if ( PyDict_SetItem( dict, nname, new_value ) < 0 ) {
+    if ( slot != NULL ) {
+        original_value = *slot;
+        *slot          = new_value;
+        Py_INCREF( new_value );
+        Py_XDECREF( original_value );
+    } else if ( PyDict_SetItem( dict, nname, new_value ) < 0 ) {
         if ( PyErr_ExceptionMatches( PyExc_KeyError ) )
             PyErr_SetObject( PyExc_AttributeError, nname );
         Py_XDECREF( old_value );
@@ -3541,6 +3783,62 @@ validate_trait_function ( trait_object * trait, has_traits_object * obj,
     return raise_trait_error( trait, obj, name, value );
 }
 
+/*-----------------------------------------------------------------------------
+|  Returns whether the type of a value is known to directly provide the
+|  interface of an 'adapt' check, using (and updating) the type cache at the
+|  end of the check's 'type_info' tuple, which maps each value type seen to
+|  True (the type provides the interface, so the value itself is the result of
+|  adapting it) or False (the 'adapt' function must be called). The cache is
+|  discarded whenever the version of the adaptation registry changes.
+|
+|  Returns 1 if the type provides the interface, 0 if not (or if there is no
+|  cache), or -1 if an error occurs:
++----------------------------------------------------------------------------*/
+
+static int
+adapt_type_provides ( PyObject * type_info, PyObject * value,
+                      PyObject * type ) {
+
+    PyObject * cache, * state, * version;
+    PyObject * value_type = (PyObject *) Py_TYPE( value );
+    int rc;
+
+    if ( PyTuple_GET_SIZE( type_info ) < 5 )
+        return 0;
+
+    cache   = PyTuple_GET_ITEM( type_info, 4 );
+    version = PyDict_GetItem( cache, Py_None );
+    if ( (version != NULL) &&
+         (PyLong_AsLong( version ) == adaptation_version) ) {
+        state = PyDict_GetItem( cache, value_type );
+        if ( state != NULL )
+            return (state == Py_True);
+    } else {
+        PyDict_Clear( cache );
+        version = PyLong_FromLong( adaptation_version );
+        if ( version == NULL )
+            return -1;
+
+        rc = PyDict_SetItem( cache, Py_None, version );
+        Py_DECREF( version );
+        if ( rc < 0 )
+            return -1;
+    }
+
+    rc = PyObject_IsSubclass( value_type, type );
+    if ( rc < 0 ) {
+        /* Leave any problems to the 'adapt' function: */
+        PyErr_Clear();
+        return 0;
+    }
+
+    if ( PyDict_SetItem( cache, value_type,
+                         rc? Py_True: Py_False ) < 0 )
+        return -1;
+
+    return rc;
+}
+
 /*-----------------------------------------------------------------------------
 |  Attempts to 'adapt' an object to a specified interface:
 +----------------------------------------------------------------------------*/
@@ -3571,6 +3869,18 @@ validate_trait_adapt ( trait_object * trait, has_traits_object * obj,
     }
 
     type = PyTuple_GET_ITEM( type_info, 1 );
+
+    /* Values whose type directly provides the interface are valid (and are
+       their own adapters) in every mode: */
+    rc = adapt_type_provides( type_info, value, type );
+    if ( rc != 0 ) {
+        if ( rc < 0 )
+            return NULL;
+
+        Py_INCREF( value );
+        return value;
+    }
+
 #if PY_MAJOR_VERSION < 3
     mode = PyInt_AS_LONG( PyTuple_GET_ITEM( type_info, 2 ) );
 #else
@@ -3891,6 +4201,12 @@ validate_trait_complex ( trait_object * trait, has_traits_object * obj,
                     break;
                 }
                 type = PyTuple_GET_ITEM( type_info, 1 );
+                rc   = adapt_type_provides( type_info, value, type );
+                if ( rc != 0 ) {
+                    if ( rc < 0 )
+                        return NULL;
+                    goto done;
+                }
 #if PY_MAJOR_VERSION < 3
                 mode = PyInt_AS_LONG( PyTuple_GET_ITEM( type_info, 2 ) );
 #else
@@ -4189,8 +4505,12 @@ _trait_set_validate ( trait_object * trait, PyObject * args ) {
                     /* Note: We don't check the 'class' argument (item[1])
                        because some old-style code creates classes that are not
                        strictly classes or types (e.g. VTK), and yet they work
-                       correctly with the rest of the Instance code */
-                    if ( (n == 4) &&
+                       correctly with the rest of the Instance code. The
+                       optional fifth item is the dictionary used to cache
+                       the types providing the class. */
+                    if ( ((n == 4) ||
+                          ((n == 5) &&
+                           PyDict_Check( PyTuple_GET_ITEM( validate, 4 ) ))) &&
                          Py2to3_PyNum_Check(  PyTuple_GET_ITEM( validate, 2 ) )  &&
                          PyBool_Check( PyTuple_GET_ITEM( validate, 3 ) ) ) {
                         goto done;
@@ -4256,6 +4576,58 @@ _trait_validate ( trait_object * trait, PyObject * args ) {
     return trait->validate( trait, (has_traits_object *)object, name, value );
 }
 
+/*-----------------------------------------------------------------------------
+|  Validates a sequence of values that are to be assigned as the items of a
+|  container trait, returning a new list of the validated values:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_trait_validate_items ( trait_object * trait, PyObject * args ) {
+
+    PyObject * object, * name, * values, * seq, * result, * item, * value;
+    Py_ssize_t i, n;
+    trait_validate validate;
+
+    if ( !PyArg_ParseTuple( args, "OOO", &object, &name, &values ) )
+        return NULL;
+
+    /* Validate a tuple of the values (which is the values themselves when
+       they are a tuple), since a Python validator could modify a mutable
+       sequence while it is being iterated over: */
+    seq = PySequence_Tuple( values );
+    if ( seq == NULL )
+        return NULL;
+
+    n      = PyTuple_GET_SIZE( seq );
+    result = PyList_New( n );
+    if ( result == NULL ) {
+        Py_DECREF( seq );
+        return NULL;
+    }
+
+    validate = trait->validate;
+    for ( i = 0; i < n; i++ ) {
+        item = PyTuple_GET_ITEM( seq, i );
+        if ( validate == NULL ) {
+            Py_INCREF( item );
+            value = item;
+        } else {
+            value = validate( trait, (has_traits_object *) object, name,
+                              item );
+            if ( value == NULL ) {
+                Py_DECREF( result );
+                Py_DECREF( seq );
+                return NULL;
+            }
+        }
+        PyList_SET_ITEM( result, i, value );
+    }
+
+    Py_DECREF( seq );
+
+    return result;
+}
+
 /*-----------------------------------------------------------------------------
 |  Calls a Python-based trait post_setattr handler:
 +----------------------------------------------------------------------------*/
@@ -4592,6 +4964,80 @@ _trait_is_mapped ( trait_object * trait, PyObject * args ) {
     return (PyObject *) trait;
 }
 
+/*-----------------------------------------------------------------------------
+|  Returns whether or not a CTrait instance can store its value in an instance
+|  member slot (i.e. whether it uses the simple trait get/set handlers):
++----------------------------------------------------------------------------*/
+
+static int
+trait_can_use_slot ( trait_object * trait ) {
+
+    return ((trait->getattr == getattr_trait) &&
+            (trait->setattr == setattr_trait));
+}
+
+static PyObject *
+_trait_can_use_value_slot ( trait_object * trait, PyObject * args ) {
+
+    PyObject * result;
+
+    if ( !PyArg_ParseTuple( args, "" ) )
+        return NULL;
+
+    result = trait_can_use_slot( trait )? Py_True: Py_False;
+    Py_INCREF( result );
+
+    return result;
+}
+
+/*-----------------------------------------------------------------------------
+|  Gets or sets the offset of the instance member slot used to store the value
+|  of a CTrait instance (-1 means the value is stored in the object's
+|  dictionary). The slot is set from the member descriptor of a 'CHasTraits'
+|  subclass '__slots__' entry, or copied from another CTrait. Only simple
+|  (non-delegated, non-property, non-event) traits can use a slot, so
+|  assigning a slot to any other kind of trait (or assigning None) resets it
+|  to -1:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_trait_value_slot ( trait_object * trait, PyObject * args ) {
+
+    PyObject * source = NULL;
+    PyMemberDef * member;
+    int slot;
+
+    if ( !PyArg_ParseTuple( args, "|O", &source ) )
+        return NULL;
+
+    if ( source != NULL ) {
+        if ( source == Py_None ) {
+            slot = 0;
+        } else if ( PyTrait_CheckExact( source ) ) {
+            slot = ((trait_object *) source)->slot;
+        } else if ( PyObject_TypeCheck( source, &PyMemberDescr_Type ) &&
+                    PyType_IsSubtype( ((PyDescrObject *) source)->d_type,
+                                      &has_traits_type ) ) {
+            member = ((PyMemberDescrObject *) source)->d_member;
+            if ( (member->type != T_OBJECT_EX) ||
+                 ((member->flags & READONLY) != 0) ) {
+                PyErr_SetString( TraitError,
+                                 "The member is not a writable object slot." );
+                return NULL;
+            }
+            slot = (int) member->offset;
+        } else {
+            PyErr_SetString( TraitError, "The value slot must be a CTrait, "
+                             "a CHasTraits member descriptor or None." );
+            return NULL;
+        }
+
+        trait->slot = trait_can_use_slot( trait )? slot: 0;
+    }
+
+    return Py2to3_PyNum_FromLong( (trait->slot > 0)? trait->slot: -1 );
+}
+
 /*-----------------------------------------------------------------------------
 |  Sets the 'property' value fields of a CTrait instance:
 +----------------------------------------------------------------------------*/
@@ -4679,6 +5125,7 @@ trait_clone ( trait_object * trait, trait_object * source ) {
     trait->delegate_prefix    = source->delegate_prefix;
     trait->delegate_attr_name = source->delegate_attr_name;
     trait->handler            = source->handler;
+    trait->slot               = source->slot;
     Py_XINCREF( trait->py_post_setattr );
     Py_XINCREF( trait->py_validate );
     Py_XINCREF( trait->delegate_name );
@@ -4936,6 +5383,8 @@ static PyMethodDef trait_methods[] = {
                 PyDoc_STR( "get_validate()" ) },
         { "validate",      (PyCFunction) _trait_validate,      METH_VARARGS,
                 PyDoc_STR( "validate(object,name,value)" ) },
+        { "validate_items", (PyCFunction) _trait_validate_items, METH_VARARGS,
+                PyDoc_STR( "validate_items(object,name,values)" ) },
         { "delegate",      (PyCFunction) _trait_delegate,      METH_VARARGS,
                 PyDoc_STR( "delegate(delegate_name,prefix,prefix_type,modify_delegate)" ) },
         { "rich_comparison",  (PyCFunction) _trait_rich_comparison,  METH_VARARGS,
@@ -4952,6 +5401,11 @@ static PyMethodDef trait_methods[] = {
         { "post_setattr_original_value",
         (PyCFunction) _trait_post_setattr_original_value,  METH_VARARGS,
                 PyDoc_STR( "post_setattr_original_value(original_value_boolean)" ) },
+        { "value_slot", (PyCFunction) _trait_value_slot,  METH_VARARGS,
+      PyDoc_STR( "value_slot([slot]) -> offset" ) },
+        { "can_use_value_slot", (PyCFunction) _trait_can_use_value_slot,
+      METH_VARARGS,
+      PyDoc_STR( "can_use_value_slot() -> boolean" ) },
         { "is_mapped", (PyCFunction) _trait_is_mapped,  METH_VARARGS,
                 PyDoc_STR( "is_mapped(is_mapped_boolean)" ) },
         { "property",      (PyCFunction) _trait_property,      METH_VARARGS,
@@ -5108,6 +5562,17 @@ _ctraits_adapt ( PyObject * self, PyObject * args ) {
     return Py_None;
 }
 
+/*-----------------------------------------------------------------------------
+|  Records a change to the adaptation registry, invalidating the type caches
+|  of all 'adapt' checks, and returns the new registry version:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_ctraits_adaptation_changed ( PyObject * self, PyObject * args ) {
+
+    return PyLong_FromLong( ++adaptation_version );
+}
+
 /*-----------------------------------------------------------------------------
 |  Sets the global 'validate_implements' reference to the Python level
 |  function:
@@ -5186,6 +5651,8 @@ static PyMethodDef ctraits_methods[] = {
                 PyDoc_STR( "_adapt(PyProtocols._speedups.adapt)" ) },
         { "_validate_implements", (PyCFunction) _ctraits_validate_implements,
         METH_VARARGS, PyDoc_STR( "_validate_implements(validate_implements)" )},
+        { "_adaptation_changed", (PyCFunction) _ctraits_adaptation_changed,
+        METH_NOARGS, PyDoc_STR( "_adaptation_changed()" ) },
         { "_ctrait",       (PyCFunction) _ctraits_ctrait,       METH_VARARGS,
                 PyDoc_STR( "_ctrait(CTrait_class)" ) },
         { "_trait_notification_handler",
@@ -5262,6 +5729,13 @@ Py2to3_MOD_INIT(ctraits) {
     /* Predefine a Python string == "trait_added": */
     trait_added = Py2to3_SimpleString_FromString( "trait_added" );
 
+    /* Predefine a Python string == "_trait_deferred_notify": */
+    deferred_notify = Py2to3_SimpleString_FromString(
+                          "_trait_deferred_notify" );
+
+    /* Predefine a Python string == "__trait_slots__": */
+    trait_slots = Py2to3_SimpleString_FromString( "__trait_slots__" );
+
     /* Create an empty tuple: */
     empty_tuple = PyTuple_New( 0 );
 
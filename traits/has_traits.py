@@ -31,6 +31,7 @@ import copy as copy_module
 import weakref
 import re
 import sys
+import zlib
 
 from types import FunctionType, MethodType
 
@@ -45,12 +46,15 @@ from .traits import (CTrait, ForwardProperty, Property, SpecialNames, Trait,
 
 from .trait_types import Any, Bool, Disallow, Enum, Event, Python, This
 
-from .trait_notifiers import (ExtendedTraitChangeNotifyWrapper,
-    FastUITraitChangeNotifyWrapper, NewTraitChangeNotifyWrapper,
-    StaticAnyTraitChangeNotifyWrapper, StaticTraitChangeNotifyWrapper,
-    TraitChangeNotifyWrapper)
+from .trait_notifiers import (AsyncTraitChangeNotifyWrapper,
+    ExtendedTraitChangeNotifyWrapper, FastUITraitChangeNotifyWrapper,
+    NewTraitChangeNotifyWrapper, StaticAnyTraitChangeNotifyWrapper,
+    StaticTraitChangeNotifyWrapper, TraitChangeNotifyWrapper)
 
-from .trait_handlers import TraitType
+from .trait_handlers import (TraitType, TraitListObject, TraitSetObject,
+    TraitDictObject, TraitNumericListObject)
+
+from .trait_numeric import ArrayBuffer, PickleBuffer
 
 from .trait_base import (Missing, SequenceTypes, TraitsCache, Undefined,
     add_article, is_none, not_event, not_false)
@@ -115,12 +119,36 @@ BaseTraits      = '__base_traits__'
 ClassTraits     = '__class_traits__'
 PrefixTraits    = '__prefix_traits__'
 ListenerTraits  = '__listener_traits__'
+ListenerPlan    = '__listener_plan__'
+MetadataIndex   = '__metadata_index__'
+PicklePlan      = '__pickle_plan__'
+CopyPlans       = '__copy_plans__'
+
+# State dictionary entry used to record the trait schema of the class of a
+# pickled object (only saved for classes allowing trusted restores):
+TraitSchema = '__trait_schema__'
 ViewTraits      = '__view_traits__'
 InstanceTraits  = '__instance_traits__'
+CompactTraits   = '__compact_traits__'
+TraitSlots      = '__trait_slots__'
+
+# Object dictionary entry used to queue the deferred notifications of an object
+# that is being batch updated:
+BatchNotifications = '__batch_notifications__'
 
 # The default Traits View name
 DefaultTraitsView = 'traits_view'
 
+# The maximum number of distinct metadata queries indexed per class:
+MaxMetadataQueries = 100
+
+# The maximum number of copy plans cached per class:
+MaxCopyPlans = 100
+
+# The types of the objects used as the values of container traits:
+TraitContainerTypes = ( TraitListObject, TraitSetObject, TraitDictObject,
+                        TraitNumericListObject )
+
 # Trait types which cannot have default values
 CantHaveDefaultValue = ( 'event', 'delegate', 'constant' )
 
@@ -154,6 +182,24 @@ def _clone_trait ( clone, metadata = None ):
 
     return trait
 
+#-------------------------------------------------------------------------------
+#  Creates a clone of a specified trait which uses a specified value slot:
+#-------------------------------------------------------------------------------
+
+def _clone_slot_trait ( clone, slot ):
+    """ Creates a clone of a specified trait (including its notifiers) which
+        stores its value in the specified value slot (a member descriptor, or
+        None for the object dictionary).
+    """
+    trait = _clone_trait( clone )
+    trait.value_slot( slot )
+
+    notifiers = clone._notifiers( 0 )
+    if notifiers is not None:
+        trait._notifiers( 1 ).extend( notifiers )
+
+    return trait
+
 #-------------------------------------------------------------------------------
 #  Gets the definition of a specified method (if any):
 #-------------------------------------------------------------------------------
@@ -318,6 +364,195 @@ class _SimpleTest:
     def __init__ ( self, value ): self.value = value
     def __call__ ( self, test  ): return test == self.value
 
+#-------------------------------------------------------------------------------
+#  Returns whether a pickled trait value can be restored without validation:
+#-------------------------------------------------------------------------------
+
+def _is_trusted_trait ( trait ):
+    """ Returns whether a previously validated value of the specified class
+        trait can be restored by storing it directly in the object dictionary
+        (i.e. the trait is a simple trait whose value is stored in the object
+        dictionary and which does not need any post-assignment processing).
+
+        Container values (lists, sets and dictionaries) of such traits are
+        still assigned normally, so that they are linked to their new owner,
+        but their items are not validated again.
+    """
+    return ((trait is not None) and (trait.type == 'trait') and
+            (trait.post_setattr is None) and (trait.value_slot() < 0))
+
+#-------------------------------------------------------------------------------
+#  Returns stable signatures of fast validator parameters:
+#-------------------------------------------------------------------------------
+
+# Matches the memory address in the default repr of an object:
+_object_address = re.compile( r' at 0x[0-9a-fA-F]+' )
+
+def _parameter_signature ( value ):
+    """ Returns a string describing a fast validator parameter which does not
+        depend on object identity: scalars by value, classes and callables by
+        qualified name and any other objects by the name of their class.
+    """
+    if (value is None) or isinstance( value, ( bool, int, long, float,
+                                               complex, basestring ) ):
+        return repr( value )
+
+    if isinstance( value, ( tuple, list ) ):
+        return '(%s)' % ','.join( [ _parameter_signature( item )
+                                    for item in value ] )
+
+    if isinstance( value, dict ):
+        return '{%s}' % ','.join( sorted( [
+            '%s:%s' % ( _parameter_signature( key ),
+                        _parameter_signature( item ) )
+            for key, item in value.items() ] ) )
+
+    if not hasattr( value, '__name__' ):
+        value = value.__class__
+
+    return '%s.%s' % ( getattr( value, '__module__', '' ), value.__name__ )
+
+def _fast_validate_signature ( fast_validate ):
+    """ Returns a string describing a handler's *fast_validate* tuple, leaving
+        out the type cache an adapting validator keeps as its last item.
+    """
+    if not isinstance( fast_validate, tuple ):
+        return _parameter_signature( fast_validate )
+
+    kind = fast_validate[0]
+    if kind == 19:
+        fast_validate = fast_validate[:-1]
+    elif kind == 7:
+        return '(7,(%s))' % ','.join( [ _fast_validate_signature( item )
+                                        for item in fast_validate[1] ] )
+
+    return _parameter_signature( fast_validate )
+
+#-------------------------------------------------------------------------------
+#  Returns the signature of a trait handler's validation parameters:
+#-------------------------------------------------------------------------------
+
+def _handler_signature ( handler, name ):
+    """ Returns a string describing the values accepted by the *name* trait's
+        handler, which changes whenever the handler's validation parameters
+        (such as the bounds of a Range or the values of an Enum) do. Returns
+        None if the accepted values depend on the object (e.g. a Range whose
+        bounds are other traits).
+    """
+    if handler is None:
+        return 'None'
+
+    try:
+        info = handler.full_info( None, name, Undefined )
+    except Exception:
+        return None
+
+    return '%s:%s:%s' % ( handler.__class__.__name__,
+                          _object_address.sub( '', info ),
+                          _fast_validate_signature(
+                              getattr( handler, 'fast_validate', None ) ) )
+
+#-------------------------------------------------------------------------------
+#  Returns the copy plans cached for a class:
+#-------------------------------------------------------------------------------
+
+def _copy_plans_for ( klass ):
+    """ Returns the dictionary of copy plans cached for a HasTraits class,
+        creating it if necessary.
+    """
+    plans = klass.__dict__.get( CopyPlans )
+    if plans is None:
+        plans = {}
+        setattr( klass, CopyPlans, plans )
+
+    return plans
+
+#-------------------------------------------------------------------------------
+#  Returns the subset of a traits dictionary which matches a set of metadata:
+#-------------------------------------------------------------------------------
+
+def _traits_matching ( traits, metadata ):
+    """ Returns a dictionary containing the subset of the *traits* dictionary
+        whose trait definitions match all of the *metadata* criteria.
+    """
+    tests = []
+    for meta_name, meta_eval in metadata.items():
+        if type( meta_eval ) is not FunctionType:
+            meta_eval = _SimpleTest( meta_eval )
+        tests.append( ( meta_name, meta_eval ) )
+
+    result = {}
+    for name, trait in traits.items():
+        for meta_name, meta_eval in tests:
+            if not meta_eval( getattr( trait, meta_name ) ):
+                break
+        else:
+            result[ name ] = trait
+
+    return result
+
+#-------------------------------------------------------------------------------
+#  '_BatchQueue' class:
+#-------------------------------------------------------------------------------
+
+class _BatchQueue ( object ):
+    """ The trait change notifications deferred for an object during a batch
+        update.
+    """
+
+    def __init__ ( self ):
+        # The number of active (possibly nested) batch updates for the object:
+        self.depth = 0
+
+        # The list of [ name, old, new ] changes, in first change order:
+        self.changes = []
+
+        # Mapping from trait name to its entry in 'changes':
+        self.index = {}
+
+    def add ( self, name, old, new ):
+        """ Queues a change, coalescing it with any previous change to the
+            same trait.
+        """
+        # Events have no old value and are never coalesced:
+        if old is Undefined:
+            self.changes.append( [ name, old, new ] )
+            return
+
+        change = self.index.get( name )
+        if change is None:
+            self.index[ name ] = change = [ name, old, new ]
+            self.changes.append( change )
+        else:
+            change[2] = new
+
+#-------------------------------------------------------------------------------
+#  '_BatchUpdate' class:
+#-------------------------------------------------------------------------------
+
+class _BatchUpdate ( object ):
+    """ Context manager which defers the trait change notifications of a set
+        of objects until the end of the 'with' block.
+    """
+
+    def __init__ ( self, objects ):
+        self.objects = objects
+
+    def __enter__ ( self ):
+        for object in self.objects:
+            object._begin_batch_update()
+
+        return self
+
+    def __exit__ ( self, exc_type, exc_value, traceback ):
+        # Stop deferring notifications on all of the objects before sending
+        # any of them, so that changes made by the handlers are sent normally:
+        pending = [ ( object, object._end_batch_update() )
+                    for object in self.objects ]
+        for object, changes in pending:
+            if changes is not None:
+                object._flush_batch_update( changes )
+
 #-------------------------------------------------------------------------------
 #  Returns either the original value or a valid CTrait if the value can be
 #  converted to a CTrait:
@@ -427,6 +662,7 @@ class MetaHasTraits ( type ):
 
         # Finish building the class using the updated class dictionary:
         klass = type.__new__( cls, class_name, bases, class_dict )
+        mhto.bind_slots( klass )
 
         # Call all listeners that registered for this specific class:
         name = '%s.%s' % ( klass.__module__, klass.__name__ )
@@ -686,7 +922,8 @@ class MetaHasTraitsObject ( object ):
         # Make one final pass over the class traits dictionary, making sure
         # all static trait notification handlers are attached to a 'cloned'
         # copy of the original trait:
-        cloned = set()
+        cloned           = set()
+        static_listeners = {}
         for name in class_traits.keys():
             trait    = class_traits[ name ]
             handlers = [ anytrait,
@@ -717,6 +954,15 @@ class MetaHasTraitsObject ( object ):
                     handlers.append( _get_def( class_name, class_dict, bases,
                                                '_%s_fired' % event ) )
 
+            # Collect any handler the trait defines for changes to another
+            # trait of the class (e.g. the path of a 'MemmapArray'):
+            static_listener = trait.static_listener
+            if static_listener is not None:
+                listened, handler = static_listener
+                listener_handlers = static_listeners.setdefault( listened, [] )
+                if handler not in listener_handlers:
+                    listener_handlers.append( handler )
+
             handlers = [ h for h in handlers if h is not None ]
             default  = _get_def( class_name, class_dict, [],
                                  '_%s_default' % name )
@@ -751,6 +997,22 @@ class MetaHasTraitsObject ( object ):
 
                 listeners[ name ] = ( 'property', cached, depends_on )
 
+        # Attach the handlers collected above to the traits they listen to:
+        for name, handlers in static_listeners.items():
+            trait = class_traits.get( name )
+            if trait is not None:
+                if name not in cloned:
+                    cloned.add( name )
+                    class_traits[ name ] = trait = _clone_trait( trait )
+
+                _add_notifiers( trait._notifiers( 1 ), handlers )
+
+        # If the class stores its trait values in compact value slots, add a
+        # member slot for each class trait which can use one:
+        self.slots = []
+        if not is_category:
+            self.assign_slots( bases, class_dict, class_traits, prefix_traits )
+
         # Add the traits meta-data to the class:
         self.add_traits_meta_data(
             bases, class_dict, base_traits, class_traits, instance_traits,
@@ -770,8 +1032,101 @@ class MetaHasTraitsObject ( object ):
         class_dict[ InstanceTraits  ] = instance_traits
         class_dict[ PrefixTraits    ] = prefix_traits
         class_dict[ ListenerTraits  ] = listeners
+        class_dict[ ListenerPlan    ] = None
+        class_dict[ MetadataIndex   ] = None
+        class_dict[ PicklePlan      ] = None
+        class_dict[ CopyPlans       ] = None
         class_dict[ ViewTraits      ] = view_elements
 
+    #---------------------------------------------------------------------------
+    #  Returns whether or not the class stores its trait values in slots:
+    #---------------------------------------------------------------------------
+
+    def is_compact ( self, bases, class_dict ):
+        """ Returns whether or not instances of the class store their trait
+            values in compact value slots.
+        """
+        if CompactTraits in class_dict:
+            return bool( class_dict[ CompactTraits ] )
+
+        for base in bases:
+            if getattr( base, CompactTraits, False ):
+                return True
+
+        return False
+
+    #---------------------------------------------------------------------------
+    #  Adds a value slot for each class trait which can use one:
+    #---------------------------------------------------------------------------
+
+    def assign_slots ( self, bases, class_dict, class_traits, prefix_traits ):
+        """ Adds a member slot to the '__slots__' of a compact class for each
+            simple class trait which does not already have one, and records
+            the slots to be bound to their traits by **bind_slots** once the
+            class has been created.
+
+            Traits inherited from a compact base class keep the slot they
+            were already assigned. Traits of other classes (and any trait
+            whose slot belongs to an unrelated class) store their values in
+            the object dictionary.
+        """
+        compact   = self.is_compact( bases, class_dict )
+        inherited = set()
+        if compact:
+            for base in bases:
+                for klass in getattr( base, '__mro__', () ):
+                    inherited.update( klass.__dict__.get( TraitSlots, () ) )
+
+        for name, trait in prefix_traits.items():
+            if (name != '*') and isinstance( trait, CTrait ) and \
+               (trait.value_slot() >= 0):
+                prefix_traits[ name ] = _clone_slot_trait( trait, None )
+
+        slot_names = []
+        for name in sorted( class_traits.keys() ):
+            trait = class_traits[ name ]
+            slot  = trait.value_slot()
+            if slot in inherited:
+                continue
+
+            # Shadow values of mapped traits are always stored in the object
+            # dictionary:
+            if compact and (name[-1:] != '_') and trait.can_use_value_slot():
+                slot_name = '__%s_slot__' % name
+                slot_names.append( slot_name )
+                self.slots.append( ( name, slot_name ) )
+            elif slot < 0:
+                continue
+
+            class_traits[ name ] = _clone_slot_trait( trait, None )
+
+        if len( slot_names ) > 0:
+            slots = class_dict.get( '__slots__', () )
+            if isinstance( slots, basestring ):
+                slots = ( slots, )
+            class_dict[ '__slots__' ] = tuple( slots ) + tuple( slot_names )
+
+    #---------------------------------------------------------------------------
+    #  Binds the value slots added to a new class to their traits:
+    #---------------------------------------------------------------------------
+
+    def bind_slots ( self, klass ):
+        """ Binds each member slot added by **assign_slots** to its trait,
+            once the class has been created.
+        """
+        if len( self.slots ) == 0:
+            return
+
+        class_dict   = klass.__dict__
+        class_traits = class_dict[ ClassTraits ]
+        offsets      = set()
+        for name, slot_name in self.slots:
+            offset = class_traits[ name ].value_slot( class_dict[ slot_name ] )
+            if offset >= 0:
+                offsets.add( offset )
+
+        setattr( klass, TraitSlots, frozenset( offsets ) )
+
     #---------------------------------------------------------------------------
     #  Migrates an existing property to the class being defined (allowing for
     #  method overrides):
@@ -1031,9 +1386,16 @@ class HasTraits ( CHasTraits ):
         'extended': ExtendedTraitChangeNotifyWrapper,
         'new':      NewTraitChangeNotifyWrapper,
         'fast_ui':  FastUITraitChangeNotifyWrapper,
-        'ui':       FastUITraitChangeNotifyWrapper
+        'ui':       FastUITraitChangeNotifyWrapper,
+        'async':    AsyncTraitChangeNotifyWrapper
     }
 
+    #: Can pickled objects be restored without re-validating the values of
+    #: their simple traits? If True, values saved by an instance of the same
+    #: class (with the same trait definitions) are stored directly in the
+    #: restored object without validation or change notifications:
+    __trusted_restore__ = False
+
     #-- Trait Definitions ------------------------------------------------------
 
     #: An event fired when a new trait is dynamically added to the object
@@ -1137,6 +1499,9 @@ class HasTraits ( CHasTraits ):
         class_dict    = cls.__dict__
         prefix_traits = class_dict[ PrefixTraits ]
 
+        # Force the class's copy plans to be rebuilt:
+        setattr( cls, CopyPlans, None )
+
         # See if the trait is a 'prefix' trait:
         if name[-1:] == '_':
             name = name[:-1]
@@ -1174,6 +1539,8 @@ class HasTraits ( CHasTraits ):
         # Make the new trait inheritable (if allowed):
         if trait.is_base is not False:
             class_dict[ BaseTraits ][ name ] = trait
+            setattr( cls, MetadataIndex, None )
+            setattr( cls, PicklePlan,    None )
 
         # See if there are any static notifiers defined:
         handlers = [ _get_method( cls, '_%s_changed' % name ),
@@ -1193,6 +1560,11 @@ class HasTraits ( CHasTraits ):
             trait = _clone_trait( trait )
             _add_notifiers( trait._notifiers( 1 ), handlers )
 
+        # Existing instances have no room for any new value slots, so make sure
+        # the trait value is stored in the object dictionary:
+        if trait.value_slot() >= 0:
+            trait = _clone_slot_trait( trait, None )
+
         # Finally, add the new trait to the class trait dictionary:
         class_traits[ name ] = trait
 
@@ -1271,6 +1643,13 @@ class HasTraits ( CHasTraits ):
             for name, value in listeners.items():
                 subclass_traits.setdefault( name, value )
 
+            # Force the subclass's cached plans and metadata index to be
+            # rebuilt:
+            setattr( subclass, ListenerPlan,  None )
+            setattr( subclass, MetadataIndex, None )
+            setattr( subclass, PicklePlan,    None )
+            setattr( subclass, CopyPlans,     None )
+
         # Copy all our new view elements into the base class's ViewElements:
         if view_elements is not None:
             content = view_elements.content
@@ -1376,16 +1755,27 @@ class HasTraits ( CHasTraits ):
                         del state[key]
                 return state
         """
+        # Get the names of the class traits to persist from the class's
+        # pickling plan, overlaid with the names of any instance-defined
+        # traits with different metadata:
+        persisted, delegates, trusted, schema = self._trait_pickle_plan()
+        traits = self._instance_defined_traits( True )
+        if len( traits ) > 0:
+            persisted = set( persisted ).difference( traits ).union(
+                _traits_matching( traits, { 'transient': is_none } ) )
+            delegates = set( delegates ).difference( traits ).union(
+                _traits_matching( traits, { 'type':      'delegate',
+                                            'transient': False } ) )
+
         # Save all traits which do not have any 'transient' metadata:
-        result = self.trait_get( transient = is_none )
+        result = self.trait_get( list( persisted ) )
 
         # Add all delegate traits that explicitly have 'transient = False'
         # metadata:
-        dic    = self.__dict__
-        result.update( dict( [ ( name, dic[ name ] )
-                             for name in self.trait_names( type = 'delegate',
-                                                           transient = False )
-                             if name in dic ] ) )
+        dic = self.__dict__
+        for name in delegates:
+            if name in dic:
+                result[ name ] = dic[ name ]
 
         # If this object implements ISerializable, make sure that all
         # contained HasTraits objects in its persisted state also implement
@@ -1400,11 +1790,32 @@ class HasTraits ( CHasTraits ):
         # Store the traits version in the state dictionary (if possible):
         result.setdefault( '__traits_version__', TraitsVersion )
 
+        # Record the class's trait schema so that the state can be restored
+        # using the trusted restore path:
+        if schema is not None:
+            result.setdefault( TraitSchema, schema )
+
         # Return the final state dictionary:
         return result
 
     def __reduce_ex__ ( self, protocol ):
-        return ( __newobj__, ( self.__class__, ), self.__getstate__() )
+        state = self.__getstate__()
+        if ((protocol >= 5) and (PickleBuffer is not None) and
+            isinstance( state, dict )):
+            # Emit the data of any array trait values as out-of-band buffers,
+            # so that they are neither copied into the pickle stream nor
+            # copied again when restored:
+            buffers = {}
+            for name in self.trait_names( array = True ):
+                value = state.get( name )
+                if ArrayBuffer.is_buffered( value ):
+                    buffers[ name ] = ArrayBuffer( value )
+
+            if len( buffers ) > 0:
+                state = state.copy()
+                state.update( buffers )
+
+        return ( __newobj__, ( self.__class__, ), state )
 
     #---------------------------------------------------------------------------
     #  Restores the previously pickled state of an object:
@@ -1423,7 +1834,33 @@ class HasTraits ( CHasTraits ):
             self.trait_set( trait_change_notify=trait_change_notify,
                             **dict( values ) )
         else:
-            # Otherwise, apply the Traits 3.0 restore logic:
+            # Otherwise, apply the Traits 3.0 restore logic, storing the values
+            # of all 'trusted' traits directly if the state was saved using
+            # the same trait schema as the current class:
+            schema = pop( TraitSchema, None )
+            if schema is not None:
+                persisted, delegates, trusted, current = \
+                    self._trait_pickle_plan()
+                if schema == current:
+                    dic          = self.__dict__
+                    class_traits = self.__class_traits__
+                    for name in trusted:
+                        value = pop( name, Missing )
+                        if value is Missing:
+                            continue
+
+                        if not isinstance( value, TraitContainerTypes ):
+                            dic[ name ] = value
+                            continue
+
+                        # Reattach the trait removed when the container was
+                        # pickled, so that it is linked to this object (by
+                        # the assignment below) without validating its items
+                        # again:
+                        if getattr( value, 'trait', None ) is None:
+                            value.trait = class_traits[ name ].handler
+                        state[ name ] = value
+
             self._init_trait_listeners()
             self.trait_set( trait_change_notify = trait_change_notify, **state )
             self._post_init_trait_listeners()
@@ -1431,6 +1868,78 @@ class HasTraits ( CHasTraits ):
 
         self.traits_inited( True )
 
+    #---------------------------------------------------------------------------
+    #  Returns the class's cached pickling plan:
+    #---------------------------------------------------------------------------
+
+    def _trait_pickle_plan ( cls ):
+        """ Returns the class's pickling plan, compiling it from the class's
+            traits if necessary.
+
+            The plan is a tuple of the form: ( persisted, delegates, trusted,
+            schema ), where *persisted* lists the names of the class traits
+            with no 'transient' metadata, *delegates* the names of the
+            delegate traits with 'transient = False' metadata, and *trusted*
+            the names of the persisted traits whose saved values can be
+            restored without validation. *schema* is a signature of the
+            trusted traits' definitions (including their validation
+            parameters), or None if the class does not allow trusted
+            restores.
+        """
+        plan = cls.__dict__.get( PicklePlan )
+        if plan is None:
+            persisted = tuple( cls.class_trait_names( transient = is_none ) )
+            delegates = tuple( cls.class_trait_names( type      = 'delegate',
+                                                      transient = False ) )
+            trusted   = ()
+            schema    = None
+            if cls.__trusted_restore__:
+                class_traits = cls.__class_traits__
+                signature    = [ '%s.%s' % ( cls.__module__, cls.__name__ ) ]
+                trusted      = []
+                for name in sorted( persisted ):
+                    trait = class_traits.get( name )
+                    if not _is_trusted_trait( trait ):
+                        continue
+
+                    # Include the validation parameters of the trait (and of
+                    # the items of containers), so that values saved for a
+                    # different definition of the trait are validated again:
+                    handler = trait.handler
+                    items   = [ ( name, handler ) ]
+                    if (handler is not None) and handler.has_items:
+                        for item in ( 'item_trait', 'key_trait',
+                                      'value_trait' ):
+                            item_trait = getattr( handler, item, None )
+                            if item_trait is not None:
+                                items.append( ( '  ' + item,
+                                                item_trait.handler ) )
+
+                    signatures = [ _handler_signature( item_handler, name )
+                                   for item, item_handler in items ]
+
+                    # Traits whose valid values depend on the object are
+                    # always validated:
+                    if None in signatures:
+                        continue
+
+                    trusted.append( name )
+                    signature.extend( [ '%s:%s' % ( item[0], item_signature )
+                                        for item, item_signature in
+                                        zip( items, signatures ) ] )
+
+                trusted = tuple( trusted )
+                schema = '%08x' % (zlib.crc32(
+                             '\n'.join( signature ).encode( 'utf-8' ) ) &
+                                   0xffffffff)
+
+            plan = ( persisted, delegates, trusted, schema )
+            setattr( cls, PicklePlan, plan )
+
+        return plan
+
+    _trait_pickle_plan = classmethod( _trait_pickle_plan )
+
     #---------------------------------------------------------------------------
     #  Shortcut for retrieving the value of a list of traits:
     #---------------------------------------------------------------------------
@@ -1573,6 +2082,113 @@ class HasTraits ( CHasTraits ):
         """
         return self.trait_set( trait_change_notify = False, **traits )
 
+    #---------------------------------------------------------------------------
+    #  Defers and coalesces trait change notifications:
+    #---------------------------------------------------------------------------
+
+    def batch_update ( self ):
+        """ Returns a context manager which defers the object's trait change
+        notifications until the end of a 'with' block.
+
+        Returns
+        -------
+        context : context manager
+            The batch update context.
+
+        Description
+        -----------
+        Values assigned inside the block are validated and stored
+        immediately, but the resulting notifications are queued. On exit, each
+        changed trait generates a single notification whose old value is the
+        value before the first change and whose new value is the value after
+        the last change. Traits whose final value equals their original value
+        generate no notification. Events are not coalesced, and are sent in
+        the order they were fired. For example::
+
+            with person.batch_update():
+                person.name = 'Bill'
+                person.age  = 27
+                person.age  = 28
+
+        notifies the handlers of *name* once, and the handlers of *age* once
+        (with an old value of the original age and a new value of 28).
+
+        Batch updates may be nested, in which case notifications are sent when
+        the outermost block exits.
+        """
+        return _BatchUpdate( [ self ] )
+
+    def batch_update_all ( cls, objects ):
+        """ Returns a context manager which defers the trait change
+        notifications of several objects until the end of a 'with' block.
+
+        Parameters
+        ----------
+        objects : iterable of HasTraits
+            The objects to batch update.
+
+        Returns
+        -------
+        context : context manager
+            The batch update context.
+
+        Description
+        -----------
+        This is equivalent to calling batch_update() on each of the objects,
+        except that deferral ends on all of the objects before any queued
+        notifications are sent. See batch_update() for details.
+        """
+        return _BatchUpdate( list( objects ) )
+
+    batch_update_all = classmethod( batch_update_all )
+
+    def _begin_batch_update ( self ):
+        """ Starts (or nests) a batch update of the object.
+        """
+        batch = self.__dict__.get( BatchNotifications )
+        if batch is None:
+            self.__dict__[ BatchNotifications ] = batch = _BatchQueue()
+            self._trait_defer_notify( True )
+
+        batch.depth += 1
+
+    def _end_batch_update ( self ):
+        """ Ends a batch update of the object, returning the list of queued
+            changes if this ended the outermost batch update, and None
+            otherwise.
+        """
+        batch = self.__dict__[ BatchNotifications ]
+        batch.depth -= 1
+        if batch.depth > 0:
+            return None
+
+        del self.__dict__[ BatchNotifications ]
+        self._trait_defer_notify( False )
+
+        return batch.changes
+
+    def _trait_deferred_notify ( self, name, old, new ):
+        """ Queues a trait change notification during a batch update (called
+            by the C-based traits code).
+        """
+        self.__dict__[ BatchNotifications ].add( name, old, new )
+
+    def _flush_batch_update ( self, changes ):
+        """ Sends the notifications queued by a batch update.
+        """
+        for name, old, new in changes:
+            if old is not Undefined:
+                if old is new:
+                    continue
+
+                try:
+                    if old == new:
+                        continue
+                except:
+                    pass
+
+            self.trait_property_changed( name, old, new )
+
     #---------------------------------------------------------------------------
     #  Resets some or all of an object's traits to their default values:
     #---------------------------------------------------------------------------
@@ -1615,6 +2231,78 @@ class HasTraits ( CHasTraits ):
 
         return unresetable
 
+    #---------------------------------------------------------------------------
+    #  Returns a writeable value for an array trait:
+    #---------------------------------------------------------------------------
+
+    def trait_array_writeable ( self, name ):
+        """ Returns the value of an array trait attribute, ready to be modified
+        in place.
+
+        Parameters
+        ----------
+        name : string
+            Name of an Array, CArray or ArrayOrNone trait attribute.
+
+        Returns
+        -------
+        value : numpy array
+            The current value of the trait attribute.
+
+        Description
+        -----------
+        Array traits defined with ``copy_on_write=True`` share a single
+        read-only default value between all objects. If the trait attribute
+        still has that value, it is replaced (without generating a trait change
+        notification) by a private writeable copy, which is returned.
+        Otherwise the current value is returned unchanged.
+        """
+        trait = self.trait( name )
+        if (trait is None) or (not trait.array):
+            raise TraitError( "The '%s' trait of a '%s' instance is not an "
+                              "array trait." % ( name,
+                                                 self.__class__.__name__ ) )
+
+        return trait.handler.writeable_value( self, name )
+
+    #---------------------------------------------------------------------------
+    #  Updates part of the value of an array trait in place:
+    #---------------------------------------------------------------------------
+
+    def trait_array_update ( self, name, index, values ):
+        """ Assigns values to part of an array trait attribute in place, and
+        notifies the handlers of its items event.
+
+        Parameters
+        ----------
+        name : string
+            Name of an Array, CArray or ArrayOrNone trait attribute.
+        index : index expression
+            The region of the array to modify, as used to index the array (an
+            integer, slice, tuple of integers and slices, index array, ...).
+        values : array_like
+            The new values of the region, which must be broadcastable to its
+            shape.
+
+        Description
+        -----------
+        Performs ``getattr(self, name)[index] = values``, first making a
+        private copy of a shared copy-on-write default value (see
+        trait_array_writeable). Since array traits compare values by identity,
+        changing an array in place does not notify the handlers of the trait.
+        Instead, if the trait has an '*name*_items' event (which it does unless
+        defined with ``items=False``), a TraitArrayEvent describing the
+        modified region is sent to its handlers, which can update any results
+        depending on the array incrementally.
+        """
+        trait = self.trait( name )
+        if (trait is None) or (not trait.array):
+            raise TraitError( "The '%s' trait of a '%s' instance is not an "
+                              "array trait." % ( name,
+                                                 self.__class__.__name__ ) )
+
+        trait.handler.update_items( self, name, index, values )
+
     #---------------------------------------------------------------------------
     #  Returns the list of trait names to copy/clone by default:
     #---------------------------------------------------------------------------
@@ -1669,67 +2357,128 @@ class HasTraits ( CHasTraits ):
         """
 
         if traits is None:
-            traits = self.copyable_trait_names( **metadata )
+            # The default trait names are determined by the copy plan (unless
+            # they depend upon the metadata or an overridden method):
+            if ((len( metadata ) > 0) or
+                (self.__class__.copyable_trait_names !=
+                 HasTraits.copyable_trait_names)):
+                traits = self.copyable_trait_names( **metadata )
         elif (traits == 'all') or (len( traits ) == 0):
             traits = self.all_trait_names()
             if memo is not None:
                 memo[ 'traits_to_copy' ] = 'all'
 
-        unassignable = []
-        deferred     = []
+        immediate, deferred, unassignable = self._trait_copy_plan( other,
+                                                                   traits )
+        unassignable = list( unassignable )
         deep_copy    = (copy == 'deep')
         shallow_copy = (copy == 'shallow')
 
-        for name in traits:
-            try:
-                trait = self.trait( name )
-                if trait.type in DeferredCopy:
-                    deferred.append( name )
-                    continue
+        # Copy the deferred (i.e. delegate and property) traits last:
+        for items in ( immediate, deferred ):
+            for name, base_trait in items:
+                try:
+                    if base_trait is None:
+                        # The trait depends upon the object the other object
+                        # delegates to:
+                        base_trait = other.base_trait( name )
+                        if (base_trait.type == 'event') and (items is
+                                                             immediate):
+                            continue
+
+                    value     = getattr( other, name )
+                    copy_type = base_trait.copy
+                    if copy_type == 'shallow':
+                        value = copy_module.copy( value )
+                    elif copy_type == 'ref':
+                        pass
+                    elif (copy_type == 'deep') or deep_copy:
+                        if memo is None:
+                            value = copy_module.deepcopy( value )
+                        else:
+                            value = copy_module.deepcopy( value, memo )
+                    elif shallow_copy:
+                        value = copy_module.copy( value )
 
-                base_trait = other.base_trait( name )
-                if base_trait.type == 'event':
-                    continue
+                    setattr( self, name, value )
+                except:
+                    unassignable.append( name )
 
-                value     = getattr( other, name )
-                copy_type = base_trait.copy
-                if copy_type == 'shallow':
-                    value = copy_module.copy( value )
-                elif copy_type == 'ref':
-                    pass
-                elif (copy_type == 'deep') or deep_copy:
-                    if memo is None:
-                        value = copy_module.deepcopy( value )
-                    else:
-                        value = copy_module.deepcopy( value, memo )
-                elif shallow_copy:
-                    value = copy_module.copy( value )
+        return unassignable
 
-                setattr( self, name, value )
-            except:
-                unassignable.append( name )
+    #---------------------------------------------------------------------------
+    #  Returns the plan used to copy another object's traits into this one:
+    #---------------------------------------------------------------------------
 
-        for name in deferred:
-            try:
-                value     = getattr( other, name )
-                copy_type = other.base_trait( name ).copy
-                if copy_type == 'shallow':
-                    value = copy_module.copy( value )
-                elif copy_type == 'ref':
-                    pass
-                elif (copy_type == 'deep') or deep_copy:
-                    if memo is None:
-                        value = copy_module.deepcopy( value )
-                    else:
-                        value = copy_module.deepcopy( value, memo )
-                elif shallow_copy:
-                    value = copy_module.copy( value )
+    def _trait_copy_plan ( self, other, traits ):
+        """ Returns the plan used to copy the traits of *other* named by
+            *traits* (or the default copyable traits if *traits* is None) into
+            this object.
+
+            The plan is a tuple of the form: ( immediate, deferred,
+            unassignable ), where *immediate* and *deferred* contain the
+            ( name, base_trait ) pairs of the traits to be copied first and
+            last respectively, and *unassignable* the names of the traits that
+            cannot be copied. *base_trait* is the other object's trait
+            definition (whose 'copy' metadata determines how the value is
+            copied), or None if it can only be determined when the trait is
+            copied (i.e. for delegated traits). Event traits are omitted.
+
+            Since the plan depends only upon the classes of both objects
+            (unless either object has instance-specific traits), it is cached
+            in this object's class, keyed by the other object's class and the
+            trait names.
+        """
+        klass  = self.__class__
+        source = other.__class__
+        key    = None
+        if ((not self._has_instance_defined_traits()) and
+            (not other._has_instance_defined_traits())):
+            if traits is None:
+                key = ( source, None )
+            else:
+                key = ( source, tuple( traits ) )
+                try:
+                    hash( key )
+                except TypeError:
+                    key = None
+
+        if key is not None:
+            # Note that a class's copy plans are discarded whenever a trait is
+            # added to it, so the other class's copy plans dictionary also
+            # identifies the version of its trait definitions:
+            plans        = _copy_plans_for( klass )
+            source_plans = _copy_plans_for( source )
+            entry        = plans.get( key )
+            if (entry is not None) and (entry[0] is source_plans):
+                return entry[1]
 
-                setattr( self, name, value )
+        if traits is None:
+            traits = self.copyable_trait_names()
+
+        immediate    = []
+        deferred     = []
+        unassignable = []
+        for name in traits:
+            try:
+                if self.trait( name ).type in DeferredCopy:
+                    deferred.append( ( name, None ) )
+                elif other.trait( name ).type == 'delegate':
+                    immediate.append( ( name, None ) )
+                else:
+                    base_trait = other.base_trait( name )
+                    if base_trait.type != 'event':
+                        immediate.append( ( name, base_trait ) )
             except:
                 unassignable.append( name )
 
-        return unassignable
+        plan = ( tuple( immediate ), tuple( deferred ), tuple( unassignable ) )
+        if key is not None:
+            if len( plans ) >= MaxCopyPlans:
+                plans.clear()
+            plans[ key ] = ( source_plans, plan )
+
+        return plan
 
     #---------------------------------------------------------------------------
     #  Clones a new object from this one, optionally copying only a specified
@@ -1770,7 +2519,13 @@ class HasTraits ( CHasTraits ):
             memo = {}
 
         if traits is None:
-            traits = self.copyable_trait_names( **metadata )
+            # Unless they depend upon this object, let the copy plan supply
+            # the default trait names:
+            if ((len( metadata ) > 0) or
+                (self.__class__.copyable_trait_names !=
+                 HasTraits.copyable_trait_names) or
+                self._has_instance_defined_traits()):
+                traits = self.copyable_trait_names( **metadata )
         elif (traits == 'all') or (len( traits ) == 0):
             traits = self.all_trait_names()
             memo[ 'traits_to_copy' ] = 'all'
@@ -2368,6 +3123,12 @@ class HasTraits ( CHasTraits ):
                         event queue.
             ``fast_ui`` Alias for ``ui``.
             ``new``     Run notifications in a new thread.
+            ``async``   Run notifications on the asyncio event loop set using
+                        set_async_event_loop(). Notifications for the same
+                        object run in order, and a handler which is a
+                        coroutine function runs to completion before the next
+                        one starts. Await wait_for_async_notifications() on
+                        the event loop to wait for pending notifications.
             =========== =======================================================
 
         Description
@@ -2554,8 +3315,8 @@ class HasTraits ( CHasTraits ):
             return
 
         from .traits_listener \
-            import TraitsListener, ListenerParser, ListenerHandler, \
-                   ListenerNotifyWrapper
+            import TraitsListener, ListenerHandler, ListenerNotifyWrapper, \
+                   parse_listener
 
         if isinstance( name, list ):
             for name_i in name:
@@ -2589,15 +3350,16 @@ class HasTraits ( CHasTraits ):
                 if wrapper.equals( handler ):
                     break
             else:
-                listener = ListenerParser( name ).listener
-                lnw = ListenerNotifyWrapper( handler, self, name, listener, target )
+                lnw = ListenerNotifyWrapper( handler, self, name, None,
+                                             target )
                 listeners.append( lnw )
-                listener.trait_set( handler         = ListenerHandler( handler ),
-                                    wrapped_handler_ref = weakref.ref(lnw),
-                                    type            = lnw.type,
-                                    dispatch        = dispatch,
-                                    priority        = priority,
-                                    deferred        = deferred )
+                lnw.listener = listener = parse_listener( name,
+                    handler             = ListenerHandler( handler ),
+                    wrapped_handler_ref = weakref.ref( lnw ),
+                    type                = lnw.type,
+                    dispatch            = dispatch,
+                    priority            = priority,
+                    deferred            = deferred )
                 listener.register( self )
 
     # A synonym for 'on_trait_change'
@@ -2787,6 +3549,14 @@ class HasTraits ( CHasTraits ):
         # trait to it:
         itrait_dict = self._instance_traits()
         itrait_dict[ name ] = trait = _clone_trait( trait )
+        self._instance_traits_added( True )
+
+        # Store the trait value wherever the trait it replaces stored it (if
+        # any), otherwise in the object dictionary:
+        if old_trait is not None:
+            trait.value_slot( old_trait )
+        else:
+            trait.value_slot( None )
 
         # If there already was a trait with the same name:
         if old_trait is not None:
@@ -2848,9 +3618,17 @@ class HasTraits ( CHasTraits ):
                 if handler.is_mapped:
                     self.remove_trait( name + '_' )
 
-            # Remove the trait value from the object dictionary as well:
+            # Remove the trait value from the object dictionary as well. A
+            # compact object may instead hold it in a value slot that the
+            # class trait shares, so clear that slot through the trait:
             if name in self.__dict__:
                 del self.__dict__[ name ]
+            elif self._trait_has_value( name ):
+                self._trait_change_notify( False )
+                try:
+                    delattr( self, name )
+                finally:
+                    self._trait_change_notify( True )
 
             # Get the object's instance trait dictionary and remove the trait
             # from it:
@@ -2970,35 +3748,89 @@ class HasTraits ( CHasTraits ):
         metadata keyword is specified, a trait attribute must match the metadata
         values of all keywords to be included in the result.
         """
-        traits = self.__base_traits__.copy()
-        
-        # Update with instance-defined traits.
-        for name, trt in self._instance_traits().items():
+        base_traits = self.__base_traits__
+        traits      = self._instance_defined_traits()
+        if len( metadata ) == 0:
+            result = base_traits.copy()
+            result.update( traits )
+            return result
+
+        # Answer the query for the class traits from the class's metadata
+        # index, then overlay any matching instance-defined traits:
+        result = self._indexed_class_traits( metadata )
+        if len( traits ) > 0:
+            for name in traits.keys():
+                result.pop( name, None )
+            result.update( _traits_matching( traits, metadata ) )
+
+        return result
+
+    #---------------------------------------------------------------------------
+    #  Returns a dictionary of the object's instance-defined traits:
+    #---------------------------------------------------------------------------
+
+    def _instance_defined_traits ( self, changed_only = False ):
+        """ Returns a dictionary containing the object's instance-specific
+            traits, and the dynamically created traits of any attributes which
+            are not class traits.
+
+            If *changed_only* is True, instance-specific copies of class traits
+            which have the same metadata as the class trait are omitted.
+        """
+        base_traits  = self.__base_traits__
+        class_traits = self.__class_traits__
+        traits       = {}
+        itraits      = {}
+
+        # Only traits added by 'add_trait' can differ from the class traits:
+        if (not changed_only) or self._instance_traits_added():
+            itraits = self._instance_traits()
+
+        for name, trt in itraits.items():
             if name[-6:] != "_items":
+                if changed_only:
+                    ctrait = class_traits.get( name )
+                    if (ctrait is not None) and (name in base_traits) and \
+                       (ctrait.type == trt.type):
+                        if trt.__dict__ is ctrait.__dict__:
+                            continue
+
+                        try:
+                            if trt.__dict__ == ctrait.__dict__:
+                                continue
+                        except Exception:
+                            pass
+
                 traits[name] = trt
 
         for name in self.__dict__.keys():
-            if name not in traits:
+            if (name not in base_traits) and (name not in traits):
                 trait = self.trait( name )
                 if trait is not None:
                     traits[ name ] = trait
 
-        if len( metadata ) == 0:
-            return traits
+        return traits
 
-        for meta_name, meta_eval in metadata.items():
-            if type( meta_eval ) is not FunctionType:
-                metadata[ meta_name ] = _SimpleTest( meta_eval )
+    #---------------------------------------------------------------------------
+    #  Returns whether the object has any instance-defined traits:
+    #---------------------------------------------------------------------------
 
-        result = {}
-        for name, trait in traits.items():
-            for meta_name, meta_eval in metadata.items():
-                if not meta_eval( getattr( trait, meta_name ) ):
-                    break
-            else:
-                result[ name ] = trait
+    def _has_instance_defined_traits ( self ):
+        """ Returns whether calling **_instance_defined_traits** with
+            *changed_only* True would return any traits, without building the
+            dictionary it returns.
+        """
+        if self._instance_traits_added():
+            return (len( self._instance_defined_traits( True ) ) > 0)
+
+        # Otherwise, only the dynamically created traits of attributes which
+        # are not class traits can be returned:
+        base_traits = self.__base_traits__
+        for name in self.__dict__:
+            if (name not in base_traits) and (self.trait( name ) is not None):
+                return True
 
-        return result
+        return False
 
     #---------------------------------------------------------------------------
     #  Return a dictionary of all traits which match a set of metadata:
@@ -3039,22 +3871,43 @@ class HasTraits ( CHasTraits ):
         if len( metadata ) == 0:
             return cls.__base_traits__.copy()
 
-        result = {}
+        return cls._indexed_class_traits( metadata )
 
-        for meta_name, meta_eval in metadata.items():
-            if type( meta_eval ) is not FunctionType:
-                metadata[ meta_name ] = _SimpleTest( meta_eval )
+    class_traits = classmethod( class_traits )
 
-        for name, trait in cls.__base_traits__.items():
-            for meta_name, meta_eval in metadata.items():
-                if not meta_eval( getattr( trait, meta_name ) ):
-                    break
-            else:
-                result[ name ] = trait
+    def _indexed_class_traits ( cls, metadata ):
+        """ Returns a dictionary containing the class traits matching a
+            (non-empty) set of *metadata* criteria.
 
-        return result
+            Queries whose criteria are all hashable are answered from (and
+            added to) the class's metadata index, which maps each query to
+            the names of the matching traits. The index is discarded whenever
+            a trait is added to the class (or to one of its base classes).
+        """
+        base_traits = cls.__base_traits__
+        try:
+            key = tuple( sorted( metadata.items() ) )
+            hash( key )
+        except TypeError:
+            return _traits_matching( base_traits, metadata )
 
-    class_traits = classmethod( class_traits )
+        index = cls.__dict__.get( MetadataIndex )
+        if index is None:
+            index = {}
+            setattr( cls, MetadataIndex, index )
+
+        names = index.get( key )
+        if names is None:
+            result = _traits_matching( base_traits, metadata )
+            if len( index ) >= MaxMetadataQueries:
+                index.clear()
+            index[ key ] = result.keys()
+
+            return result
+
+        return dict( [ ( name, base_traits[ name ] ) for name in names ] )
+
+    _indexed_class_traits = classmethod( _indexed_class_traits )
 
     #---------------------------------------------------------------------------
     #  Return a list of all trait names which match a set of metadata:
@@ -3299,22 +4152,57 @@ class HasTraits ( CHasTraits ):
             registered, traits listeners (called at object creation and
             unpickling times).
         """
-        for name, data in self.__class__.__listener_traits__.items():
-            if data[0] == 'method':
-                config = data[1]
-                if config['post_init']:
-                    self.on_trait_change( getattr( self, name ),
-                                          config['pattern'],
-                                          deferred = True,
-                                          dispatch=config['dispatch'] )
+        for install, name, data in self._trait_listener_plan()[1]:
+            install( self, name, *data )
 
     def _init_trait_listeners ( self ):
         """ Initializes the object's statically parsed, but dynamically
             registered, traits listeners (called at object creation and
             unpickling times).
         """
-        for name, data in self.__class__.__listener_traits__.items():
-            getattr( self, '_init_trait_%s_listener' % data[0] )( name, *data )
+        for install, name, data in self._trait_listener_plan()[0]:
+            install( self, name, *data )
+
+    def _trait_listener_plan ( cls ):
+        """ Returns the class's listener installation plan, compiling it from
+            the class's listener traits if necessary.
+
+            The plan is a tuple of two lists: the listeners to install before
+            and after the constructor's trait values have been assigned. Each
+            list contains ( install_method, name, data ) tuples, where
+            install_method is the resolved '_init_trait_xxx_listener' (or
+            '_post_init_trait_method_listener') method to call, and data is
+            the listener's '__listener_traits__' data.
+        """
+        plan = cls.__dict__.get( ListenerPlan )
+        if plan is None:
+            pre_init  = []
+            post_init = []
+            for name, data in cls.__listener_traits__.items():
+                kind = data[0]
+                if (kind == 'method') and data[1]['post_init']:
+                    post_init.append( ( cls._post_init_trait_method_listener,
+                                        name, data ) )
+                else:
+                    pre_init.append( ( getattr( cls,
+                                         '_init_trait_%s_listener' % kind ),
+                                       name, data ) )
+
+            plan = ( pre_init, post_init )
+            setattr( cls, ListenerPlan, plan )
+
+        return plan
+
+    _trait_listener_plan = classmethod( _trait_listener_plan )
+
+    def _post_init_trait_method_listener ( self, name, kind, config ):
+        """ Sets up the listener for a method with the @on_trait_change
+            decorator which specifies 'post_init = True'.
+        """
+        self.on_trait_change( getattr( self, name ),
+                              config['pattern'],
+                              deferred = True,
+                              dispatch=config['dispatch'] )
 
     def _init_trait_method_listener ( self, name, kind, config ):
         """ Sets up the listener for a method with the @on_trait_change
@@ -3448,6 +4336,29 @@ class HasPrivateTraits ( HasTraits ):
     # Disallow access to all other traits not explicitly defined:
     _  = Disallow
 
+#-------------------------------------------------------------------------------
+#  'HasCompactTraits' class:
+#-------------------------------------------------------------------------------
+
+class HasCompactTraits ( HasTraits ):
+    """ This class stores the values of its simple (i.e. non-property,
+    non-delegated, non-event) class traits in member slots added to the class
+    (as if listed in its **__slots__**), rather than in the instance's
+    dictionary.
+
+    This reduces the memory used by classes which have many instances with a
+    small number of traits, and avoids a dictionary lookup each time a trait
+    is read or assigned. Instances of other classes are unaffected. Trait
+    values stored in slots do not appear in the instance's **__dict__**. Any
+    subclass of HasTraits can also opt in (or a subclass of a compact class
+    opt out) by setting the **__compact_traits__** class attribute to True
+    (or False).
+
+    As with **__slots__**, a class cannot derive from two compact classes
+    which both add slots.
+    """
+    __compact_traits__ = True
+
 
 #------------------------------------------------------------------------------
 # ABC classes with traits: (where available)
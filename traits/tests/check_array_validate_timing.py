@@ -0,0 +1,69 @@
+# Copyright (c) 2014, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in /LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#
+# Description: Measure the rate at which 1M element arrays (and buffers) can
+#              be assigned to Array traits, and how many of the assignments
+#              copied the data.
+
+from __future__ import absolute_import
+
+from time import time
+
+import numpy
+
+from ..api import Array, CArray, HasTraits
+
+# Number of elements in each array:
+size = 1000000
+
+# Number of assignments per measurement:
+n = 20000
+
+
+class Model(HasTraits):
+
+    data = Array(dtype='float64')
+
+    image = Array(dtype='float64', shape=(None, (100, 1000)))
+
+    values = CArray(dtype='float32')
+
+
+#  Measure how long it takes to execute a specified function:
+def measure(func, *args):
+    now = time()
+    func(*args)
+    return time() - now
+
+
+def assign(model, name, values):
+    for value in values:
+        setattr(model, name, value)
+
+
+def report(model, name, values):
+    stats = model.trait(name).copy_stats
+    stats.reset()
+    elapsed = measure(assign, model, name, values)
+    print '%-36s %9.0f assignments/s  %5d copies' % (
+        '%s = %s' % (name, type(values[0]).__name__), len(values) / elapsed,
+        stats.copies)
+
+
+def main():
+    model = Model()
+    data = numpy.arange(float(size))
+    report(model, 'data', [data, data.copy()] * (n // 2))
+    report(model, 'data', [memoryview(data)] * n)
+    report(model, 'image', [data.reshape(1000, 1000)] * n)
+    report(model, 'values', [data[:size // 100]] * 100)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+# Copyright (c) 2014, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in /LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#
+# Description: Report the memory used per instance of a compact class (whose
+#              trait values are stored in member slots) compared with the same
+#              class storing its trait values in the instance dictionary, and
+#              the fixed size of every (compact or not) CHasTraits instance.
+#              All instances share the same trait value objects, so only the
+#              memory used to store the values is measured.
+
+from __future__ import absolute_import
+
+import gc
+import struct
+import sys
+
+from ..api import Float, HasCompactTraits, HasTraits, Int, Str
+from ..ctraits import CHasTraits
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+# Number of instances of each class to create:
+n = 100000
+
+# Size of 'CHasTraits' instances before compact classes were added (the
+# object header, three pointers, an int and the '__dict__' pointer):
+legacy_basicsize = struct.calcsize('PP' + 'PPPiP')
+
+
+class Point(HasTraits):
+
+    x = Float
+
+    y = Float
+
+    z = Float
+
+    label = Str
+
+    count = Int
+
+
+class CompactPoint(HasCompactTraits):
+
+    x = Float
+
+    y = Float
+
+    z = Float
+
+    label = Str
+
+    count = Int
+
+
+def create(klass):
+    """ Returns an instance of a class with all of its trait values assigned.
+    """
+    return klass(x=1.0, y=2.0, z=3.0, label='point', count=1)
+
+
+def measure(klass):
+    """ Returns the number of bytes allocated per instance.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [create(klass) for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / float(n)
+
+
+def estimate(klass):
+    """ Returns the size of an instance plus the dictionaries it owns (when
+        tracemalloc is not available).
+    """
+    object = create(klass)
+    shared = klass.__class_traits__
+    return sys.getsizeof(object) + sum(
+        [sys.getsizeof(item) for item in gc.get_referents(object)
+         if (type(item) is dict) and (item is not shared)])
+
+
+def main():
+    print 'CHasTraits basic size: %d bytes (was %d)' % (
+        CHasTraits.__basicsize__, legacy_basicsize)
+    print 'HasTraits basic size:  %d bytes, compact (5 slots): %d bytes' % (
+        Point.__basicsize__, CompactPoint.__basicsize__)
+
+    if tracemalloc is not None:
+        kind, regular, compact = ('allocated', measure(Point),
+                                  measure(CompactPoint))
+    else:
+        kind, regular, compact = ('estimated', estimate(Point),
+                                  estimate(CompactPoint))
+
+    print 'Bytes per instance (%s): %6.0f compact, %6.0f regular (%.1fx)' % (
+        kind, compact, regular, regular / float(compact))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+# Copyright (c) 2014, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in /LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#
+# Description: Measure the time taken to deep copy a large List(Instance(Foo))
+#              trait value using the trusted (validation-free) construction of
+#              trait list objects, compared with validating every item of the
+#              copy (as was done previously).
+
+from __future__ import absolute_import
+
+import copy
+from time import time
+
+from ..api import HasTraits, Instance, Int, List
+from ..trait_handlers import TraitListObject
+
+# Number of items in the list:
+n = 1000000
+
+# Number of distinct Foo objects referenced by the list (the deep copy of each
+# distinct object is shared by all of the list items referring to it):
+distinct = 1000
+
+
+class Foo(HasTraits):
+
+    value = Int
+
+
+class Model(HasTraits):
+
+    items = List(Instance(Foo))
+
+
+def legacy_deepcopy(value, memo):
+    """ Deep copies a trait list object, validating each item of the copy.
+    """
+    return TraitListObject(value.trait, lambda: None, value.name,
+                           [copy.deepcopy(item, memo) for item in value])
+
+
+def legacy_clone(model):
+    """ Clones a model, validating each item of the copied list both when it
+        is deep copied and when it is assigned to the clone.
+    """
+    clone = Model()
+    clone.items = list(legacy_deepcopy(model.items, {}))
+    return clone
+
+
+#  Measure how long it takes to execute a specified function:
+def measure(func, *args):
+    now = time()
+    result = func(*args)
+    return time() - now, result
+
+
+def main():
+    foos = [Foo(value=i) for i in range(distinct)]
+    model = Model(items=[foos[i % distinct] for i in range(n)])
+
+    validated, result = measure(legacy_deepcopy, model.items, {})
+    trusted, result = measure(copy.deepcopy, model.items)
+    assert len(result) == n
+    print 'deepcopy:     validated: %6.3f s   trusted: %6.3f s' % (
+        validated, trusted)
+
+    validated, result = measure(legacy_clone, model)
+    trusted, result = measure(model.clone_traits, None, None, 'deep')
+    assert result.items[-1] is result.items[distinct - 1]
+    print 'clone_traits: validated: %6.3f s   trusted: %6.3f s' % (
+        validated, trusted)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+# Copyright (c) 2014, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in /LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#
+# Description: Report the memory used per trait list, set and dictionary
+#              object (both empty and containing a few small items), compared
+#              with containers which store their attributes in an instance
+#              dictionary (as was done previously).
+
+from __future__ import absolute_import
+
+import gc
+
+from ..api import Dict, HasTraits, Int, List, Set
+from ..trait_handlers import TraitDictObject, TraitListObject, TraitSetObject
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+# Number of containers of each kind to create:
+n = 100000
+
+
+class Model(HasTraits):
+
+    values = List(Int)
+
+    unique = Set(Int)
+
+    table = Dict(Int, Int)
+
+
+def legacy(klass):
+    """ Returns a container class storing its attributes in an instance
+        dictionary, and using a separate items event name per container.
+    """
+    class Legacy(klass):
+
+        def __init__(self, trait, object, name, value):
+            super(Legacy, self).__init__(trait, object, name, value)
+            self.__dict__['name_items'] = ''.join([name, '_items'])
+
+    return Legacy
+
+
+def measure(klass, name, value):
+    """ Returns the number of bytes allocated per container.
+    """
+    model = Model()
+    trait = model.trait(name).handler
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    containers = [klass(trait, model, name, value) for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del containers
+    return (after - before) / float(n)
+
+
+def main():
+    if tracemalloc is None:
+        print 'The tracemalloc module is required to measure memory use.'
+        return
+
+    for klass, name, small in ((TraitListObject, 'values', [1, 2, 3]),
+                               (TraitSetObject, 'unique', set([1, 2, 3])),
+                               (TraitDictObject, 'table', {1: 2, 3: 4})):
+        for kind, value in (('empty', type(small)()), ('small', small)):
+            print '%-16s %-6s bytes: %6.0f (was %6.0f)' % (
+                klass.__name__, kind, measure(klass, name, value),
+                measure(legacy(klass), name, value))
+
+
+if __name__ == '__main__':
+    main()
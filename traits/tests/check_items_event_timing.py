@@ -0,0 +1,90 @@
+# Copyright (c) 2014, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in /LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#
+# Description: Measure the cost of mutating List, Set and Dict trait values
+#              with and without any handlers for their items events,
+#              compared with the equivalent validated changes to plain
+#              containers.
+
+from __future__ import absolute_import
+
+from time import time
+
+from ..api import Dict, HasTraits, Int, List, Set
+
+# Number of items added to each container:
+n = 200000
+
+
+class Model(HasTraits):
+
+    values = List(Int)
+
+    members = Set(Int)
+
+    table = Dict(Int, Int)
+
+
+class ObservedModel(Model):
+
+    def _values_items_changed(self):
+        pass
+
+    def _members_items_changed(self):
+        pass
+
+    def _table_items_changed(self):
+        pass
+
+
+#  Measure how long it takes to execute a specified function:
+def measure(func, *args):
+    now = time()
+    func(*args)
+    return time() - now
+
+
+def fill_plain(model):
+    validate = model.trait('values').handler.item_trait.validate
+    values = []
+    for i in range(n):
+        values.append(validate(model, 'values', i))
+
+
+def fill_list(model):
+    append = model.values.append
+    for i in range(n):
+        append(i)
+
+
+def fill_set(model):
+    add = model.members.add
+    for i in range(n):
+        add(i)
+
+
+def fill_dict(model):
+    table = model.table
+    for i in range(n):
+        table[i] = i
+
+
+def main():
+    print '%-24s %8.0f ns/item' % ('validated list.append',
+                                   measure(fill_plain, Model()) * 1e9 / n)
+    for label, func in (('List(Int).append', fill_list),
+                        ('Set(Int).add', fill_set),
+                        ('Dict(Int, Int)[key] =', fill_dict)):
+        print '%-24s %8.0f ns/item unobserved  %8.0f ns/item observed' % (
+            label, measure(func, Model()) * 1e9 / n,
+            measure(func, ObservedModel()) * 1e9 / n)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+# Copyright (c) 2014, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in /LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#
+# Description: Measure the pickling throughput of HasTraits objects, comparing
+#              the cached per-class pickling plan and the trusted restore path
+#              with the previous (uncached, fully validated) implementation.
+
+from __future__ import absolute_import
+
+import cPickle as pickle
+from time import time
+
+from ..api import Any, Float, HasTraits, Int, Str
+from ..has_traits import TraitsVersion
+from ..trait_base import is_none
+
+# Number of objects to pickle:
+n = 20000
+
+
+class Record(HasTraits):
+
+    name = Str
+
+    index = Int
+
+    value = Float
+
+    label = Str
+
+    count = Int
+
+    scale = Float
+
+    scratch = Any(transient=True)
+
+
+class TrustedRecord(Record):
+
+    __trusted_restore__ = True
+
+
+class LegacyRecord(Record):
+    """ Uses the pickling implementation prior to the cached pickling plans.
+    """
+
+    def __getstate__(self):
+        result = self.trait_get(transient=is_none)
+        dic = self.__dict__
+        result.update(dict([(name, dic[name])
+                            for name in self.trait_names(type='delegate',
+                                                         transient=False)
+                            if name in dic]))
+        result.setdefault('__traits_version__', TraitsVersion)
+        return result
+
+    def __setstate__(self, state, trait_change_notify=True):
+        state.pop('__traits_version__', None)
+        self._init_trait_listeners()
+        self.trait_set(trait_change_notify=trait_change_notify, **state)
+        self._post_init_trait_listeners()
+        self.traits_init()
+        self.traits_inited(True)
+
+
+#  Measure how long it takes to execute a specified function:
+def measure(func, *args):
+    now = time()
+    result = func(*args)
+    return time() - now, result
+
+
+def report(klass):
+    objects = [klass(name='record %d' % i, index=i, value=i * 0.5,
+                     label='x', count=i % 7, scale=2.0)
+               for i in range(n)]
+    dump_time, data = measure(pickle.dumps, objects, 2)
+    load_time, restored = measure(pickle.loads, data)
+    assert restored[-1].index == n - 1
+    return '%-14s dump: %8.0f objects/s   load: %8.0f objects/s' % (
+        klass.__name__, n / dump_time, n / load_time)
+
+
+def main():
+    for klass in (LegacyRecord, Record, TrustedRecord):
+        print report(klass)
+
+
+if __name__ == '__main__':
+    main()
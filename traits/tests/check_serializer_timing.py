@@ -0,0 +1,87 @@
+# Copyright (c) 2014, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in /LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#
+# Description: Compare the throughput and output size of the schema-driven
+#              trait serializer with those of (__getstate__ based) pickling.
+
+from __future__ import absolute_import
+
+import cPickle as pickle
+from time import time
+
+from ..api import Bool, Dict, Float, HasTraits, Instance, Int, List, Str
+from ..trait_serializer import dumps, loads
+
+# Number of objects in the graph:
+n = 10000
+
+
+class Point(HasTraits):
+
+    x = Float
+
+    y = Float
+
+
+class Node(HasTraits):
+
+    name = Str
+
+    index = Int
+
+    value = Float
+
+    visible = Bool
+
+    location = Instance(Point)
+
+    parent = Instance('Node')
+
+    attributes = Dict(Str, Int)
+
+    children = List(Instance('Node'))
+
+
+#  Measure how long it takes to execute a specified function:
+def measure(func, *args):
+    now = time()
+    result = func(*args)
+    return time() - now, result
+
+
+def build():
+    root = Node(name='root')
+    nodes = [root]
+    for i in range(1, n):
+        parent = nodes[(i - 1) // 4]
+        node = Node(name='node %d' % i, index=i, value=i * 0.25,
+                    visible=(i % 2 == 0), location=Point(x=i, y=-i),
+                    parent=parent, attributes={'depth': i % 5})
+        parent.children.append(node)
+        nodes.append(node)
+
+    return root
+
+
+def report(name, dump, load):
+    root = build()
+    dump_time, data = measure(dump, root)
+    load_time, restored = measure(load, data)
+    assert restored.children[0].parent is restored
+    return '%-11s dump: %8.0f nodes/s   load: %8.0f nodes/s   size: %8d' % (
+        name, n / dump_time, n / load_time, len(data))
+
+
+def main():
+    print report('pickle', lambda root: pickle.dumps(root, 2), pickle.loads)
+    print report('serializer', dumps, loads)
+
+
+if __name__ == '__main__':
+    main()
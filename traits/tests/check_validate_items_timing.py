@@ -0,0 +1,80 @@
+# Copyright (c) 2014, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in /LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#
+# Description: Measure the bulk validation throughput of List, Set and Dict
+#              traits using CTrait.validate_items, compared with validating
+#              each item through the Python handler.
+
+from __future__ import absolute_import
+
+from time import time
+
+from ..api import Dict, Float, HasTraits, Instance, Int, List, Set, Str
+
+# Number of items per container:
+n = 200000
+
+
+class Foo(HasTraits):
+
+    pass
+
+
+class Model(HasTraits):
+
+    ints = List(Int)
+
+    floats = List(Float)
+
+    foos = List(Instance(Foo))
+
+    names = Set(Str)
+
+    table = Dict(Str, Int)
+
+
+#  Measure how long it takes to execute a specified function:
+def measure(func, *args):
+    now = time()
+    func(*args)
+    return time() - now
+
+
+def python_validate(model, name, values):
+    trait = model.trait(name).handler.item_trait
+    validate = trait.handler.validate
+    return [validate(model, name, value) for value in values]
+
+
+def c_validate(model, name, values):
+    trait = model.trait(name).handler.item_trait
+    return trait.validate_items(model, name, values)
+
+
+def main():
+    model = Model()
+    foo = Foo()
+    data = [('ints', range(n)), ('floats', [float(i) for i in range(n)]),
+            ('foos', [foo] * n)]
+    for name, values in data:
+        python_time = measure(python_validate, model, name, values)
+        c_time = measure(c_validate, model, name, values)
+        assign_time = measure(setattr, model, name, values)
+        print '%-7s python: %6.3fs  validate_items: %6.3fs  assign: %6.3fs' % (
+            name, python_time, c_time, assign_time)
+
+    names = ['item %d' % i for i in range(n)]
+    print '%-7s assign: %6.3fs' % ('names', measure(setattr, model, 'names',
+                                                    set(names)))
+    print '%-7s assign: %6.3fs' % ('table', measure(setattr, model, 'table',
+                                                    dict.fromkeys(names, 0)))
+
+
+if __name__ == '__main__':
+    main()
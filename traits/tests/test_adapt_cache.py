@@ -0,0 +1,122 @@
+#  Test the type caches of the C-level validators of adapting traits.
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  License included in /LICENSE.txt and may be redistributed only under the
+#  conditions described in the aforementioned license.  The license is also
+#  available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+from __future__ import absolute_import
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import (Adapter, AdaptsTo, HasTraits, Instance, Interface, List,
+    provides, register_factory, Supports, TraitError)
+from ..adaptation.api import reset_global_adaptation_manager
+
+
+class IShape(Interface):
+
+    def area(self):
+        """ Returns the area of the shape. """
+
+
+@provides(IShape)
+class Square(HasTraits):
+    pass
+
+
+class Circle(HasTraits):
+    pass
+
+
+class Blob(HasTraits):
+    pass
+
+
+@provides(IShape)
+class CircleToIShape(Adapter):
+    pass
+
+
+class Drawing(HasTraits):
+
+    shape = Supports(IShape)
+
+    adapted = AdaptsTo(IShape)
+
+    strict = Instance(IShape)
+
+    shapes = List(Supports(IShape))
+
+
+def cache_of(klass, name):
+    return klass.class_traits()[name].handler.fast_validate[4]
+
+
+class TestAdaptCache(unittest.TestCase):
+
+    def setUp(self):
+        reset_global_adaptation_manager()
+
+    def tearDown(self):
+        reset_global_adaptation_manager()
+
+    def test_providing_types_cached(self):
+        drawing = Drawing()
+        square = Square()
+        drawing.shape = square
+        self.assertIs(drawing.shape, square)
+        self.assertIs(cache_of(Drawing, 'shape')[Square], True)
+
+        drawing.strict = square
+        self.assertIs(drawing.strict, square)
+        drawing.shapes = [square, Square()]
+        self.assertIs(drawing.shapes[0], square)
+
+        with self.assertRaises(TraitError):
+            drawing.strict = Circle()
+        with self.assertRaises(TraitError):
+            drawing.shape = Circle()
+        self.assertIs(cache_of(Drawing, 'shape')[Circle], False)
+
+    def test_registration_invalidates_cache(self):
+        drawing = Drawing()
+        with self.assertRaises(TraitError):
+            drawing.shape = Circle()
+        cache = cache_of(Drawing, 'shape')
+        self.assertIn(Circle, cache)
+        version = cache[None]
+
+        # The cache is discarded by the next validation after a change to
+        # the adaptation registry:
+        register_factory(CircleToIShape, Circle, IShape)
+        drawing.shape = Square()
+        self.assertGreater(cache[None], version)
+        self.assertNotIn(Circle, cache)
+
+        circle = Circle()
+        drawing.shape = circle
+        self.assertIsInstance(drawing.shape, CircleToIShape)
+        self.assertIs(cache[Circle], False)
+        drawing.adapted = circle
+        self.assertIs(drawing.adapted, circle)
+        self.assertIsInstance(drawing.adapted_, CircleToIShape)
+
+    def test_abc_registration_after_caching(self):
+        drawing = Drawing()
+        with self.assertRaises(TraitError):
+            drawing.shape = Blob()
+
+        # Types registered later are still found to provide the interface:
+        IShape.register(Blob)
+        blob = Blob()
+        drawing.shape = blob
+        self.assertIs(drawing.shape, blob)
+
+
+if __name__ == '__main__':
+    unittest.main()
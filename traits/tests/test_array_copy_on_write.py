@@ -0,0 +1,104 @@
+#  Test copy-on-write default values for Array traits.
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  License included in /LICENSE.txt and may be redistributed only under the
+#  conditions described in the aforementioned license.  The license is also
+#  available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+from __future__ import absolute_import
+
+from traits.testing.unittest_tools import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy_available = False
+else:
+    numpy_available = True
+
+from ..api import HasTraits, Int, TraitError
+
+if numpy_available:
+    from ..api import Array, ArrayOrNone, CArray
+
+    class Signal(HasTraits):
+
+        samples = Array(dtype='float64', shape=(1024,), copy_on_write=True)
+
+        weights = CArray(dtype='float32', value=[1, 2, 3],
+                         copy_on_write=True)
+
+        mask = ArrayOrNone(copy_on_write=True)
+
+        private = Array(dtype='float64', shape=(4,))
+
+        count = Int
+
+
+@unittest.skipUnless(numpy_available, "numpy not available")
+class TestArrayCopyOnWrite(unittest.TestCase):
+
+    def test_default_shared_and_read_only(self):
+        first, second = Signal(), Signal()
+        self.assertIs(first.samples, second.samples)
+        self.assertFalse(first.samples.flags.writeable)
+        with self.assertRaises(ValueError):
+            first.samples[0] = 1.0
+
+        numpy.testing.assert_array_equal(first.weights, [1, 2, 3])
+        self.assertEqual(first.weights.dtype, numpy.dtype('float32'))
+        self.assertIs(first.weights, second.weights)
+        self.assertIsNone(first.mask)
+
+        # Traits without 'copy_on_write' still get private writeable copies:
+        self.assertIsNot(first.private, second.private)
+        first.private[0] = 1.0
+
+    def test_user_default_not_modified(self):
+        value = numpy.arange(3.0)
+
+        class Model(HasTraits):
+            data = Array(value=value, copy_on_write=True)
+
+        self.assertFalse(Model().data.flags.writeable)
+        self.assertTrue(value.flags.writeable)
+
+    def test_writeable_copy(self):
+        first, second = Signal(), Signal()
+        events = []
+        first.on_trait_change(lambda: events.append(True), 'samples')
+        samples = first.trait_array_writeable('samples')
+        self.assertIs(first.samples, samples)
+        self.assertIsNot(samples, second.samples)
+        samples[0] = 2.0
+        self.assertEqual(second.samples[0], 0.0)
+        self.assertEqual(events, [])
+
+        # Subsequent requests return the same private copy:
+        self.assertIs(first.trait_array_writeable('samples'), samples)
+
+        # The shared default is restored by resetting the trait:
+        first.reset_traits(['samples'])
+        self.assertIs(first.samples, second.samples)
+
+    def test_assignment_replaces_default(self):
+        signal = Signal()
+        value = numpy.ones(1024)
+        signal.samples = value
+        self.assertIs(signal.samples, value)
+        self.assertIs(signal.trait_array_writeable('samples'), value)
+        self.assertIsNone(signal.trait_array_writeable('mask'))
+
+    def test_not_an_array(self):
+        with self.assertRaises(TraitError):
+            Signal().trait_array_writeable('count')
+        with self.assertRaises(TraitError):
+            Signal().trait_array_writeable('missing')
+
+
+if __name__ == '__main__':
+    unittest.main()
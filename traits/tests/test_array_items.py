@@ -0,0 +1,120 @@
+#  Test the items events of in-place updates of Array traits.
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  License included in /LICENSE.txt and may be redistributed only under the
+#  conditions described in the aforementioned license.  The license is also
+#  available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+from __future__ import absolute_import
+
+from traits.testing.unittest_tools import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy_available = False
+else:
+    numpy_available = True
+
+from ..api import HasTraits, Float, Property, Str, TraitError
+
+if numpy_available:
+    from ..api import Array, ArrayOrNone, TraitArrayEvent
+
+    class Series(HasTraits):
+
+        data = Array(dtype='float64', shape=(None,))
+
+        grid = Array(dtype='int32', shape=(3, 3), items=False)
+
+        mask = ArrayOrNone
+
+        shared = Array(dtype='float64', shape=(4,), copy_on_write=True)
+
+        # Incrementally updated sum of 'data':
+        total = Float
+
+        label = Str
+
+        updates = Property(depends_on='data, data_items')
+
+        def _data_changed(self, new):
+            self.total = new.sum()
+
+        def _data_items_changed(self, event):
+            self.total += event.added.sum() - event.removed.sum()
+
+        def _get_updates(self):
+            return self.total
+
+
+@unittest.skipUnless(numpy_available, "numpy not available")
+class TestArrayItems(unittest.TestCase):
+
+    def test_items_event(self):
+        series = Series(data=numpy.arange(10.0))
+        self.assertEqual(series.total, 45.0)
+        events = []
+        series.on_trait_change(
+            lambda object, name, old, new: events.append((name, new)),
+            'data_items')
+        data = series.data
+        series.trait_array_update('data', slice(2, 4), [10.0, 20.0])
+        self.assertIs(series.data, data)
+        self.assertEqual(list(data[:5]), [0.0, 1.0, 10.0, 20.0, 4.0])
+        self.assertEqual(series.total, 70.0)
+
+        name, event = events[0]
+        self.assertEqual(name, 'data_items')
+        self.assertIsInstance(event, TraitArrayEvent)
+        self.assertEqual(event.index, slice(2, 4))
+        self.assertEqual(list(event.removed), [2.0, 3.0])
+        self.assertEqual(list(event.added), [10.0, 20.0])
+
+        series.trait_array_update('data', [0, 9], 1.0)
+        self.assertEqual(series.total, 63.0)
+        self.assertEqual(list(events[1][1].removed), [0.0, 9.0])
+
+    def test_property_depends_on_items(self):
+        series = Series(data=numpy.zeros(3))
+        values = []
+        series.on_trait_change(lambda new: values.append(new), 'updates')
+        series.trait_array_update('data', 1, 5.0)
+        self.assertEqual(values, [5.0])
+
+    def test_unobserved_and_disabled(self):
+        series = Series()
+        series.trait_array_update('grid', (1, slice(None)), 7)
+        self.assertEqual(series.grid.sum(), 21)
+        self.assertNotIn('grid_items', series.trait_names())
+
+        class Plain(HasTraits):
+            data = Array(dtype='float64')
+
+        plain = Plain(data=numpy.zeros(4))
+        plain.trait_array_update('data', slice(None), 2.0)
+        self.assertEqual(plain.data.sum(), 8.0)
+
+    def test_copy_on_write_default(self):
+        first, second = Series(), Series()
+        first.trait_array_update('shared', 0, 3.0)
+        self.assertEqual(first.shared[0], 3.0)
+        self.assertEqual(second.shared[0], 0.0)
+        self.assertFalse(second.shared.flags.writeable)
+
+    def test_errors(self):
+        series = Series()
+        with self.assertRaises(TraitError):
+            series.trait_array_update('mask', 0, 1)
+        with self.assertRaises(TraitError):
+            series.trait_array_update('label', 0, 1)
+        with self.assertRaises(IndexError):
+            series.trait_array_update('data', 5, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
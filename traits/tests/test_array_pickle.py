@@ -0,0 +1,117 @@
+#  Test pickling array traits using out-of-band (pickle protocol 5) buffers.
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  License included in /LICENSE.txt and may be redistributed only under the
+#  conditions described in the aforementioned license.  The license is also
+#  available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+from __future__ import absolute_import
+
+import pickle
+
+from traits.testing.unittest_tools import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy_available = False
+else:
+    numpy_available = True
+
+from ..api import Array, ArrayOrNone, CArray, HasTraits, TraitError
+from ..trait_numeric import ArrayBuffer, PickleBuffer
+
+out_of_band_available = (numpy_available and (PickleBuffer is not None) and
+                         (pickle.HIGHEST_PROTOCOL >= 5))
+
+
+if numpy_available:
+    # Use of `Array` requires NumPy to be installed.
+
+    class Model(HasTraits):
+
+        data = Array(dtype='float64')
+
+        grid = CArray(dtype='int32', shape=(None, None))
+
+        mask = ArrayOrNone
+
+        items = Array(dtype=object)
+
+    class TrustedModel(Model):
+
+        __trusted_restore__ = True
+
+
+@unittest.skipUnless(out_of_band_available,
+                     "numpy or pickle protocol 5 not available")
+class ArrayPickleTestCase(unittest.TestCase):
+
+    def dumps(self, obj):
+        buffers = []
+        data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        return data, buffers
+
+    def test_arrays_out_of_band(self):
+        for klass in (Model, TrustedModel):
+            model = klass(data=numpy.arange(1000.0),
+                          grid=numpy.ones((10, 20), dtype='int32').T)
+            data, buffers = self.dumps(model)
+            self.assertEqual(len(buffers), 2)
+            self.assertLess(len(data), 1000)
+
+            copy = pickle.loads(data, buffers=buffers)
+            self.assertTrue(numpy.shares_memory(copy.data, model.data))
+            self.assertTrue(numpy.shares_memory(copy.grid, model.grid))
+            numpy.testing.assert_array_equal(copy.data, model.data)
+            numpy.testing.assert_array_equal(copy.grid, model.grid)
+            self.assertEqual(copy.grid.shape, (20, 10))
+            self.assertIsNone(copy.mask)
+
+    def test_restored_from_raw_buffers(self):
+        model = Model(data=numpy.arange(10.0))
+        data, buffers = self.dumps(model)
+        raw = [bytearray(buffer.raw()) for buffer in buffers]
+        copy = pickle.loads(data, buffers=raw)
+        numpy.testing.assert_array_equal(copy.data, model.data)
+        self.assertTrue(numpy.shares_memory(copy.data,
+                                            numpy.frombuffer(raw[0])))
+
+    def test_unbuffered_arrays_in_band(self):
+        model = Model(data=numpy.arange(20.0)[::2],
+                      items=numpy.array([None, 'a'], dtype=object))
+        data, buffers = self.dumps(model)
+        # Only the (contiguous) default 'grid' array is out-of-band:
+        self.assertEqual(len(buffers), 1)
+        copy = pickle.loads(data, buffers=buffers)
+        numpy.testing.assert_array_equal(copy.data, model.data)
+        self.assertEqual(list(copy.items), [None, 'a'])
+
+    def test_earlier_protocols_unchanged(self):
+        model = Model(data=numpy.arange(10.0))
+        state = model.__reduce_ex__(4)[2]
+        self.assertIs(type(state['data']), numpy.ndarray)
+        state = model.__reduce_ex__(5)[2]
+        self.assertIsInstance(state['data'], ArrayBuffer)
+
+    def test_validate_accepts_buffers(self):
+        model = Model()
+        source = numpy.arange(5.0)
+        model.data = memoryview(source)
+        self.assertTrue(numpy.shares_memory(model.data, source))
+        model.data = PickleBuffer(source)
+        self.assertTrue(numpy.shares_memory(model.data, source))
+
+        # Buffers of other types have their items converted:
+        model.data = memoryview(b'abc')
+        self.assertEqual(model.data.tolist(), [97.0, 98.0, 99.0])
+        with self.assertRaises(TraitError):
+            model.grid = memoryview(b'abc')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+#  Test the validation of Array trait values.
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  License included in /LICENSE.txt and may be redistributed only under the
+#  conditions described in the aforementioned license.  The license is also
+#  available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+from __future__ import absolute_import
+
+from array import array
+
+from traits.testing.unittest_tools import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy_available = False
+else:
+    numpy_available = True
+
+from ..api import HasTraits, TraitError
+
+if numpy_available:
+    from ..api import Array, CArray
+
+    class Model(HasTraits):
+
+        data = Array(dtype='float64')
+
+        grid = CArray(dtype='int32', shape=(None, (2, 4)))
+
+        fixed = Array(shape=(3,))
+
+
+@unittest.skipUnless(numpy_available, "numpy not available")
+class TestArrayValidate(unittest.TestCase):
+
+    def test_conforming_arrays_not_copied(self):
+        model = Model()
+        stats = model.trait('data').copy_stats
+        stats.reset()
+        value = numpy.arange(10.0)
+        model.data = value
+        self.assertIs(model.data, value)
+        self.assertFalse(stats.copied)
+
+        grid = numpy.zeros((5, 3), dtype='int32')
+        model.grid = grid
+        self.assertIs(model.grid, grid)
+        self.assertFalse(model.trait('grid').copy_stats.copied)
+
+    def test_buffers_not_copied(self):
+        model = Model()
+        stats = model.trait('data').copy_stats
+
+        # Multi-dimensional buffers keep their shape:
+        grid = numpy.zeros((2, 3))
+        model.data = memoryview(grid)
+        self.assertEqual(model.data.shape, (2, 3))
+        self.assertFalse(stats.copied)
+        model.data[1, 2] = 5.0
+        self.assertEqual(grid[1, 2], 5.0)
+
+    def test_resizable_buffers_copied(self):
+        model = Model()
+        stats = model.trait('data').copy_stats
+        source = array('d', [1.0, 2.0])
+        model.data = source
+        self.assertEqual(model.data.tolist(), [1.0, 2.0])
+        self.assertTrue(stats.copied)
+
+        # The source can still be resized, without affecting the value:
+        source.extend([3.0] * 100000)
+        source[0] = 5.0
+        self.assertEqual(model.data.tolist(), [1.0, 2.0])
+
+        source = bytearray(b'\x01\x02\x03')
+        model.fixed = source
+        self.assertEqual(model.fixed.tolist(), [1, 2, 3])
+        self.assertTrue(model.trait('fixed').copy_stats.copied)
+        source.extend(b'\x00' * 100000)
+        self.assertEqual(model.fixed.tolist(), [1, 2, 3])
+
+    def test_buffers_converted(self):
+        model = Model()
+        stats = model.trait('data').copy_stats
+
+        # The items of buffers of other types are converted, not
+        # reinterpreted:
+        for source in (array('i', [1, 2]), bytearray(b'\x01\x02')):
+            model.data = source
+            self.assertEqual(model.data.tolist(), [1.0, 2.0])
+            self.assertTrue(stats.copied)
+
+    def test_copies_reported(self):
+        model = Model()
+        stats = model.trait('data').copy_stats
+        stats.reset()
+        model.data = [1, 2, 3]
+        self.assertTrue(stats.copied)
+        model.data = numpy.arange(3)
+        self.assertTrue(stats.copied)
+        self.assertEqual(model.data.dtype, numpy.dtype('float64'))
+        model.data = numpy.arange(3.0)
+        self.assertFalse(stats.copied)
+        self.assertEqual((stats.validated, stats.copies), (3, 2))
+
+    def test_shape_bounds(self):
+        model = Model()
+        model.grid = numpy.zeros((0, 2))
+        model.grid = numpy.zeros((7, 4))
+        for shape in ((7, 1), (7, 5), (7,), (1, 2, 3)):
+            with self.assertRaises(TraitError):
+                model.grid = numpy.zeros(shape)
+
+        model.fixed = [1, 2, 3]
+        with self.assertRaises(TraitError):
+            model.fixed = [1, 2]
+        with self.assertRaises(TraitError):
+            model.fixed = 'abc'
+
+
+if __name__ == '__main__':
+    unittest.main()
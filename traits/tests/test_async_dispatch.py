@@ -0,0 +1,147 @@
+#  Test the 'async' dispatch mode for trait change notifications.
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  License included in /LICENSE.txt and may be redistributed only under the
+#  conditions described in the aforementioned license.  The license is also
+#  available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+from __future__ import absolute_import
+
+import sys
+import threading
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import (HasTraits, Int, TraitNotificationError, on_trait_change,
+    pop_exception_handler, push_exception_handler, set_async_event_loop,
+    wait_for_async_notifications)
+from ..trait_notifiers import asyncio
+
+coroutines_available = sys.version_info >= (3, 5)
+
+if coroutines_available:
+    # Coroutine functions are defined from source so that this module still
+    # compiles on versions of Python without 'async def'.
+    namespace = {'asyncio': asyncio}
+    exec("""
+async def record_slowly(events, new):
+    events.append(('start', new))
+    await asyncio.sleep(0.01 * new)
+    events.append(('end', new))
+""", namespace)
+    record_slowly = namespace['record_slowly']
+
+
+class Model(HasTraits):
+
+    value = Int
+
+    events = Int
+
+    @on_trait_change('value', dispatch='async')
+    def _count_value(self):
+        self.events += 1
+
+
+@unittest.skipIf(asyncio is None, "asyncio not available")
+class TestAsyncDispatch(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        set_async_event_loop(self.loop)
+        push_exception_handler(reraise_exceptions=True)
+
+    def tearDown(self):
+        pop_exception_handler()
+        set_async_event_loop(None)
+        self.loop.close()
+
+    def drain(self):
+        self.loop.run_until_complete(wait_for_async_notifications())
+
+    def test_handlers_run_on_loop_in_order(self):
+        model = Model()
+        changes = []
+        model.on_trait_change(lambda name, new: changes.append(new), 'value',
+                              dispatch='async')
+        model.value = 1
+        model.value = 2
+        self.assertEqual(changes, [])
+        self.assertEqual(model.events, 0)
+
+        self.drain()
+        self.assertEqual(changes, [1, 2])
+        self.assertEqual(model.events, 2)
+
+        # Draining with nothing pending completes immediately:
+        self.drain()
+
+    def test_notifications_from_other_threads(self):
+        model = Model()
+        threads = []
+        model.on_trait_change(
+            lambda: threads.append(threading.current_thread()), 'value',
+            dispatch='async')
+        thread = threading.Thread(target=setattr, args=(model, 'value', 5))
+        thread.start()
+        thread.join()
+        self.drain()
+        self.assertEqual(threads, [threading.current_thread()])
+
+    @unittest.skipUnless(coroutines_available, "coroutines not available")
+    def test_coroutine_handlers_ordered_per_object(self):
+        first, second = Model(), Model()
+        events = []
+        for model in (first, second):
+            model.on_trait_change(
+                lambda new: record_slowly(events, new), 'value',
+                dispatch='async')
+
+        first.value = 1
+        first.value = 2
+        second.value = 3
+        self.drain()
+
+        # Each notification completes before the next one for the same object
+        # starts:
+        first_events = [event for event in events if event[1] != 3]
+        self.assertEqual(first_events, [('start', 1), ('end', 1),
+                                        ('start', 2), ('end', 2)])
+
+        # Notifications for other objects are not held up:
+        self.assertEqual(events[:2], [('start', 1), ('start', 3)])
+
+    def test_exceptions_raised_when_draining(self):
+        model = Model()
+        changes = []
+
+        def handler(new):
+            if new == 1:
+                raise ZeroDivisionError()
+            changes.append(new)
+
+        model.on_trait_change(handler, 'value', dispatch='async')
+        model.value = 1
+        model.value = 2
+        with self.assertRaises(ZeroDivisionError):
+            self.drain()
+
+        # Later notifications still run:
+        self.assertEqual(changes, [2])
+        self.drain()
+
+    def test_no_event_loop(self):
+        set_async_event_loop(None)
+        model = Model()
+        with self.assertRaises(TraitNotificationError):
+            model.value = 1
+        with self.assertRaises(TraitNotificationError):
+            wait_for_async_notifications()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+#  Test the 'batch_update' interface to the HasTraits class.
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  License included in /LICENSE.txt and may be redistributed only under the
+#  conditions described in the aforementioned license.  The license is also
+#  available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+from __future__ import absolute_import
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import (Event, HasTraits, Int, Property, Str, TraitError,
+    cached_property)
+
+
+class Record(HasTraits):
+
+    count = Int
+
+    label = Str
+
+    ping = Event
+
+    summary = Property(depends_on='count, label')
+
+    changes = Int
+
+    @cached_property
+    def _get_summary(self):
+        return '%s:%s' % (self.label, self.count)
+
+    def _count_changed(self):
+        self.changes += 1
+
+
+class TestBatchUpdate(unittest.TestCase):
+
+    def setUp(self):
+        self.events = []
+
+    def record(self, object, name, old, new):
+        self.events.append((object, name, old, new))
+
+    def test_notifications_deferred_and_coalesced(self):
+        obj = Record()
+        obj.on_trait_change(self.record, 'count')
+
+        with obj.batch_update():
+            obj.count = 1
+            obj.count = 2
+            obj.count = 3
+            self.assertEqual(obj.count, 3)
+            self.assertEqual(self.events, [])
+            self.assertEqual(obj.changes, 0)
+
+        self.assertEqual(self.events, [(obj, 'count', 0, 3)])
+        self.assertEqual(obj.changes, 1)
+
+    def test_values_validated_immediately(self):
+        obj = Record()
+        with obj.batch_update():
+            with self.assertRaises(TraitError):
+                obj.count = 'not an int'
+
+        self.assertEqual(obj.count, 0)
+
+    def test_unchanged_trait_not_notified(self):
+        obj = Record(count=5)
+        obj.on_trait_change(self.record, 'count')
+
+        with obj.batch_update():
+            obj.count = 6
+            obj.count = 5
+
+        self.assertEqual(self.events, [])
+
+    def test_notification_order(self):
+        obj = Record()
+        obj.on_trait_change(self.record, 'count, label')
+
+        with obj.batch_update():
+            obj.label = 'a'
+            obj.count = 1
+            obj.label = 'b'
+
+        self.assertEqual(self.events, [(obj, 'label', '', 'b'),
+                                       (obj, 'count', 0, 1)])
+
+    def test_events_not_coalesced(self):
+        obj = Record()
+        obj.on_trait_change(self.record, 'ping')
+
+        with obj.batch_update():
+            obj.ping = 1
+            obj.ping = 2
+
+        self.assertEqual([event[3] for event in self.events], [1, 2])
+
+    def test_property_depends_on(self):
+        obj = Record()
+        obj.on_trait_change(self.record, 'summary')
+
+        with obj.batch_update():
+            for i in range(10):
+                obj.count = i
+            obj.label = 'x'
+
+        self.assertEqual(self.events[-1][3], 'x:9')
+        self.assertLessEqual(len(self.events), 2)
+
+    def test_nested(self):
+        obj = Record()
+        obj.on_trait_change(self.record, 'count')
+
+        with obj.batch_update():
+            with obj.batch_update():
+                obj.count = 1
+            self.assertEqual(self.events, [])
+            obj.count = 2
+
+        self.assertEqual(self.events, [(obj, 'count', 0, 2)])
+        self.assertNotIn('__batch_notifications__', obj.__dict__)
+
+    def test_flushed_on_exception(self):
+        obj = Record()
+        obj.on_trait_change(self.record, 'count')
+
+        with self.assertRaises(ZeroDivisionError):
+            with obj.batch_update():
+                obj.count = 1
+                1 / 0
+
+        self.assertEqual(self.events, [(obj, 'count', 0, 1)])
+
+        # Notifications are sent normally after the batch update ends:
+        obj.count = 2
+        self.assertEqual(self.events[-1], (obj, 'count', 1, 2))
+
+    def test_batch_update_all(self):
+        objs = [Record() for i in range(3)]
+        for obj in objs:
+            obj.on_trait_change(self.record, 'count')
+
+        with HasTraits.batch_update_all(objs):
+            for i in range(5):
+                for obj in objs:
+                    obj.count = i + 1
+            self.assertEqual(self.events, [])
+
+        self.assertEqual(self.events, [(obj, 'count', 0, 5) for obj in objs])
+
+    def test_handler_changes_sent_immediately(self):
+        first = Record()
+        second = Record()
+        second.on_trait_change(self.record, 'count')
+
+        def copy_count(new):
+            second.count = new
+
+        first.on_trait_change(copy_count, 'count')
+
+        with HasTraits.batch_update_all([first, second]):
+            first.count = 7
+
+        self.assertEqual(self.events, [(second, 'count', 0, 7)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,204 @@
+#  Test the 'HasCompactTraits' class and compact trait value storage.
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  License included in /LICENSE.txt and may be redistributed only under the
+#  conditions described in the aforementioned license.  The license is also
+#  available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+from __future__ import absolute_import
+
+import pickle
+import struct
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import (DelegatesTo, Event, Float, HasCompactTraits, HasTraits,
+    Instance, Int, List, Property, Str, TraitError, Trait)
+
+
+class Point(HasCompactTraits):
+
+    x = Int
+
+    y = Int(5)
+
+    name = Str
+
+    tags = List(Str)
+
+    moved = Event
+
+    norm = Property(depends_on='x, y')
+
+    changes = Int
+
+    def _get_norm(self):
+        return abs(self.x) + abs(self.y)
+
+    def _x_changed(self):
+        self.changes += 1
+
+
+class Point3D(Point):
+
+    z = Int
+
+
+class Shape(HasTraits):
+
+    __compact_traits__ = True
+
+    origin = Instance(Point, ())
+
+    name = DelegatesTo('origin')
+
+    size = Trait('small', {'small': 1, 'large': 10})
+
+
+class Loose(Point):
+
+    __compact_traits__ = False
+
+    w = Int
+
+
+class TestCompactTraits(unittest.TestCase):
+
+    def setUp(self):
+        self.events = []
+
+    def record(self, object, name, old, new):
+        self.events.append((name, old, new))
+
+    def test_values_not_stored_in_dict(self):
+        p = Point(x=1)
+        self.assertEqual(p.x, 1)
+        self.assertEqual(p.y, 5)
+        self.assertNotIn('x', p.__dict__)
+        self.assertNotIn('y', p.__dict__)
+
+    def test_slots_assigned(self):
+        slots = [Point.__class_traits__[name].value_slot()
+                 for name in ('x', 'y', 'name', 'tags', 'changes')]
+        self.assertEqual(len(set(slots)), 5)
+        self.assertTrue(min(slots) >= HasTraits.__basicsize__)
+        self.assertEqual(Point.__class_traits__['moved'].value_slot(), -1)
+        self.assertEqual(Point.__class_traits__['norm'].value_slot(), -1)
+
+    def test_instance_size(self):
+        # Only compact classes grow, by one pointer per slot:
+        class Plain(HasTraits):
+            x = Int
+
+        pointer = struct.calcsize('P')
+        self.assertEqual(Plain.__basicsize__, HasTraits.__basicsize__)
+        self.assertEqual(Point.__basicsize__,
+                         HasTraits.__basicsize__ + 5 * pointer)
+        self.assertEqual(Point3D.__basicsize__,
+                         Point.__basicsize__ + pointer)
+
+    def test_validation(self):
+        p = Point()
+        with self.assertRaises(TraitError):
+            p.x = 'not an int'
+        self.assertEqual(p.x, 0)
+
+    def test_notifications(self):
+        p = Point()
+        p.on_trait_change(self.record, 'x')
+        p.x = 3
+        p.x = 3
+        self.assertEqual(p.changes, 1)
+        self.assertEqual(self.events, [('x', 0, 3)])
+
+    def test_property_depends_on(self):
+        p = Point()
+        self.assertEqual(p.norm, 5)
+        p.on_trait_change(self.record, 'norm')
+        p.x = 3
+        self.assertEqual(self.events[-1][2], 8)
+
+    def test_delete_resets_default(self):
+        p = Point(y=2)
+        p.on_trait_change(self.record, 'y')
+        del p.y
+        self.assertEqual(p.y, 5)
+        self.assertEqual(self.events, [('y', 2, 5)])
+
+    def test_mutable_default_cached(self):
+        p = Point()
+        p.tags.append('a')
+        self.assertEqual(p.tags, ['a'])
+        self.assertEqual(Point().tags, [])
+
+    def test_subclass_extends_layout(self):
+        p = Point3D(x=1, z=2)
+        self.assertEqual((p.x, p.y, p.z), (1, 5, 2))
+        self.assertEqual(Point3D.__class_traits__['x'].value_slot(),
+                         Point.__class_traits__['x'].value_slot())
+        self.assertNotIn(Point3D.__class_traits__['z'].value_slot(),
+                         [Point.__class_traits__[name].value_slot()
+                          for name in Point.class_trait_names()])
+
+    def test_opt_out(self):
+        l = Loose(x=1, w=2)
+        self.assertEqual((l.x, l.w), (1, 2))
+        self.assertEqual(l.__dict__['x'], 1)
+        self.assertEqual(l.__dict__['w'], 2)
+
+    def test_reused_slot_trait(self):
+        class Other(HasTraits):
+            x = Point.class_traits()['x']
+
+        o = Other(x=3)
+        self.assertEqual(o.x, 3)
+        self.assertEqual(o.__dict__['x'], 3)
+        self.assertEqual(Other.__class_traits__['x'].value_slot(), -1)
+
+    def test_delegate_and_mapped(self):
+        s = Shape()
+        s.origin.name = 'a'
+        self.assertEqual(s.name, 'a')
+        s.size = 'large'
+        self.assertEqual(s.size_, 10)
+
+    def test_add_trait_replaces_slotted_trait(self):
+        p = Point(x=4)
+        p.add_trait('x', Int(0))
+        self.assertEqual(p.x, 4)
+        p.x = 6
+        self.assertEqual(p.x, 6)
+        self.assertEqual(Point().x, 0)
+
+    def test_add_and_remove_slotted_trait(self):
+        p = Point()
+        p.add_trait('y', Float)
+        p.y = 2.5
+        self.assertTrue(p.remove_trait('y'))
+        self.assertFalse(p._trait_has_value('y'))
+        self.assertEqual(p.y, 5)
+        p.y = 7
+        self.assertEqual(Point().y, 5)
+
+    def test_dynamic_traits(self):
+        p = Point()
+        p.add_trait('extra', Int(3))
+        p.extra = 4
+        self.assertEqual(p.__dict__['extra'], 4)
+        Point3D.add_class_trait('more', Int(7))
+        p = Point3D()
+        self.assertEqual(p.more, 7)
+
+    def test_copy_and_pickle(self):
+        p = Point(x=1, y=2, name='p', tags=['a'])
+        for q in (p.clone_traits(), pickle.loads(pickle.dumps(p))):
+            self.assertEqual((q.x, q.y, q.name, q.tags),
+                             (1, 2, 'p', ['a']))
+
+
+if __name__ == '__main__':
+    unittest.main()
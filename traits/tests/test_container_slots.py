@@ -0,0 +1,82 @@
+#  Test the slot based storage of trait container objects and events.
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  License included in /LICENSE.txt and may be redistributed only under the
+#  conditions described in the aforementioned license.  The license is also
+#  available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+from __future__ import absolute_import
+
+import pickle
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import Dict, HasTraits, Int, List, Set
+from ..trait_handlers import (TraitDictEvent, TraitListEvent,
+    TraitListObject, TraitSetEvent)
+
+
+class Model(HasTraits):
+
+    values = List(Int)
+
+    unique = Set(Int)
+
+    table = Dict(Int, Int)
+
+
+class TestContainerSlots(unittest.TestCase):
+
+    def test_no_instance_dictionary(self):
+        model = Model(values=[1], unique=set([2]), table={3: 4})
+        for name in ('values', 'unique', 'table'):
+            value = getattr(model, name)
+            self.assertFalse(hasattr(value, '__dict__'))
+            self.assertIs(value.object(), model)
+            self.assertEqual(value.name, name)
+
+        for event in (TraitListEvent(), TraitSetEvent(), TraitDictEvent()):
+            self.assertFalse(hasattr(event, '__dict__'))
+
+    def test_items_name_shared(self):
+        first = Model(values=[1])
+        second = Model(values=[2])
+        self.assertEqual(first.values.name_items, 'values_items')
+        self.assertIs(first.values.name_items, second.values.name_items)
+
+    def test_pickle_round_trip(self):
+        model = Model(values=[1, 2], unique=set([3]), table={4: 5})
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            copy = pickle.loads(pickle.dumps(model, protocol))
+            self.assertEqual(copy.values, [1, 2])
+            self.assertEqual(copy.unique, set([3]))
+            self.assertEqual(copy.table, {4: 5})
+            self.assertIs(copy.values.object(), copy)
+            self.assertEqual(copy.table.name_items, 'table_items')
+
+    def test_legacy_state_restored(self):
+        value = TraitListObject.__new__(TraitListObject)
+        value.__setstate__({'name': 'values', 'name_items': 'values_items'})
+        self.assertEqual(value.name, 'values')
+        self.assertEqual(value.name_items, 'values_items')
+        self.assertIsNone(value.object())
+
+    def test_subclass_attributes_pickled(self):
+        model = Model()
+        value = Tagged(model.trait('values').handler, model, 'values', [1])
+        value.tag = 'a'
+        copy = pickle.loads(pickle.dumps(value, 2))
+        self.assertEqual((copy.tag, copy.name, list(copy)),
+                         ('a', 'values', [1]))
+
+
+class Tagged(TraitListObject):
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
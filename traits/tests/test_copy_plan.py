@@ -0,0 +1,168 @@
+#  Test the cached copy plans used by copy_traits and clone_traits.
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  License included in /LICENSE.txt and may be redistributed only under the
+#  conditions described in the aforementioned license.  The license is also
+#  available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+from __future__ import absolute_import
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import (Any, DelegatesTo, Event, HasTraits, Instance, Int, List,
+    Property, Str)
+
+
+class Part(HasTraits):
+
+    name = Str
+
+    size = Int
+
+
+class Model(HasTraits):
+
+    name = Str
+
+    part = Instance(Part)
+
+    parts = List(Part, copy='ref')
+
+    tags = List(Str, copy='shallow')
+
+    size = DelegatesTo('part')
+
+    label = Property(depends_on='name')
+
+    updated = Event
+
+    scratch = Any(transient=True)
+
+    def _get_label(self):
+        return self.name.upper()
+
+
+class Other(HasTraits):
+
+    name = Str
+
+    parts = List(Part)
+
+
+class TestCopyPlan(unittest.TestCase):
+
+    def test_plan_cached_per_class_pair(self):
+        model = Model()
+        model.copy_traits(Model(name='a'))
+        plans = Model.__dict__['__copy_plans__']
+        self.assertIn((Model, None), plans)
+        immediate, deferred, unassignable = plans[(Model, None)][1]
+        self.assertEqual(sorted(name for name, trait in immediate),
+                         ['name', 'part', 'parts', 'tags'])
+        self.assertEqual([name for name, trait in deferred], ['size'])
+
+        # The same plan is used for subsequent copies:
+        plan = plans[(Model, None)]
+        model.copy_traits(Model(name='b'))
+        self.assertIs(Model.__dict__['__copy_plans__'][(Model, None)], plan)
+
+        model.copy_traits(Other(name='c'), traits=['name', 'parts'])
+        self.assertIn((Other, ('name', 'parts')), plans)
+        self.assertEqual(model.name, 'c')
+
+    def test_copy_types(self):
+        parts = [Part(name='p')]
+        model = Model(name='m', part=Part(size=3), parts=parts, tags=['t'])
+        clone = model.clone_traits()
+        self.assertIs(clone.parts[0], parts[0])
+        self.assertEqual(clone.tags, ['t'])
+        self.assertIsNot(clone.tags, model.tags)
+        self.assertEqual(clone.size, 3)
+
+        clone = model.clone_traits(copy='deep')
+        self.assertIs(clone.parts[0], parts[0])
+        self.assertIsNot(clone.part, model.part)
+        self.assertEqual(clone.size, 3)
+
+        # Changes to the 'copy' metadata are used by existing plans:
+        Model.class_traits()['parts'].copy = 'deep'
+        try:
+            clone = model.clone_traits()
+        finally:
+            Model.class_traits()['parts'].copy = 'ref'
+        self.assertIsNot(clone.parts[0], parts[0])
+        self.assertEqual(clone.parts[0].name, 'p')
+
+    def test_unassignable(self):
+        model = Model()
+        self.assertEqual(model.copy_traits(Other(), traits=['name', 'size']),
+                         ['size'])
+        self.assertEqual(model.copy_traits(Other(), traits=['name', 'size']),
+                         ['size'])
+
+    def test_instance_traits_not_cached(self):
+        source = Model(name='a')
+        source.temp = 'x'
+        clone = source.clone_traits()
+        self.assertEqual((clone.name, clone.temp), ('a', 'x'))
+
+        target = Model()
+        target.add_trait('name', Str(copy='ref', transient=True))
+        target.copy_traits(Model(name='b'))
+        self.assertEqual(target.name, '')
+
+    def test_instance_listeners_cached(self):
+        # Instance traits created for listeners have the class traits'
+        # metadata, so they do not prevent plans being cached:
+        source = Model(name='a')
+        source.on_trait_change(lambda: None, 'name')
+        self.assertFalse(source._instance_traits_added())
+        self.assertFalse(source._has_instance_defined_traits())
+
+        target = Model()
+        target.add_trait('name', Str)
+        self.assertTrue(target._instance_traits_added())
+        self.assertFalse(target._has_instance_defined_traits())
+
+        Model.__copy_plans__ = None
+        Model().copy_traits(source)
+        self.assertEqual(len(Model.__copy_plans__), 1)
+
+    def test_add_class_trait_invalidates_plans(self):
+
+        class Local(Part):
+            pass
+
+        Local().clone_traits()
+        self.assertIsNotNone(Local.__dict__['__copy_plans__'])
+        Local.add_class_trait('weight', Int)
+        self.assertIsNone(Local.__dict__['__copy_plans__'])
+        self.assertEqual(Local(weight=4).clone_traits().weight, 4)
+
+    def test_source_class_change_detected(self):
+
+        class Source(HasTraits):
+            size = Int
+
+        class Target(HasTraits):
+            size = Int
+            weight = Int(copy='ref')
+
+        target = Target()
+        target.copy_traits(Source(size=1), traits=['size', 'weight'])
+        plans = Target.__dict__['__copy_plans__']
+        entry = plans[(Source, ('size', 'weight'))]
+        Source.add_class_trait('weight', Int)
+        self.assertEqual(
+            target.copy_traits(Source(size=2, weight=3),
+                               traits=['size', 'weight']), [])
+        self.assertEqual((target.size, target.weight), (2, 3))
+        self.assertIsNot(plans[(Source, ('size', 'weight'))], entry)
+
+
+if __name__ == '__main__':
+    unittest.main()
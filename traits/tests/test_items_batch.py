@@ -0,0 +1,150 @@
+#  Test the batching of trait container items events.
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  License included in /LICENSE.txt and may be redistributed only under the
+#  conditions described in the aforementioned license.  The license is also
+#  available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+from __future__ import absolute_import
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import (Dict, HasTraits, Int, List, NumericList, Property, Set,
+    Str)
+
+
+class Model(HasTraits):
+
+    values = List(Int)
+
+    samples = NumericList('d')
+
+    names = Set(Str)
+
+    table = Dict(Str, Int)
+
+    total = Property(depends_on='values[]')
+
+    def __init__(self, **traits):
+        # Set before the initial trait values, whose changes are recorded:
+        self.events = []
+        self.totals = 0
+        super(Model, self).__init__(**traits)
+
+    def _get_total(self):
+        return sum(self.values)
+
+    def _total_changed(self):
+        self.totals += 1
+
+    def _anytrait_changed(self, name, old, new):
+        if name.endswith('_items'):
+            self.events.append((name, new))
+
+
+def list_changes(model):
+    return [(event.index, event.removed, event.added)
+            for name, event in model.events]
+
+
+class TestItemsBatch(unittest.TestCase):
+
+    def test_list_append_run(self):
+        model = Model(values=[0])
+        with model.values.batch():
+            for i in range(1, 1000):
+                model.values.append(i)
+            self.assertEqual(model.events, [])
+            self.assertEqual(len(model.values), 1000)
+
+        self.assertEqual(list_changes(model), [(1, [], list(range(1, 1000)))])
+        # One change for the initial value, and one for the whole batch:
+        self.assertEqual(model.totals, 2)
+
+    def test_list_contiguous_changes(self):
+        model = Model(values=[0, 1, 2, 3, 4])
+        with model.values.batch():
+            model.values.pop()
+            model.values.pop()
+            del model.values[0]
+            model.values.insert(0, 7)
+            model.values.extend([8, 9])
+        self.assertEqual(list_changes(model),
+                         [(3, [3, 4], []), (0, [0], [7]), (3, [], [8, 9])])
+        self.assertEqual(model.values, [7, 1, 2, 8, 9])
+
+        # Replaying the events reproduces the changes:
+        values = [0, 1, 2, 3, 4]
+        for index, removed, added in list_changes(model):
+            values[index:index + len(removed)] = added
+        self.assertEqual(values, model.values)
+
+    def test_numeric_list(self):
+        model = Model()
+        with model.samples.batch():
+            model.samples.append(1.0)
+            model.samples.extend([2.0, 3.0])
+        self.assertEqual(list_changes(model), [(0, [], [1.0, 2.0, 3.0])])
+
+    def test_nested_batches(self):
+        model = Model()
+        with model.values.batch():
+            model.values.append(1)
+            with model.values.batch():
+                model.values.append(2)
+            self.assertEqual(model.events, [])
+        self.assertEqual(list_changes(model), [(0, [], [1, 2])])
+
+    def test_set_net_changes(self):
+        model = Model(names=set(['a', 'b']))
+        with model.names.batch():
+            model.names.add('c')
+            model.names.remove('a')
+            model.names.add('a')
+            model.names.discard('b')
+            model.names.add('d')
+            model.names.remove('d')
+        self.assertEqual(len(model.events), 1)
+        event = model.events[0][1]
+        self.assertEqual((event.removed, event.added),
+                         (set(['b']), set(['c'])))
+
+        # Batches without net changes send no event:
+        del model.events[:]
+        with model.names.batch():
+            model.names.add('x')
+            model.names.remove('x')
+        self.assertEqual(model.events, [])
+
+    def test_dict_net_changes(self):
+        model = Model(table={'a': 1, 'b': 2, 'c': 3})
+        with model.table.batch():
+            model.table['a'] = 10
+            model.table['a'] = 11
+            del model.table['b']
+            model.table['d'] = 4
+            model.table['e'] = 5
+            del model.table['e']
+            model.table.pop('c')
+            model.table['c'] = 30
+        self.assertEqual(len(model.events), 1)
+        event = model.events[0][1]
+        self.assertEqual(event.added, {'d': 4})
+        self.assertEqual(event.changed, {'a': 1, 'c': 3})
+        self.assertEqual(event.removed, {'b': 2})
+
+    def test_events_sent_after_error(self):
+        model = Model()
+        with self.assertRaises(ZeroDivisionError):
+            with model.values.batch():
+                model.values.append(1)
+                1 / 0
+        self.assertEqual(list_changes(model), [(0, [], [1])])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+#  Test that trait container items events are only created when observed.
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  License included in /LICENSE.txt and may be redistributed only under the
+#  conditions described in the aforementioned license.  The license is also
+#  available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+from __future__ import absolute_import
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import Dict, HasTraits, Int, List, Property, Set, TraitListEvent
+from .. import trait_handlers
+
+
+class Model(HasTraits):
+
+    values = List(Int)
+
+    members = Set(Int)
+
+    table = Dict(Int, Int)
+
+
+class StaticModel(Model):
+
+    def _values_items_changed(self, event):
+        self.events.append(event)
+
+    events = List
+
+
+class PropertyModel(Model):
+
+    total = Property(depends_on='values[]')
+
+    def _get_total(self):
+        return sum(self.values)
+
+
+class TestItemsObserved(unittest.TestCase):
+
+    def setUp(self):
+        # Count the list events created:
+        self.created = created = []
+
+        class CountingListEvent(TraitListEvent):
+            __slots__ = ()
+
+            def __init__(self, *args, **kw):
+                created.append(True)
+                super(CountingListEvent, self).__init__(*args, **kw)
+
+        self.original = trait_handlers.TraitListEvent
+        trait_handlers.TraitListEvent = CountingListEvent
+
+    def tearDown(self):
+        trait_handlers.TraitListEvent = self.original
+
+    def test_trait_items_observed(self):
+        model = Model()
+        self.assertFalse(model._trait_items_observed('values_items'))
+        # Unknown traits are reported as observed:
+        self.assertTrue(model._trait_items_observed('unknown_items'))
+
+        handler = lambda: None
+        model.on_trait_change(handler, 'values_items')
+        self.assertTrue(model._trait_items_observed('values_items'))
+        model.on_trait_change(handler, 'values_items', remove=True)
+        self.assertFalse(model._trait_items_observed('values_items'))
+
+        model.on_trait_change(handler)
+        self.assertTrue(model._trait_items_observed('values_items'))
+
+        self.assertTrue(StaticModel()._trait_items_observed('values_items'))
+
+    def test_unobserved_changes_create_no_events(self):
+        model = Model(values=[3, 1, 2], members=set([1]), table={1: 2})
+        model.values.append(4)
+        model.values.insert(0, 5)
+        model.values.extend([6, 7])
+        model.values[0] = 8
+        del model.values[-1]
+        model.values.remove(1)
+        model.values.pop()
+        model.values.sort()
+        model.values.reverse()
+        model.members.add(2)
+        model.members.clear()
+        model.table[3] = 4
+        del model.table[1]
+        self.assertEqual(model.values, [8, 4, 3, 2])
+        self.assertEqual(self.created, [])
+
+    def test_observed_changes(self):
+        model = StaticModel(values=[1])
+        model.values.append(2)
+        model.values.sort(reverse=True)
+        self.assertEqual([(e.index, e.removed, e.added) for e in model.events],
+                         [(1, [], [2]), (0, [1, 2], [2, 1])])
+
+        events = []
+        model = Model()
+        model.on_trait_change(lambda new: events.append(new), 'members_items')
+        model.members.add(1)
+        model.members.clear()
+        self.assertEqual([(e.removed, e.added) for e in events],
+                         [(set(), set([1])), (set([1]), set())])
+
+        model = PropertyModel(values=[1])
+        self.assertEqual(model.total, 1)
+        model.values.append(2)
+        self.assertEqual(model.total, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
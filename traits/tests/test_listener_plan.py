@@ -0,0 +1,94 @@
+#  Test the per-class listener installation plan of the HasTraits class.
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  License included in /LICENSE.txt and may be redistributed only under the
+#  conditions described in the aforementioned license.  The license is also
+#  available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+from __future__ import absolute_import
+
+import pickle
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import (Event, HasTraits, Int, List, Property,
+    on_trait_change)
+
+
+class Model(HasTraits):
+
+    value = Int
+
+    limit = Int
+
+    changed = Event(on_trait_change='value')
+
+    doubled = Property(depends_on='value')
+
+    log = List
+
+    def _get_doubled(self):
+        return self.value * 2
+
+    @on_trait_change('value')
+    def _log_value(self, new):
+        self.log.append(('pre', new))
+
+    @on_trait_change('value', post_init=True)
+    def _log_post_init(self, new):
+        self.log.append(('post', new))
+
+
+class SubModel(Model):
+
+    @on_trait_change('limit')
+    def _log_limit(self, new):
+        self.log.append(('limit', new))
+
+
+class TestListenerPlan(unittest.TestCase):
+
+    def test_plan_compiled_once_per_class(self):
+        Model()
+        plan = Model.__dict__['__listener_plan__']
+        Model()
+        self.assertIs(Model.__dict__['__listener_plan__'], plan)
+
+        pre_init, post_init = plan
+        self.assertEqual(sorted(name for _, name, _ in pre_init),
+                         ['_log_value', 'changed', 'doubled'])
+        self.assertEqual([name for _, name, _ in post_init],
+                         ['_log_post_init'])
+
+    def test_subclass_has_own_plan(self):
+        SubModel()
+        names = [name for _, name, _ in SubModel._trait_listener_plan()[0]]
+        self.assertIn('_log_limit', names)
+        self.assertNotIn(
+            '_log_limit',
+            [name for _, name, _ in Model._trait_listener_plan()[0]])
+
+    def test_listeners_installed(self):
+        model = Model(value=3)
+        self.assertEqual(model.log, [('pre', 3)])
+        events = []
+        model.on_trait_change(lambda: events.append('changed'), 'changed')
+        model.on_trait_change(lambda new: events.append(new), 'doubled')
+        model.value = 4
+        self.assertEqual(model.log, [('pre', 3), ('pre', 4), ('post', 4)])
+        self.assertIn('changed', events)
+        self.assertIn(8, events)
+
+    def test_unpickled_object_has_listeners(self):
+        model = pickle.loads(pickle.dumps(Model(value=1)))
+        del model.log[:]
+        model.value = 2
+        self.assertEqual(model.log, [('pre', 2), ('post', 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
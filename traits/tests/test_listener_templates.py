@@ -0,0 +1,104 @@
+#  Test the caching of parsed extended trait name listener patterns.
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  License included in /LICENSE.txt and may be redistributed only under the
+#  conditions described in the aforementioned license.  The license is also
+#  available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+from __future__ import absolute_import
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import (HasTraits, Instance, Int, List, TraitError,
+    on_trait_change, pop_exception_handler, push_exception_handler)
+from ..traits_listener import (DST_LISTENER, ListenerGroup, ListenerParser,
+    listener_templates, parse_listener)
+
+
+class Node(HasTraits):
+
+    value = Int
+
+    children = List(Instance('Node'))
+
+
+class Watcher(HasTraits):
+
+    root = Instance(Node, ())
+
+    changes = List
+
+    @on_trait_change('root.children:value')
+    def _value_updated(self, new):
+        self.changes.append(new)
+
+
+class TestListenerTemplates(unittest.TestCase):
+
+    def test_pattern_parsed_once(self):
+        pattern = 'root.[children, value]'
+        listener_templates.pop(pattern, None)
+        first = parse_listener(pattern)
+        template = listener_templates[pattern]
+        second = parse_listener(pattern)
+        self.assertIs(listener_templates[pattern], template)
+        self.assertIsInstance(template, tuple)
+        self.assertIsNot(first, second)
+        self.assertIsNot(first.next, second.next)
+
+    def test_values_bound(self):
+        handler = object()
+        listener = parse_listener('root.[children, value]', handler=handler,
+                                  type=DST_LISTENER, dispatch='same',
+                                  priority=True, deferred=True)
+        group = listener.next
+        self.assertIsInstance(group, ListenerGroup)
+        for item in [listener] + group.items:
+            self.assertIs(item.handler, handler)
+            self.assertEqual(item.dispatch, 'same')
+            self.assertTrue(item.priority)
+
+        # Only the top level item gets the type and deferred values:
+        self.assertEqual(listener.type, DST_LISTENER)
+        self.assertTrue(listener.deferred)
+        for item in group.items:
+            self.assertNotEqual(item.type, DST_LISTENER)
+            self.assertFalse(item.deferred)
+
+    def test_copy_matches_parse(self):
+        for pattern in ('a.b', 'a:[b, c].d', 'a.+meta', 'a.b*', 'a.b[]',
+                        'a.-', 'children*.value'):
+            self.assertEqual(repr(parse_listener(pattern)),
+                             repr(ListenerParser(pattern).listener))
+
+    def test_cyclic_pattern_copied(self):
+        listener = parse_listener('children*.value')
+        self.assertIsInstance(listener, ListenerGroup)
+        self.assertIs(listener.items[1].next, listener)
+
+    def test_invalid_pattern_not_cached(self):
+        push_exception_handler(reraise_exceptions=True)
+        try:
+            with self.assertRaises(TraitError):
+                parse_listener('a.[b')
+        finally:
+            pop_exception_handler()
+        self.assertNotIn('a.[b', listener_templates)
+
+    def test_instances_listen_independently(self):
+        first = Watcher()
+        second = Watcher()
+        first.root.children = [Node()]
+        second.root.children = [Node()]
+        first.root.children[0].value = 1
+        second.root.children[0].value = 2
+        self.assertEqual(first.changes, [1])
+        self.assertEqual(second.changes, [2])
+
+
+if __name__ == '__main__':
+    unittest.main()
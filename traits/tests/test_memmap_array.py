@@ -0,0 +1,147 @@
+#  Test the MemmapArray trait type.
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  License included in /LICENSE.txt and may be redistributed only under the
+#  conditions described in the aforementioned license.  The license is also
+#  available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+from __future__ import absolute_import
+
+import os
+import pickle
+import shutil
+import tempfile
+
+from traits.testing.unittest_tools import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy_available = False
+else:
+    numpy_available = True
+
+from ..api import HasTraits, Str, TraitError
+
+if numpy_available:
+    from ..api import MemmapArray
+
+    class Dataset(HasTraits):
+
+        path = Str
+
+        data = MemmapArray('path', dtype='float64', shape=(None, 4))
+
+        raw_path = Str
+
+        raw = MemmapArray('raw_path', dtype='int32', shape=(None, 5),
+                          offset=8)
+
+
+@unittest.skipUnless(numpy_available, "numpy not available")
+class TestMemmapArray(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def save(self, name, array):
+        path = os.path.join(self.directory, name)
+        numpy.save(path, array)
+        return path
+
+    def test_lazily_mapped(self):
+        path = self.save('a.npy', numpy.arange(12.0).reshape(3, 4))
+        dataset = Dataset(path=path)
+        self.assertNotIn('data', dataset.__dict__)
+        self.assertIsInstance(dataset.data, numpy.memmap)
+        self.assertEqual(dataset.data.filename, os.path.abspath(path))
+        numpy.testing.assert_array_equal(dataset.data[2], [8, 9, 10, 11])
+        self.assertFalse(dataset.data.flags.writeable)
+
+    def test_path_change_resets_array(self):
+        dataset = Dataset(path=self.save('a.npy', numpy.zeros((2, 4))))
+        self.assertEqual(dataset.data.shape, (2, 4))
+        dataset.path = self.save('b.npy', numpy.ones((5, 4)))
+        self.assertNotIn('data', dataset.__dict__)
+        self.assertEqual(dataset.data.shape, (5, 4))
+
+        dataset.path = ''
+        self.assertNotIsInstance(dataset.data, numpy.memmap)
+
+    def test_path_change_resets_copies(self):
+        dataset = Dataset(path=self.save('a.npy', numpy.zeros((2, 4))))
+        dataset.data
+        assigned = Dataset(data=numpy.zeros((3, 4)))
+        for copy in (pickle.loads(pickle.dumps(dataset, 2)),
+                     dataset.clone_traits(), assigned):
+            copy.path = self.save('b.npy', numpy.ones((5, 4)))
+            self.assertEqual(copy.data.shape, (5, 4))
+            self.assertEqual(copy.data.filename, os.path.abspath(copy.path))
+
+    def test_subclass_resets_once(self):
+
+        class Derived(Dataset):
+            pass
+
+        self.assertEqual(len(Derived.class_traits()['path']._notifiers(True)),
+                         len(Dataset.class_traits()['path']._notifiers(True)))
+
+    def test_redefined_path_resets(self):
+
+        class Renamed(Dataset):
+
+            path = Str
+
+        renamed = Renamed(path=self.save('a.npy', numpy.zeros((2, 4))))
+        self.assertEqual(renamed.data.shape, (2, 4))
+        renamed.path = self.save('b.npy', numpy.ones((5, 4)))
+        self.assertEqual(renamed.data.shape, (5, 4))
+
+    def test_header_validated(self):
+        dataset = Dataset(path=self.save('a.npy', numpy.zeros((2, 3))))
+        with self.assertRaises(TraitError):
+            dataset.data
+        dataset = Dataset(path=self.save('b.npy', numpy.zeros((2, 4), 'f4')))
+        with self.assertRaises(TraitError):
+            dataset.data
+        with self.assertRaises(TraitError):
+            dataset.data = os.path.join(self.directory, 'missing.npy')
+
+    def test_raw_file(self):
+        path = os.path.join(self.directory, 'data.raw')
+        with open(path, 'wb') as fh:
+            fh.write(b'\0' * 8)
+            numpy.arange(20, dtype='int32').tofile(fh)
+        dataset = Dataset(raw_path=path)
+        self.assertEqual(dataset.raw.shape, (4, 5))
+        self.assertEqual(dataset.raw[1, 0], 5)
+
+    def test_pickled_as_location(self):
+        data = numpy.arange(4000.0).reshape(1000, 4)
+        dataset = Dataset(path=self.save('a.npy', data))
+        dataset.data
+        pickled = pickle.dumps(dataset, 2)
+        self.assertLess(len(pickled), data.nbytes // 10)
+        copy = pickle.loads(pickled)
+        self.assertIsInstance(copy.data, numpy.memmap)
+        numpy.testing.assert_array_equal(copy.data, data)
+
+        # Views of the mapped array are pickled as plain arrays:
+        view = pickle.loads(pickle.dumps(dataset.data[10:20], 2))
+        self.assertNotIsInstance(view, numpy.memmap)
+        numpy.testing.assert_array_equal(view, data[10:20])
+
+    def test_clone_shares_mapping(self):
+        dataset = Dataset(path=self.save('a.npy', numpy.zeros((2, 4))))
+        self.assertIs(dataset.clone_traits().data, dataset.data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+#  Test the per-class metadata index used by traits() and class_traits().
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  License included in /LICENSE.txt and may be redistributed only under the
+#  conditions described in the aforementioned license.  The license is also
+#  available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+from __future__ import absolute_import
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import Any, DelegatesTo, HasTraits, Instance, Int, Str
+from ..trait_base import is_none
+
+
+class Child(HasTraits):
+
+    name = Str
+
+
+class Parent(HasTraits):
+
+    child = Instance(Child, ())
+
+    name = DelegatesTo('child')
+
+    age = Int(transient=True)
+
+    weight = Int(units='kg')
+
+    temp_ = Any(transient=True)
+
+
+class Grandparent(Parent):
+
+    height = Int(units='cm')
+
+
+class TestMetadataIndex(unittest.TestCase):
+
+    def test_class_query_indexed(self):
+        names = sorted(Parent.class_trait_names(transient=is_none))
+        self.assertEqual(names, ['child', 'weight'])
+        index = Parent.__dict__['__metadata_index__']
+        key = (('transient', is_none),)
+        self.assertEqual(sorted(index[key]), names)
+
+        # Repeating the query uses the existing index entry:
+        size = len(index)
+        self.assertEqual(sorted(Parent.class_trait_names(transient=is_none)),
+                         names)
+        self.assertIs(Parent.__dict__['__metadata_index__'], index)
+        self.assertEqual(len(index), size)
+
+    def test_query_by_value(self):
+        self.assertEqual(Parent.class_trait_names(type='delegate'), ['name'])
+        self.assertEqual(sorted(Grandparent.class_trait_names(units=str)), [])
+        self.assertEqual(
+            sorted(Grandparent.class_trait_names(
+                units=lambda units: units is not None)),
+            ['height', 'weight'])
+
+    def test_unhashable_criteria_not_indexed(self):
+        names = Parent.class_trait_names(units=['kg'])
+        self.assertEqual(names, [])
+        index = Parent.__dict__['__metadata_index__'] or {}
+        self.assertNotIn((('units', ['kg']),), list(index))
+
+    def test_instance_traits_overlaid(self):
+        parent = Parent()
+        parent.add_trait('extra', Int(transient=True))
+        parent.add_trait('weight', Int(transient=True))
+        parent.temp_value = 3
+        names = sorted(parent.trait_names(transient=True))
+        self.assertEqual(names, ['age', 'extra', 'temp_value', 'trait_added',
+                                 'trait_modified', 'weight'])
+        self.assertNotIn('weight', Parent.class_trait_names(transient=True))
+
+    def test_add_class_trait_invalidates_index(self):
+
+        class Local(Parent):
+            pass
+
+        class SubLocal(Local):
+            pass
+
+        self.assertNotIn('size', SubLocal.class_trait_names(units='mm'))
+        Local.add_class_trait('size', Int(units='mm'))
+        self.assertEqual(Local.class_trait_names(units='mm'), ['size'])
+        self.assertEqual(SubLocal.class_trait_names(units='mm'), ['size'])
+        self.assertEqual(SubLocal().trait_names(units='mm'), ['size'])
+
+
+if __name__ == '__main__':
+    unittest.main()
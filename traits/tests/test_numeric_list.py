@@ -0,0 +1,143 @@
+#  Test the NumericList trait type.
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  License included in /LICENSE.txt and may be redistributed only under the
+#  conditions described in the aforementioned license.  The license is also
+#  available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+from __future__ import absolute_import
+
+import copy
+import pickle
+import sys
+from array import array
+
+from traits.testing.unittest_tools import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy_available = False
+else:
+    numpy_available = True
+
+from ..api import (HasTraits, NumericList, TraitError,
+    TraitNumericListObject)
+
+
+class Signal(HasTraits):
+
+    samples = NumericList('d', [1.0, 2.0])
+
+    counts = NumericList(int, maxlen=3)
+
+    levels = NumericList('f')
+
+    def __init__(self, **traits):
+        super(Signal, self).__init__(**traits)
+        self.events = []
+
+    def _samples_items_changed(self, event):
+        self.events.append((event.index, event.removed, event.added))
+
+
+class TestNumericList(unittest.TestCase):
+
+    def test_value(self):
+        signal = Signal()
+        self.assertIsInstance(signal.samples, TraitNumericListObject)
+        self.assertIsInstance(signal.samples, array)
+        self.assertEqual(signal.samples.typecode, 'd')
+        self.assertEqual(list(signal.samples), [1.0, 2.0])
+        self.assertEqual(signal.counts.typecode, 'l')
+
+        # Each object gets its own copy of the default value:
+        other = Signal()
+        signal.samples.append(3.0)
+        self.assertEqual(list(other.samples), [1.0, 2.0])
+
+    def test_items_events(self):
+        signal = Signal()
+        signal.samples.append(3)
+        signal.samples.extend((4.0, 5.0))
+        signal.samples[0] = 0.5
+        signal.samples[1:3] = [6.0]
+        del signal.samples[-1]
+        signal.samples.insert(-10, 7.0)
+        self.assertEqual(signal.events, [
+            (2, [], [3.0]), (3, [], [4.0, 5.0]), (0, [1.0], [0.5]),
+            (1, [2.0, 3.0], [6.0]), (3, [5.0], []), (0, [], [7.0])])
+        self.assertEqual(list(signal.samples), [7.0, 0.5, 6.0, 4.0])
+
+        del signal.events[:]
+        self.assertEqual(signal.samples.pop(), 4.0)
+        signal.samples.remove(0.5)
+        signal.samples.reverse()
+        self.assertEqual(signal.events, [(3, [4.0], []), (1, [0.5], []),
+                                         (0, [7.0, 6.0], [6.0, 7.0])])
+
+    def test_validation(self):
+        signal = Signal()
+        with self.assertRaises(TraitError):
+            signal.samples.append('a')
+        with self.assertRaises(TraitError):
+            signal.samples.extend([1.0, None])
+        with self.assertRaises(TraitError):
+            signal.counts = [1, 2.5]
+        with self.assertRaises(TraitError):
+            signal.counts = [1, 2, 3, 4]
+        with self.assertRaises(TraitError):
+            signal.samples = 'abc'
+        with self.assertRaises(TraitError):
+            NumericList('u')
+
+        # Failed changes leave the list unchanged:
+        self.assertEqual(list(signal.samples), [1.0, 2.0])
+        self.assertEqual(signal.events, [])
+
+    def test_assign_and_share(self):
+        signal = Signal(samples=(1, 2, 3))
+        signal.levels = signal.samples
+        self.assertEqual(signal.levels.typecode, 'f')
+        self.assertEqual(list(signal.levels), [1.0, 2.0, 3.0])
+
+    @unittest.skipIf(sys.version_info[0] < 3,
+                     "array.array has no memoryview support on Python 2")
+    def test_memoryview(self):
+        signal = Signal(samples=(1, 2, 3))
+        view = memoryview(signal.samples)
+        self.assertEqual(view.format, 'd')
+        self.assertEqual(len(view), 3)
+
+    def test_copy_and_pickle(self):
+        signal = Signal(samples=[3.0, 4.0])
+        for copied in (signal.clone_traits(), copy.deepcopy(signal),
+                       pickle.loads(pickle.dumps(signal, 2))):
+            self.assertIsNot(copied.samples, signal.samples)
+            self.assertEqual(list(copied.samples), [3.0, 4.0])
+            copied.samples.append(5.0)
+            self.assertEqual(copied.events[-1], (2, [], [5.0]))
+            self.assertEqual(list(signal.samples), [3.0, 4.0])
+
+    @unittest.skipUnless(numpy_available, "numpy not available")
+    def test_numpy_interop(self):
+        signal = Signal(samples=numpy.arange(4.0))
+        self.assertEqual(list(signal.samples), [0.0, 1.0, 2.0, 3.0])
+        signal.counts = numpy.arange(3)
+        self.assertEqual(list(signal.counts), [0, 1, 2])
+
+        # The array shares the list's buffer:
+        data = numpy.frombuffer(signal.samples)
+        data[0] = 10.0
+        self.assertEqual(signal.samples[0], 10.0)
+
+        self.assertEqual(NumericList('int32').typecode, 'i')
+        self.assertEqual(NumericList(numpy.float32).typecode, 'f')
+
+
+if __name__ == '__main__':
+    unittest.main()
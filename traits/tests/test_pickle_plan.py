@@ -0,0 +1,214 @@
+#  Test the cached pickling plans and trusted restores of HasTraits objects.
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  License included in /LICENSE.txt and may be redistributed only under the
+#  conditions described in the aforementioned license.  The license is also
+#  available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+from __future__ import absolute_import
+
+import pickle
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import (Any, Delegate, Enum, HasTraits, Instance, Int, List,
+    Range, Str, Trait, TraitError)
+
+
+class Part(HasTraits):
+
+    name = Str
+
+    count = Int
+
+    scratch = Any(transient=True)
+
+
+class Assembly(HasTraits):
+
+    __trusted_restore__ = True
+
+    name = Str
+
+    count = Int
+
+    parts = List(Part)
+
+    size = Trait('small', {'small': 1, 'large': 10})
+
+    scratch = Any(transient=True)
+
+    changes = Int(transient=True)
+
+    def _count_changed(self):
+        self.changes += 1
+
+
+class Holder(HasTraits):
+
+    part = Instance(Part, ())
+
+    name = Delegate('part', transient=False)
+
+
+def limited_class(high, colors):
+    """ Returns a new version of a class allowing trusted restores, whose
+        traits accept the specified values.
+    """
+    class Limited(HasTraits):
+
+        __trusted_restore__ = True
+
+        level = Range(0, high)
+
+        color = Enum(*colors)
+
+        levels = List(Range(0, high))
+
+    return Limited
+
+
+def linked_class():
+    """ Returns a new version of a class allowing trusted restores, with an
+        adapting trait.
+    """
+    class Linked(HasTraits):
+
+        __trusted_restore__ = True
+
+        part = Instance(Part, adapt='yes')
+
+        count = Int
+
+        changes = Int(transient=True)
+
+        def _count_changed(self):
+            self.changes += 1
+
+    return Linked
+
+
+class TestPicklePlan(unittest.TestCase):
+
+    def test_plan_cached_per_class(self):
+        Part().__getstate__()
+        plan = Part.__dict__['__pickle_plan__']
+        persisted, delegates, trusted, schema = plan
+        self.assertEqual(sorted(persisted), ['count', 'name'])
+        self.assertEqual(delegates, ())
+        self.assertEqual(trusted, ())
+        self.assertIsNone(schema)
+        Part().__getstate__()
+        self.assertIs(Part.__dict__['__pickle_plan__'], plan)
+
+    def test_state_matches_traits_query(self):
+        part = Part(name='a', count=2, scratch=3)
+        part.add_trait('extra', Int(4))
+        part.add_trait('count', Int(transient=True))
+        part.temp = 5
+        state = part.__getstate__()
+        del state['__traits_version__']
+        self.assertEqual(state, {'name': 'a', 'extra': 4, 'temp': 5})
+
+    def test_instance_listeners_do_not_change_state(self):
+        part = Part(name='a')
+        part.on_trait_change(lambda: None, 'count')
+        state = part.__getstate__()
+        self.assertEqual(state['count'], 0)
+        self.assertEqual(state['name'], 'a')
+
+    def test_delegates_persisted(self):
+        holder = Holder()
+        holder.name = 'local'
+        self.assertEqual(holder.__getstate__()['name'], 'local')
+        copy = pickle.loads(pickle.dumps(holder))
+        self.assertEqual(copy.name, 'local')
+
+    def test_trusted_plan(self):
+        persisted, delegates, trusted, schema = \
+            Assembly._trait_pickle_plan()
+        # Mapped traits are always validated:
+        self.assertEqual(trusted, ('count', 'name', 'parts'))
+        self.assertIsNotNone(schema)
+        self.assertEqual(Assembly().__getstate__()['__trait_schema__'],
+                         schema)
+
+    def test_trusted_restore(self):
+        assembly = Assembly(name='a', count=3, size='large',
+                            parts=[Part(name='p')])
+        copy = pickle.loads(pickle.dumps(assembly))
+        self.assertEqual((copy.name, copy.count, copy.size, copy.size_),
+                         ('a', 3, 'large', 10))
+        self.assertEqual(copy.parts[0].name, 'p')
+        self.assertEqual(copy.__dict__['count'], 3)
+
+        # Trusted values are stored without generating notifications:
+        self.assertEqual(copy.changes, 0)
+
+        # The restored container is linked to its new owner:
+        events = []
+        copy.on_trait_change(lambda: events.append(True), 'parts_items')
+        copy.parts.append(Part())
+        self.assertEqual(events, [True])
+
+    def test_schema_mismatch_validates(self):
+        state = Assembly(count=3).__getstate__()
+        state['__trait_schema__'] = 'other'
+        copy = Assembly.__new__(Assembly)
+        copy.__setstate__(state)
+        self.assertEqual(copy.count, 3)
+        self.assertEqual(copy.changes, 1)
+
+    def test_schema_includes_validation_parameters(self):
+        original = limited_class(10, ['red', 'blue'])
+        schema = original._trait_pickle_plan()[3]
+        self.assertEqual(
+            limited_class(10, ['red', 'blue'])._trait_pickle_plan()[3],
+            schema)
+
+        for changed in (limited_class(5, ['red', 'blue']),
+                        limited_class(10, ['red'])):
+            self.assertNotEqual(changed._trait_pickle_plan()[3], schema)
+
+        # Values which are no longer valid are rejected when restored:
+        for state, changed in (
+                (original(level=8).__getstate__(),
+                 limited_class(5, ['red', 'blue'])),
+                (original(color='blue').__getstate__(),
+                 limited_class(10, ['red'])),
+                (original(levels=[8]).__getstate__(),
+                 limited_class(5, ['red', 'blue']))):
+            with self.assertRaises(TraitError):
+                changed.__new__(changed).__setstate__(state)
+
+    def test_adapting_traits_keep_schema(self):
+        # Assigning to an adapting trait fills its validator's type cache,
+        # which must not change the schema:
+        linked = linked_class()(part=Part(name='p'), count=2)
+        state = linked.__getstate__()
+        restored = linked_class()
+        self.assertEqual(restored._trait_pickle_plan()[3],
+                         state['__trait_schema__'])
+        copy = restored.__new__(restored)
+        copy.__setstate__(state)
+        self.assertEqual((copy.part.name, copy.count), ('p', 2))
+        self.assertEqual(copy.changes, 0)
+
+    def test_object_dependent_traits_validated(self):
+        class Bounded(HasTraits):
+
+            __trusted_restore__ = True
+
+            high = Int(5)
+
+            level = Range(0, 'high')
+
+        self.assertEqual(Bounded._trait_pickle_plan()[2], ('high',))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,224 @@
+#  Test the schema-driven binary serializer for HasTraits object graphs.
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  License included in /LICENSE.txt and may be redistributed only under the
+#  conditions described in the aforementioned license.  The license is also
+#  available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+from __future__ import absolute_import
+
+import pickle
+
+from traits.testing.unittest_tools import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy_available = False
+else:
+    numpy_available = True
+
+from ..api import (Any, Bool, Delegate, Dict, Enum, Float, HasTraits,
+    Instance, Int, List, Str, TraitError)
+from ..trait_serializer import dumps, loads, trait_schema
+
+
+class Point(HasTraits):
+
+    x = Float
+
+    y = Float
+
+    label = Str
+
+
+class Shape(HasTraits):
+
+    name = Str
+
+    closed = Bool
+
+    kind = Enum('line', 'polygon')
+
+    count = Int
+
+    points = List(Point)
+
+    tags = Dict(Str, Int)
+
+    parent = Instance('Shape')
+
+    extra = Any
+
+    scratch = Any(transient=True)
+
+    changes = Int(transient=True)
+
+    def _count_changed(self):
+        self.changes += 1
+
+
+class Versioned(HasTraits):
+
+    name = Str
+
+    version = Int(transient=True)
+
+    def __getstate__(self):
+        state = super(Versioned, self).__getstate__()
+        state['saved_version'] = 2
+        return state
+
+    def __setstate__(self, state):
+        version = state.pop('saved_version', 0)
+        super(Versioned, self).__setstate__(state)
+        self.version = version
+
+
+def make_reduced(name):
+    return Reduced(name=name + '!')
+
+
+class Reduced(HasTraits):
+
+    name = Str
+
+    def __reduce_ex__(self, protocol):
+        return (make_reduced, (self.name,))
+
+
+class Labelled(HasTraits):
+
+    point = Instance(Point, ())
+
+    label = Delegate('point', transient=False)
+
+    size = Delegate('point', 'x')
+
+
+if numpy_available:
+    from ..api import Array
+
+    class Grid(HasTraits):
+
+        values = Array(dtype='float64')
+
+        cells = Any
+
+
+class TestTraitSerializer(unittest.TestCase):
+
+    def test_schema(self):
+        self.assertEqual([name for name, writer in trait_schema(Shape)],
+                         ['closed', 'count', 'extra', 'kind', 'name',
+                          'parent', 'points', 'tags'])
+        self.assertIs(trait_schema(Shape), trait_schema(Shape))
+
+    def test_round_trip(self):
+        shape = Shape(name=u'tri\xe4ngle', closed=True, kind='polygon',
+                      count=-300, tags={'a': 1, 'b': 2 ** 40},
+                      points=[Point(x=0.5, y=-1.5), Point(label='p')],
+                      extra=(None, 1 + 2j, [b'raw', set([3])], {4: 5.0}),
+                      scratch=object())
+        copy = loads(dumps(shape))
+        self.assertIsInstance(copy, Shape)
+        for name in ('name', 'closed', 'kind', 'count', 'tags', 'extra'):
+            self.assertEqual(getattr(copy, name), getattr(shape, name))
+
+        self.assertEqual([(p.x, p.y, p.label) for p in copy.points],
+                         [(0.5, -1.5, ''), (0.0, 0.0, 'p')])
+        self.assertIsNone(copy.parent)
+        self.assertIsNone(copy.scratch)
+
+    def test_values_assigned_without_notification(self):
+        copy = loads(dumps(Shape(count=5)))
+        self.assertEqual(copy.count, 5)
+        self.assertEqual(copy.changes, 0)
+
+        # The restored object is fully initialized:
+        events = []
+        copy.on_trait_change(lambda: events.append(True), 'points_items')
+        copy.points.append(Point())
+        self.assertEqual(events, [True])
+        copy.count = 6
+        self.assertEqual(copy.changes, 1)
+
+    def test_shared_references_and_cycles(self):
+        root = Shape(name='root')
+        child = Shape(name='child', parent=root)
+        root.parent = root
+        point = Point(x=1.0)
+        root.points = [point, point]
+        child.points = [point]
+        copy_root, copy_child = loads(dumps([root, child]))
+        self.assertIs(copy_root.parent, copy_root)
+        self.assertIs(copy_child.parent, copy_root)
+        self.assertIs(copy_root.points[0], copy_root.points[1])
+        self.assertIs(copy_child.points[0], copy_root.points[0])
+
+    def test_shared_and_cyclic_containers(self):
+        items = [1]
+        items.append(items)
+        table = {'a': 1}
+        copy = loads(dumps(Shape(extra=(items, table, table))))
+        copy_items, copy_table, copy_table2 = copy.extra
+        self.assertEqual(copy_items[0], 1)
+        self.assertIs(copy_items[1], copy_items)
+        self.assertIs(copy_table, copy_table2)
+        self.assertEqual(copy_table, table)
+
+    def test_pickling_hooks_honoured(self):
+        versioned, reduced = loads(dumps([Versioned(name='v'),
+                                          Reduced(name='r')]))
+        self.assertEqual((versioned.name, versioned.version), ('v', 2))
+        self.assertEqual(reduced.name, 'r!')
+
+    def test_persisted_delegates(self):
+        self.assertEqual([name for name, writer in trait_schema(Labelled)],
+                         ['label', 'point', 'size'])
+        labelled = Labelled(point=Point(x=2.0, label='p'))
+        labelled.label = 'local'
+        copy = loads(dumps(labelled))
+        self.assertEqual((copy.label, copy.point.label, copy.size),
+                         ('local', 'p', 2.0))
+
+    def test_instance_traits(self):
+        shape = Shape(name='s', count=2)
+        shape.add_trait('weight', Float(2.5))
+        shape.weight = 3.5
+        plain = Shape(name='p')
+        copy, copy_plain = loads(dumps([shape, plain]))
+        self.assertEqual((copy.name, copy.count, copy.weight), ('s', 2, 3.5))
+        self.assertEqual(copy_plain.name, 'p')
+
+    def test_smaller_than_pickle(self):
+        shapes = [Shape(name='s%d' % i, count=i,
+                        points=[Point(x=i, y=i)]) for i in range(50)]
+        self.assertLess(len(dumps(shapes)), len(pickle.dumps(shapes, 2)) / 2)
+
+    @unittest.skipUnless(numpy_available, "numpy not available")
+    def test_arrays(self):
+        grid = Grid(values=numpy.arange(12.0).reshape(3, 4).T,
+                    cells=numpy.array([[1, 2], [3, 4]], dtype='int16'))
+        copy = loads(dumps(grid))
+        numpy.testing.assert_array_equal(copy.values, grid.values)
+        self.assertEqual(copy.cells.dtype, numpy.dtype('int16'))
+        numpy.testing.assert_array_equal(copy.cells, grid.cells)
+        copy.values[0, 0] = 100.0
+
+    def test_invalid_data(self):
+        with self.assertRaises(TraitError):
+            loads(b'not a stream')
+        data = dumps(Shape())
+        with self.assertRaises(TraitError):
+            loads(data[:-1])
+        with self.assertRaises(TraitError):
+            loads(data + b'\x00')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+#  Test the trusted (validation-free) construction of trait container objects.
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  License included in /LICENSE.txt and may be redistributed only under the
+#  conditions described in the aforementioned license.  The license is also
+#  available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+from __future__ import absolute_import
+
+import copy
+import pickle
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import Dict, HasTraits, List, Set, TraitError, TraitType
+from ..trait_handlers import TraitListObject, is_detached_copy
+
+
+class Counted(TraitType):
+    """ An integer trait which counts the number of validations.
+    """
+
+    calls = 0
+
+    def validate(self, object, name, value):
+        Counted.calls += 1
+        if isinstance(value, int):
+            return value
+
+        self.error(object, name, value)
+
+
+class Model(HasTraits):
+
+    values = List(Counted)
+
+    unique = Set(Counted)
+
+    table = Dict(Counted, Counted)
+
+
+class TrustedModel(Model):
+
+    __trusted_restore__ = True
+
+
+class OtherModel(HasTraits):
+
+    values = List(Counted)
+
+
+class TestTrustedContainers(unittest.TestCase):
+
+    def setUp(self):
+        self.model = TrustedModel(values=[1, 2, 3], unique=set([4, 5]),
+                                  table={6: 7})
+        Counted.calls = 0
+
+    def test_deepcopy_not_validated(self):
+        for name in ('values', 'unique', 'table'):
+            value = getattr(self.model, name)
+            result = copy.deepcopy(value)
+            self.assertEqual(result, value)
+            self.assertIs(type(result), type(value))
+            self.assertTrue(is_detached_copy(result, value.trait))
+
+        self.assertEqual(Counted.calls, 0)
+
+    def test_clone_not_validated(self):
+        clone = self.model.clone_traits(copy='deep')
+        self.assertEqual(Counted.calls, 0)
+        self.assertEqual(clone.values, [1, 2, 3])
+        self.assertEqual(clone.unique, set([4, 5]))
+        self.assertEqual(clone.table, {6: 7})
+
+        # The copied containers belong to (and validate for) the clone:
+        events = []
+        clone.on_trait_change(lambda: events.append(True), 'values_items')
+        clone.values.append(4)
+        self.assertEqual(events, [True])
+        self.assertRaises(TraitError, clone.values.append, 'x')
+        self.assertEqual(self.model.values, [1, 2, 3])
+
+    def test_owned_values_validated(self):
+        other = OtherModel(values=self.model.values)
+        self.assertEqual(Counted.calls, 3)
+        self.assertIsNot(other.values, self.model.values)
+
+        # A detached copy of another trait's list is also validated:
+        values = copy.deepcopy(self.model.values)
+        other.values = values
+        self.assertEqual(Counted.calls, 6)
+
+        # Validation failures are still detected for plain lists:
+        with self.assertRaises(TraitError):
+            other.values = ['x']
+
+    def test_pickle_trusted_restore(self):
+        copy = pickle.loads(pickle.dumps(self.model))
+        self.assertEqual(Counted.calls, 0)
+        self.assertEqual(copy.values, [1, 2, 3])
+        self.assertEqual(copy.unique, set([4, 5]))
+        self.assertEqual(copy.table, {6: 7})
+        self.assertIs(copy.values.object(), copy)
+        self.assertIs(copy.table.object(), copy)
+        self.assertRaises(TraitError, copy.values.append, 'x')
+
+    def test_pickle_validated_restore(self):
+        model = Model(values=[1, 2])
+        Counted.calls = 0
+        copy = pickle.loads(pickle.dumps(model))
+        self.assertEqual(Counted.calls, 2)
+        self.assertEqual(copy.values, [1, 2])
+
+    def test_schema_includes_item_types(self):
+
+        def items_class(item_type):
+            class Items(HasTraits):
+                __trusted_restore__ = True
+                values = List(item_type)
+            return Items
+
+        schema = items_class(int)._trait_pickle_plan()[3]
+        self.assertEqual(items_class(int)._trait_pickle_plan()[3], schema)
+        self.assertNotEqual(items_class(str)._trait_pickle_plan()[3], schema)
+
+    def test_trusted_construction(self):
+        trait = self.model.values.trait
+        result = TraitListObject.trusted(trait, self.model, 'values', [7, 8])
+        self.assertEqual(result, [7, 8])
+        self.assertIs(result.object(), self.model)
+        self.assertEqual(result.name_items, 'values_items')
+        self.assertEqual(Counted.calls, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+#  Test the bulk validation of container items using CTrait.validate_items.
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  License included in /LICENSE.txt and may be redistributed only under the
+#  conditions described in the aforementioned license.  The license is also
+#  available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+from __future__ import absolute_import
+
+from traits.testing.unittest_tools import unittest
+
+from ..api import (Any, CFloat, Dict, Float, HasTraits, Instance, Int, List,
+    Set, Str, TraitError, TraitType)
+
+
+class Foo(HasTraits):
+
+    pass
+
+
+class Draining(TraitType):
+    """ A trait that empties the list its values are taken from.
+    """
+
+    def validate(self, object, name, value):
+        del self.source[:]
+        return value
+
+
+class Model(HasTraits):
+
+    ints = List(Int)
+
+    floats = List(CFloat)
+
+    foos = List(Instance(Foo))
+
+    anys = List(Any)
+
+    names = Set(Str)
+
+    table = Dict(Str, Float)
+
+
+class TestValidateItems(unittest.TestCase):
+
+    def test_ctrait_validate_items(self):
+        model = Model()
+        trait = model.trait('floats').handler.item_trait
+        self.assertEqual(trait.validate_items(model, 'floats', (1, 2.5)),
+                         [1.0, 2.5])
+        self.assertEqual(trait.validate_items(model, 'floats', iter('12')),
+                         [1.0, 2.0])
+        with self.assertRaises(TraitError):
+            trait.validate_items(model, 'floats', [1.0, 'x'])
+
+        values = [object(), None]
+        trait = model.trait('anys').handler.item_trait
+        result = trait.validate_items(model, 'anys', values)
+        self.assertEqual(result, values)
+        self.assertIsNot(result, values)
+
+    def test_values_modified_by_validator(self):
+        trait = Draining()
+        trait.source = values = [object() for i in range(100)]
+        expected = list(values)
+        result = trait.as_ctrait().validate_items(Model(), 'anys', values)
+        self.assertEqual(result, expected)
+        self.assertEqual(values, [])
+
+    def test_list_operations(self):
+        model = Model(ints=[1, 2], floats=[1, 2])
+        self.assertEqual(model.floats, [1.0, 2.0])
+        self.assertIsInstance(model.floats[0], float)
+
+        model.ints.extend([3, 4])
+        model.ints[1:3] = [5, 6, 7]
+        model.ints[::2] = [0, 0, 0]
+        self.assertEqual(model.ints, [0, 5, 0, 7, 0])
+
+        foo = Foo()
+        model.foos = [foo]
+        model.foos += [foo]
+        self.assertEqual(model.foos, [foo, foo])
+
+    def test_list_errors(self):
+        model = Model(ints=[1])
+        with self.assertRaises(TraitError):
+            model.ints = [1, 'a']
+        with self.assertRaises(TraitError):
+            model.ints.extend([2, None])
+        with self.assertRaises(TraitError):
+            model.ints[0:1] = [2.5]
+        self.assertEqual(model.ints, [1])
+
+    def test_set_and_dict_operations(self):
+        model = Model(names=set(['a']), table={'x': 1})
+        self.assertEqual(model.table, {'x': 1.0})
+        model.names.update(['b', 'c'])
+        model.names.symmetric_difference_update(set(['c', 'd']))
+        self.assertEqual(model.names, set(['a', 'b', 'd']))
+        with self.assertRaises(TraitError):
+            model.names.update([1])
+
+        model.table.update({'y': 2.5, 'z': 3.0})
+        self.assertEqual(model.table, {'x': 1.0, 'y': 2.5, 'z': 3.0})
+        with self.assertRaises(TraitError) as cm:
+            model.table.update({1: 1.0})
+        self.assertIn('Each key of the', str(cm.exception))
+        with self.assertRaises(TraitError) as cm:
+            model.table = {'a': 'b'}
+        self.assertIn('Each value of the', str(cm.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
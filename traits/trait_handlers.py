@@ -37,6 +37,8 @@ import sys
 import re
 import copy
 import copy_reg
+from array import array
+from contextlib import contextmanager
 from types import FunctionType, MethodType
 TypeType = type
 
@@ -1299,7 +1301,7 @@ class TraitInstance ( ThisClass ):
             self.fast_validate = tuple( fast_validate )
         else:
             self.fast_validate = ( 19, self.aClass, self.adapt,
-                                   self._allow_none )
+                                   self._allow_none, {} )
 
     def validate ( self, object, name, value ):
 
@@ -2133,6 +2135,8 @@ class TraitCallable ( TraitHandler ):
 
 class TraitListEvent ( object ):
 
+    __slots__ = ( 'index', 'removed', 'added' )
+
     #---------------------------------------------------------------------------
     #  Initialize the object:
     #---------------------------------------------------------------------------
@@ -2214,6 +2218,9 @@ class TraitList ( TraitHandler ):
     def validate ( self, object, name, value ):
         if (isinstance( value, list ) and
            (self.minlen <= len( value ) <= self.maxlen)):
+            if is_detached_copy( value, self ):
+                return TraitListObject.trusted( self, object, name, value )
+
             return TraitListObject( self, object, name, value )
 
         self.error( object, name, value )
@@ -2282,27 +2289,239 @@ def items_event ( ):
 
     return TraitList._items_event
 
+#-------------------------------------------------------------------------------
+#  Trait container object state:
+#-------------------------------------------------------------------------------
+
+# The attributes of trait container (list, set and dictionary) objects:
+ContainerSlots = ( 'trait', 'object', 'name', 'name_items' )
+
+# The shared names of the items events of trait container objects, keyed by
+# trait name:
+items_names = {}
+
+def items_name ( name ):
+    """ Returns the (shared) name of the items event of the *name* trait.
+    """
+    result = items_names.get( name )
+    if result is None:
+        result = items_names[ name ] = name + '_items'
+
+    return result
+
+def container_state ( container ):
+    """ Returns the pickleable state of a trait container object.
+    """
+    result = getattr( container, '__dict__', {} ).copy()
+    for name in ( 'name', 'name_items' ):
+        try:
+            result[ name ] = getattr( container, name )
+        except AttributeError:
+            pass
+
+    return result
+
+def set_container_state ( container, state ):
+    """ Restores the state of a trait container object from a state
+        dictionary returned by *container_state*.
+    """
+    name   = state.setdefault( 'name', '' )
+    object = state.pop( 'object', None )
+    if object is not None:
+        container.object = ref( object )
+        container.rename( name )
+    else:
+        container.object = lambda: None
+
+    for name, value in state.items():
+        setattr( container, name, value )
+
+#-------------------------------------------------------------------------------
+#  Trait container items event batching:
+#-------------------------------------------------------------------------------
+
+# The pending items events of the trait container objects whose items events
+# are currently being batched, keyed by the id of the container object:
+batched_events = {}
+
+def batch_items_events ( container, merge ):
+    """ Returns a context manager which defers the items events sent by
+        *container* until the context exits, when the events returned by
+        *merge( container, events )* for the list of deferred
+        ( name, event, items_event ) tuples are sent instead.
+
+        Nested batches of the same container are merged into the outermost
+        batch.
+    """
+    key = id( container )
+    if key in batched_events:
+        yield container
+        return
+
+    batched_events[ key ] = events = []
+    try:
+        yield container
+    finally:
+        del batched_events[ key ]
+        if len( events ) > 0:
+            for name, event, items_event in merge( container, events ):
+                container._send_trait_items_event( name, event, items_event )
+
+batch_items_events = contextmanager( batch_items_events )
+
+def defer_items_event ( container, name, event, items_event ):
+    """ Adds an items event to the pending events of *container* and returns
+        True if its events are being batched. Otherwise returns False.
+    """
+    events = batched_events.get( id( container ) )
+    if events is None:
+        return False
+
+    events.append( ( name, event, items_event ) )
+
+    return True
+
+def items_observed ( container ):
+    """ Returns whether the items events of a trait container object would be
+        received by any handler (or are being batched), i.e. whether it is
+        worth creating them.
+    """
+    name = container.name_items
+    if name is None:
+        return False
+
+    if batched_events and (id( container ) in batched_events):
+        return True
+
+    object = container.object()
+
+    return (object is not None) and object._trait_items_observed( name )
+
+def merge_list_events ( container, events ):
+    """ Merges a sequence of list items events, combining each run of events
+        which change contiguous ranges of items (such as a sequence of
+        appends) into a single event.
+    """
+    result = []
+    last   = None
+    for name, event, items_event in events:
+        index, removed, added = event.index, event.removed, event.added
+        if (last is not None) and (last[0] == name) and (type( index ) is int):
+            last_index, last_removed, last_added = last[1:4]
+            if index == (last_index + len( last_added )):
+                # The event changes the items following the last event's:
+                last[2:4] = [ last_removed + removed, last_added + added ]
+                continue
+
+            if ((len( last_added ) == 0) and (len( added ) == 0) and
+                ((index + len( removed )) == last_index)):
+                # The event removes the items preceding the last event's:
+                last[1:3] = [ index, removed + last_removed ]
+                continue
+
+        last = None
+        if type( index ) is int:
+            last = [ name, index, list( removed ), list( added ),
+                     items_event ]
+            result.append( last )
+        else:
+            result.append( ( name, event, items_event ) )
+
+    return [ ( item[0], TraitListEvent( *item[1:4] ), item[4] )
+             if len( item ) == 5 else item for item in result ]
+
+def merge_set_events ( container, events ):
+    """ Merges a sequence of set items events into a single event containing
+        the net changes made to the set.
+    """
+    name, items_event = events[-1][0], events[-1][2]
+    existed = {}
+    for ignore, event, ignore in events:
+        for item in event.removed:
+            existed.setdefault( item, True )
+
+        for item in event.added:
+            existed.setdefault( item, False )
+
+    removed = set( [ item for item, was_in in existed.iteritems()
+                     if was_in and (item not in container) ] )
+    added   = set( [ item for item, was_in in existed.iteritems()
+                     if (not was_in) and (item in container) ] )
+    if (len( removed ) == 0) and (len( added ) == 0):
+        return []
+
+    return [ ( name, TraitSetEvent( removed, added ), items_event ) ]
+
+def merge_dict_events ( container, events ):
+    """ Merges a sequence of dictionary items events into a single event
+        containing the net changes made to the dictionary.
+    """
+    name, items_event = events[-1][0], events[-1][2]
+    original = {}
+    for ignore, event, ignore in events:
+        for key in event.added:
+            original.setdefault( key, Missing )
+
+        for old_values in ( event.changed, event.removed ):
+            for key, value in old_values.iteritems():
+                original.setdefault( key, value )
+
+    added, changed, removed = {}, {}, {}
+    for key, value in original.iteritems():
+        if key not in container:
+            if value is not Missing:
+                removed[ key ] = value
+        elif value is Missing:
+            added[ key ] = container[ key ]
+        elif container[ key ] is not value:
+            changed[ key ] = value
+
+    if (len( added ) == 0) and (len( changed ) == 0) and (len( removed ) == 0):
+        return []
+
+    return [ ( name, TraitDictEvent( added, changed, removed ), items_event ) ]
+
+#-------------------------------------------------------------------------------
+#  Returns whether a value is a detached container validated by a trait:
+#-------------------------------------------------------------------------------
+
+def is_detached_copy ( value, trait ):
+    """ Returns whether *value* is a trait container object (i.e. a list, set
+        or dictionary object) whose items were validated by the *trait*
+        handler, and which does not belong to any object (such as a deep copy
+        of a trait container, or an unpickled one).
+
+        The items of such a value can be used to create the container object
+        for a new trait value without validating them again.
+    """
+    try:
+        return ((value.trait is trait) and (value.object() is None))
+    except AttributeError:
+        return False
+
 #-------------------------------------------------------------------------------
 #  'TraitListObject' class:
 #-------------------------------------------------------------------------------
 
 class TraitListObject ( list ):
 
+    __slots__ = ContainerSlots
+
     def __init__ ( self, trait, object, name, value ):
         self.trait      = trait
         self.object     = ref( object )
         self.name       = name
         self.name_items = None
         if trait.has_items:
-            self.name_items = name + '_items'
+            self.name_items = items_name( name )
 
         # Do the validated 'setslice' assignment without raising an
         # 'items_changed' event:
         if trait.minlen <= len( value ) <= trait.maxlen:
             try:
-                validate = trait.item_trait.handler.validate
-                if validate is not None:
-                    value = [ validate( object, name, val ) for val in value ]
+                item_trait = trait.item_trait
+                if item_trait.handler.validate is not None:
+                    value = item_trait.validate_items( object, name, value )
 
                 list.__setitem__(self, slice(0, 0), value )
 
@@ -2314,22 +2533,62 @@ class TraitListObject ( list ):
 
         self.len_error( len( value ) )
 
+    def trusted ( cls, trait, object, name, value ):
+        """ Returns a new list object for the *name* trait of *object*
+            containing the items of *value*, which must already have been
+            validated by *trait* (e.g. the items of a copy of another list
+            object for the same trait).
+        """
+        self            = cls.__new__( cls )
+        self.trait      = trait
+        self.object     = ref( object )
+        self.name       = name
+        self.name_items = None
+        if trait.has_items:
+            self.name_items = items_name( name )
+
+        list.extend( self, value )
+
+        return self
+
+    trusted = classmethod( trusted )
+
     def _send_trait_items_event(self, name, event, items_event=None):
         """ Send a TraitListEvent to the owning object if there is one.
         """
+        if batched_events and defer_items_event( self, name, event,
+                                                 items_event ):
+            return
+
         object = self.object()
         if object is not None:
             if items_event is None and hasattr(self, 'trait'):
                 items_event = self.trait.items_event()
             object.trait_items_event(name, event, items_event)
 
+    def batch ( self ):
+        """ Returns a context manager which defers the items events sent by
+            changes made to the list until the context exits, when they are
+            sent as the fewest events describing the changes (e.g. a single
+            event for a run of appends).
+
+            For example::
+
+                with object.values.batch():
+                    for value in values:
+                        object.values.append( value )
+        """
+        return batch_items_events( self, merge_list_events )
+
     def __deepcopy__ ( self, memo ):
         id_self = id( self )
         if id_self in memo:
             return memo[ id_self ]
 
-        memo[ id_self ] = result = TraitListObject( self.trait, lambda: None,
-                         self.name, [ copy.deepcopy( x, memo ) for x in self ] )
+        # The copied items are already valid, so do not validate them again:
+        memo[ id_self ] = result = TraitListObject.trusted( self.trait,
+                    lambda: None, self.name,
+                    [ copy.deepcopy( x, memo ) for x in self ] )
 
         return result
 
@@ -2342,9 +2601,10 @@ class TraitListObject ( list ):
         except:
             removed = []
         try:
-            object   = self.object()
-            validate = self.trait.item_trait.handler.validate
-            name     = self.name
+            object     = self.object()
+            item_trait = self.trait.item_trait
+            validate   = item_trait.handler.validate
+            name       = self.name
 
             if isinstance(key, slice):
                 values = value
@@ -2363,8 +2623,7 @@ class TraitListObject ( list ):
                     return
 
                 if validate is not None:
-                    values = [ validate( object, name, value )
-                               for value in values ]
+                    values = item_trait.validate_items( object, name, values )
                 value = values
                 if step == 1:
                     # FIXME: Bug-for-bug compatibility with old __setslice__ code.
@@ -2390,7 +2649,7 @@ class TraitListObject ( list ):
                 index = len( self ) + key if key < 0 else key
 
             list.__setitem__( self, key, value )
-            if self.name_items is not None:
+            if items_observed( self ):
                 if delta == 0:
                     try:
                         if removed == values:
@@ -2441,7 +2700,7 @@ class TraitListObject ( list ):
 
         list.__delitem__( self, key )
 
-        if self.name_items is not None:
+        if items_observed( self ):
             self._send_trait_items_event( self.name_items,
                 TraitListEvent( index, removed ) )
 
@@ -2461,12 +2720,13 @@ class TraitListObject ( list ):
         original_len = len( self )
 
         if trait.minlen <= original_len * count <= trait.maxlen:
-            if self.name_items is not None:
+            observed = items_observed( self )
+            if observed:
                 removed = None if count else self[:]
 
             result = list.__imul__(self, count)
 
-            if self.name_items is not None:
+            if observed:
                 added = self[original_len:] if count else None
                 index = original_len if count else 0
                 self._send_trait_items_event( self.name_items,
@@ -2485,12 +2745,12 @@ class TraitListObject ( list ):
 
         if trait.minlen <= (len( self ) + 1) <= trait.maxlen:
             try:
-                validate = trait.item_trait.handler.validate
-                object   = self.object()
-                if validate is not None:
-                    value = validate( object, self.name, value )
+                item_trait = trait.item_trait
+                if item_trait.handler.validate is not None:
+                    value = item_trait.validate( self.object(), self.name,
+                                                 value )
                 list.append( self, value )
-                if self.name_items is not None:
+                if items_observed( self ):
                     self._send_trait_items_event( self.name_items,
                         TraitListEvent( len( self ) - 1, None, [ value ] ),
                         trait.items_event() )
@@ -2515,7 +2775,7 @@ class TraitListObject ( list ):
 
                 list.insert( self, index, value )
 
-                if self.name_items is not None:
+                if items_observed( self ):
                     # Length before the insertion.
                     original_len = len( self ) - 1
 
@@ -2554,17 +2814,16 @@ class TraitListObject ( list ):
             raise TypeError, "list.extend() argument must be iterable"
 
         if (trait.minlen <= (len( self ) + len_xlist) <= trait.maxlen):
-            object   = self.object()
-            name     = self.name
-            validate = trait.item_trait.handler.validate
+            object     = self.object()
+            name       = self.name
+            item_trait = trait.item_trait
             try:
-                if validate is not None:
-                    xlist = [ validate( object, name, value )
-                              for value in xlist ]
+                if item_trait.handler.validate is not None:
+                    xlist = item_trait.validate_items( object, name, xlist )
 
                 list.extend( self, xlist )
 
-                if (self.name_items is not None) and (len( xlist ) != 0):
+                if (len( xlist ) != 0) and items_observed( self ):
                     self._send_trait_items_event( self.name_items,
                         TraitListEvent( len( self ) - len( xlist ), None,
                                         xlist ), trait.items_event() )
@@ -2583,6 +2842,10 @@ class TraitListObject ( list ):
             list.remove(self, value)
             return
         if trait.minlen < len( self ):
+            if not items_observed( self ):
+                list.remove( self, value )
+                return
+
             try:
                 index   = self.index( value )
                 removed = [ self[ index ] ]
@@ -2591,9 +2854,8 @@ class TraitListObject ( list ):
 
             list.remove( self, value )
 
-            if self.name_items is not None:
-                self._send_trait_items_event( self.name_items,
-                    TraitListEvent( index, removed ) )
+            self._send_trait_items_event( self.name_items,
+                TraitListEvent( index, removed ) )
         elif len(self) == 0:
             # Let whatever system error (ValueError) should be raised be raised.
             list.remove(self, value)
@@ -2602,28 +2864,37 @@ class TraitListObject ( list ):
 
     if sys.version_info[0] < 3:
         def sort ( self, cmp = None, key = None, reverse = False ):
-            removed = self[:]
+            removed = self._sort_removed()
             list.sort( self, cmp = cmp, key = key, reverse = reverse )
             self._sort_common(removed)
     else:
         def sort ( self, key = None, reverse = False ):
-            removed = self[:]
+            removed = self._sort_removed()
             list.sort( self, key = key, reverse = reverse )
             self._sort_common(removed)
 
+    def _sort_removed ( self ):
+        if ((getattr(self, 'trait', None) is not None) and
+            items_observed( self )):
+            return self[:]
+
+        return None
+
     def _sort_common ( self, removed ):
-        if (getattr(self, 'name_items', None) is not None and
-            getattr(self, 'trait', None) is not None):
+        if removed is not None:
             self._send_trait_items_event( self.name_items,
                 TraitListEvent( 0, removed, self[:] ) )
 
     def reverse ( self ):
-        removed = self[:]
         if len( self ) > 1:
+            if not items_observed( self ):
+                list.reverse( self )
+                return
+
+            removed = self[:]
             list.reverse( self )
-            if self.name_items is not None:
-                self._send_trait_items_event( self.name_items,
-                    TraitListEvent( 0, removed, self[:] ) )
+            self._send_trait_items_event( self.name_items,
+                TraitListEvent( 0, removed, self[:] ) )
 
     def pop ( self, *args ):
         if not hasattr(self, 'trait'):
@@ -2641,7 +2912,7 @@ class TraitListObject ( list ):
 
             result = list.pop( self, *args )
 
-            if self.name_items is not None:
+            if items_observed( self ):
                 if index < 0:
                     index = len( self ) + index + 1
 
@@ -2667,22 +2938,391 @@ class TraitListObject ( list ):
                   len, 's'[ len == 1: ] ) )
 
     def __getstate__ ( self ):
-        result = self.__dict__.copy()
-        result.pop('object', None)
-        result.pop('trait', None)
-
-        return result
+        return container_state( self )
 
     def __setstate__ ( self, state ):
-        name   = state.setdefault('name', '')
-        object = state.pop( 'object', None )
+        set_container_state( self, state )
+
+#-------------------------------------------------------------------------------
+#  'TraitNumericListObject' class:
+#-------------------------------------------------------------------------------
+
+# The errors raised by 'array' when a value cannot be stored in an array:
+ArrayItemErrors = ( TypeError, ValueError, OverflowError )
+
+class TraitNumericListObject ( array ):
+    """ The value of a NumericList trait: a list of numbers stored in a
+        contiguous 'array.array' buffer of the trait's typecode.
+
+        Changes made using the list methods send the same TraitListEvent
+        items events as a TraitListObject does. Changes written directly into
+        the buffer (e.g. through a memoryview or a numpy array sharing its
+        memory) do not send any events.
+    """
+
+    __slots__ = ContainerSlots
+
+    def __new__ ( cls, trait, object, name, value ):
+        return array.__new__( cls, trait.typecode )
+
+    def __init__ ( self, trait, object, name, value ):
+        self.trait      = trait
+        self.object     = ref( object )
+        self.name       = name
+        self.name_items = None
+        if trait.has_items:
+            self.name_items = items_name( name )
+
+        items = self._validate_items( value, 'Each element of the' )
+        if not (trait.minlen <= len( items ) <= trait.maxlen):
+            self.len_error( len( items ) )
+
+        array.extend( self, items )
+
+    def trusted ( cls, trait, object, name, value ):
+        """ Returns a new numeric list object for the *name* trait of *object*
+            containing the items of *value*, an array of the trait's typecode.
+        """
+        self            = array.__new__( cls, trait.typecode )
+        self.trait      = trait
+        self.object     = ref( object )
+        self.name       = name
+        self.name_items = None
+        if trait.has_items:
+            self.name_items = items_name( name )
+
+        array.extend( self, value )
+
+        return self
+
+    trusted = classmethod( trusted )
+
+    def _send_trait_items_event ( self, name, event, items_event = None ):
+        """ Send a TraitListEvent to the owning object if there is one.
+        """
+        if batched_events and defer_items_event( self, name, event,
+                                                 items_event ):
+            return
+
+        object = self.object()
         if object is not None:
-            self.object = ref( object )
-            self.rename( name )
+            if items_event is None:
+                items_event = self.trait.items_event()
+            object.trait_items_event( name, event, items_event )
+
+    def batch ( self ):
+        """ Returns a context manager which defers the items events sent by
+            changes made to the list until the context exits, when they are
+            sent as the fewest events describing the changes (e.g. a single
+            event for a run of appends).
+
+            For example::
+
+                with object.values.batch():
+                    for value in values:
+                        object.values.append( value )
+        """
+        return batch_items_events( self, merge_list_events )
+
+    def __copy__ ( self ):
+        return TraitNumericListObject.trusted( self.trait, lambda: None,
+                                               self.name, self )
+
+    def __deepcopy__ ( self, memo ):
+        # The items are numbers, so a copy of the buffer is a deep copy:
+        memo[ id( self ) ] = result = self.__copy__()
+
+        return result
+
+    def __reduce_ex__ ( self, protocol ):
+        # Pickle the items as a plain array, restored as a detached list which
+        # is reattached to its trait by its owner:
+        return ( restore_numeric_list, ( array( self.typecode, self ),
+                                         self.name ) )
+
+    def __setitem__ ( self, key, value ):
+        trait = getattr( self, 'trait', None )
+        if trait is None:
+            return array.__setitem__( self, key, value )
+
+        if isinstance( key, slice ):
+            start, stop, step = key.indices( len( self ) )
+            removed = self[ key ]
+            items   = self._validate_items( value, 'Each element of the' )
+            newlen  = len( self ) + len( items ) - len( removed )
+            if not (trait.minlen <= newlen <= trait.maxlen):
+                self.len_error( newlen )
+
+            array.__setitem__( self, key, items )
+
+            if not items_observed( self ):
+                return
+
+            removed, added = removed.tolist(), items.tolist()
+            if step == 1:
+                index = start
+            else:
+                # Extended slices use the same (nested) event format as
+                # TraitListObject:
+                index, removed, added = key, [ removed ], [ added ]
         else:
-            self.object = lambda: None
+            if key < 0:
+                key += len( self )
+            removed = [ self[ key ] ]
+            items   = self._validate_items( [ value ], 'Each element of the' )
+            array.__setitem__( self, key, items[0] )
 
-        self.__dict__.update( state )
+            if not items_observed( self ):
+                return
+
+            index = key
+            added = items.tolist()
+
+        self._send_trait_items_event( self.name_items,
+            TraitListEvent( index, removed, added ) )
+
+    def __delitem__ ( self, key ):
+        trait = getattr( self, 'trait', None )
+        if trait is None:
+            return array.__delitem__( self, key )
+
+        if isinstance( key, slice ):
+            start, stop, step = key.indices( len( self ) )
+            removed = self[ key ]
+            delta   = len( removed )
+            index   = start
+            removed = removed.tolist()
+            if step != 1:
+                index, removed = key, [ removed ]
+        else:
+            if key < 0:
+                key += len( self )
+            removed = [ self[ key ] ]
+            index   = key
+            delta   = 1
+
+        if not (trait.minlen <= (len( self ) - delta)):
+            self.len_error( len( self ) - delta )
+
+        array.__delitem__( self, key )
+
+        if items_observed( self ):
+            self._send_trait_items_event( self.name_items,
+                TraitListEvent( index, removed ) )
+
+    if sys.version_info[0] < 3:
+        def __setslice__ ( self, i, j, values ):
+            self.__setitem__( slice( i, j ), values )
+
+        def __delslice__ ( self, i, j ):
+            self.__delitem__( slice( i, j ) )
+
+    def __iadd__ ( self, other ):
+        self.extend( other )
+        return self
+
+    def __imul__ ( self, count ):
+        trait = getattr( self, 'trait', None )
+        if trait is None:
+            return array.__imul__( self, count )
+
+        original_len = len( self )
+        if not (trait.minlen <= original_len * count <= trait.maxlen):
+            self.len_error( original_len * count )
+
+        observed = items_observed( self )
+        removed  = None
+        if observed and (count <= 0):
+            removed = self.tolist()
+
+        array.__imul__( self, count )
+
+        if observed:
+            if count > 0:
+                event = TraitListEvent( original_len, None,
+                                        self[ original_len: ].tolist() )
+            else:
+                event = TraitListEvent( 0, removed )
+            self._send_trait_items_event( self.name_items, event )
+
+        return self
+
+    def append ( self, value ):
+        self.insert( len( self ), value )
+
+    def insert ( self, index, value ):
+        trait = getattr( self, 'trait', None )
+        if trait is None:
+            return array.insert( self, index, value )
+
+        if not (trait.minlen <= (len( self ) + 1) <= trait.maxlen):
+            self.len_error( len( self ) + 1 )
+
+        items = self._validate_items( [ value ], 'Each element of the' )
+
+        # Indices outside [-len, len] are clipped, as by list.insert:
+        original_len = len( self )
+        if index < 0:
+            index = max( 0, index + original_len )
+        elif index > original_len:
+            index = original_len
+
+        array.insert( self, index, items[0] )
+
+        if items_observed( self ):
+            self._send_trait_items_event( self.name_items,
+                TraitListEvent( index, None, items.tolist() ) )
+
+    def extend ( self, values ):
+        trait = getattr( self, 'trait', None )
+        if trait is None:
+            return array.extend( self, values )
+
+        items  = self._validate_items( values, 'The elements of the' )
+        newlen = len( self ) + len( items )
+        if not (trait.minlen <= newlen <= trait.maxlen):
+            self.len_error( newlen )
+
+        array.extend( self, items )
+
+        if (len( items ) != 0) and items_observed( self ):
+            self._send_trait_items_event( self.name_items,
+                TraitListEvent( newlen - len( items ), None,
+                                items.tolist() ) )
+
+    def fromlist ( self, values ):
+        self.extend( values )
+
+    if hasattr( array, 'frombytes' ):
+        def frombytes ( self, data ):
+            items = array( self.typecode )
+            items.frombytes( data )
+            self.extend( items )
+    else:
+        def fromstring ( self, data ):
+            items = array( self.typecode )
+            items.fromstring( data )
+            self.extend( items )
+
+    def remove ( self, value ):
+        trait = getattr( self, 'trait', None )
+        if (trait is None) or (len( self ) == 0):
+            # Let array raise whatever error is appropriate:
+            return array.remove( self, value )
+
+        self.pop( self.index( value ) )
+
+    def pop ( self, index = -1 ):
+        trait = getattr( self, 'trait', None )
+        if trait is None:
+            return array.pop( self, index )
+
+        if not (trait.minlen < len( self )):
+            self.len_error( len( self ) - 1 )
+
+        if index < 0:
+            index += len( self )
+        result = array.pop( self, index )
+
+        if items_observed( self ):
+            self._send_trait_items_event( self.name_items,
+                TraitListEvent( index, [ result ] ) )
+
+        return result
+
+    def reverse ( self ):
+        if len( self ) > 1:
+            if not items_observed( self ):
+                array.reverse( self )
+                return
+
+            removed = self.tolist()
+            array.reverse( self )
+            self._send_trait_items_event( self.name_items,
+                TraitListEvent( 0, removed, self.tolist() ) )
+
+    def rename ( self, name ):
+        trait = self.object()._trait( name, 0 )
+        if trait is not None:
+            self.name  = name
+            self.trait = trait.handler
+
+    def len_error ( self, len ):
+        raise TraitError( "The '%s' trait of %s instance must be %s, "
+                  "but you attempted to change its length to %d element%s." % (
+                  self.name, class_of( self.object() ),
+                  self.trait.full_info( self.object(), self.name, Undefined ),
+                  len, 's'[ len == 1: ] ) )
+
+    #-- Private Methods --------------------------------------------------------
+
+    def _validate_items ( self, values, prefix ):
+        """ Returns a new array containing *values* converted to the list's
+            typecode, raising a TraitError if any of them cannot be converted.
+        """
+        typecode = self.trait.typecode
+        if not isinstance( values, SequenceTypes ):
+            items = buffer_items( values, typecode )
+            if items is not None:
+                return items
+
+        try:
+            return array( typecode, values )
+        except ArrayItemErrors:
+            pass
+
+        # Find the first invalid value to report:
+        value = values
+        try:
+            for item in values:
+                try:
+                    array( typecode, [ item ] )
+                except ArrayItemErrors:
+                    value = item
+                    break
+        except TypeError:
+            pass
+
+        excp = TraitError( self.object(), self.name, self.trait.item_info,
+                           value )
+        excp.set_prefix( prefix )
+        raise excp
+
+def buffer_items ( value, typecode ):
+    """ Returns a new array of the specified typecode containing the data of
+        *value*, if *value* exposes a one-dimensional contiguous buffer of
+        that typecode (such as a numpy array of the corresponding dtype).
+        Otherwise returns None.
+    """
+    if not hasattr( array, 'frombytes' ):
+        return None
+
+    try:
+        view = memoryview( value )
+    except TypeError:
+        return None
+
+    if ((view.format != typecode) or (view.ndim != 1) or
+        (not view.c_contiguous)):
+        return None
+
+    items = array( typecode )
+    items.frombytes( view.cast( 'B' ) )
+
+    return items
+
+def restore_numeric_list ( items, name ):
+    """ Returns an unpickled numeric list object, which is not yet attached to
+        an object or trait.
+    """
+    self = array.__new__( TraitNumericListObject, items.typecode )
+    array.extend( self, items )
+    self.trait      = None
+    self.object     = lambda: None
+    self.name       = name
+    self.name_items = None
+
+    return self
 
 #-------------------------------------------------------------------------------
 #  'TraitSetEvent' class:
@@ -2690,6 +3330,8 @@ class TraitListObject ( list ):
 
 class TraitSetEvent ( object ):
 
+    __slots__ = ( 'removed', 'added' )
+
     #---------------------------------------------------------------------------
     #  Initialize the object:
     #---------------------------------------------------------------------------
@@ -2709,19 +3351,21 @@ class TraitSetEvent ( object ):
 
 class TraitSetObject ( set ):
 
+    __slots__ = ContainerSlots
+
     def __init__ ( self, trait, object, name, value ):
         self.trait      = trait
         self.object     = ref( object )
         self.name       = name
         self.name_items = None
         if trait.has_items:
-            self.name_items = name + '_items'
+            self.name_items = items_name( name )
 
         # Validate and assign the initial set value:
         try:
-            validate = trait.item_trait.handler.validate
-            if validate is not None:
-                value = [ validate( object, name, val ) for val in value ]
+            item_trait = trait.item_trait
+            if item_trait.handler.validate is not None:
+                value = item_trait.validate_items( object, name, value )
 
             super( TraitSetObject, self ).__init__( value )
 
@@ -2731,22 +3375,61 @@ class TraitSetObject ( set ):
             excp.set_prefix( 'Each element of the' )
             raise excp
 
+    def trusted ( cls, trait, object, name, value ):
+        """ Returns a new set object for the *name* trait of *object*
+            containing the items of *value*, which must already have been
+            validated by *trait* (e.g. the items of a copy of another set
+            object for the same trait).
+        """
+        self            = cls.__new__( cls )
+        self.trait      = trait
+        self.object     = ref( object )
+        self.name       = name
+        self.name_items = None
+        if trait.has_items:
+            self.name_items = items_name( name )
+
+        set.update( self, value )
+
+        return self
+
+    trusted = classmethod( trusted )
+
     def _send_trait_items_event(self, name, event, items_event=None):
         """ Send a TraitDictEvent to the owning object if there is one.
         """
+        if batched_events and defer_items_event( self, name, event,
+                                                 items_event ):
+            return
+
         object = self.object()
         if object is not None:
             if items_event is None and hasattr(self, 'trait'):
                 items_event = self.trait.items_event()
             object.trait_items_event(name, event, items_event)
 
+    def batch ( self ):
+        """ Returns a context manager which defers the items events sent by
+            changes made to the set until the context exits, when they are
+            sent as a single event containing the net changes.
+
+            For example::
+
+                with object.values.batch():
+                    for value in values:
+                        object.values.add( value )
+        """
+        return batch_items_events( self, merge_set_events )
+
     def __deepcopy__ ( self, memo ):
         id_self = id( self )
         if id_self in memo:
             return memo[ id_self ]
 
-        memo[ id_self ] = result = TraitSetObject( self.trait, lambda: None,
-                         self.name, [ copy.deepcopy( x, memo ) for x in self ] )
+        # The copied items are already valid, so do not validate them again:
+        memo[ id_self ] = result = TraitSetObject.trusted( self.trait,
+                    lambda: None, self.name,
+                    [ copy.deepcopy( x, memo ) for x in self ] )
 
         return result
 
@@ -2759,15 +3442,14 @@ class TraitSetObject ( set ):
             added = value.difference( self )
             if len( added ) > 0:
                 object   = self.object()
-                validate = self.trait.item_trait.handler.validate
-                if validate is not None:
-                    name  = self.name
-                    added = set( [ validate( object, name, item )
-                                   for item in added ] )
+                item_trait = self.trait.item_trait
+                if item_trait.handler.validate is not None:
+                    added = set( item_trait.validate_items( object, self.name,
+                                                            added ) )
 
                 set.update( self, added )
 
-                if self.name_items is not None:
+                if items_observed( self ):
                     self._send_trait_items_event( self.name_items,
                         TraitSetEvent( None, added ) )
         except TraitError, excp:
@@ -2779,7 +3461,7 @@ class TraitSetObject ( set ):
         if len( removed ) > 0:
             set.difference_update( self, removed )
 
-            if self.name_items is not None:
+            if items_observed( self ):
                 self._send_trait_items_event( self.name_items,
                     TraitSetEvent( removed ) )
 
@@ -2788,7 +3470,7 @@ class TraitSetObject ( set ):
         if len( removed ) > 0:
             set.difference_update( self, removed )
 
-            if self.name_items is not None:
+            if items_observed( self ):
                 self._send_trait_items_event( self.name_items,
                     TraitSetEvent( removed ) )
 
@@ -2804,15 +3486,14 @@ class TraitSetObject ( set ):
             set.difference_update( self, removed )
 
             if len( added ) > 0:
-                validate = self.trait.item_trait.handler.validate
-                if validate is not None:
-                    name  = self.name
-                    added = set( [ validate( object, name, item )
-                                   for item in added ] )
+                item_trait = self.trait.item_trait
+                if item_trait.handler.validate is not None:
+                    added = set( item_trait.validate_items( object, self.name,
+                                                            added ) )
 
                 set.update( self, added )
 
-            if self.name_items is not None:
+            if items_observed( self ):
                 self._send_trait_items_event( self.name_items,
                     TraitSetEvent( removed, added ) )
 
@@ -2821,14 +3502,14 @@ class TraitSetObject ( set ):
             return set.add(self, value)
         if value not in self:
             try:
-                object   = self.object()
-                validate = self.trait.item_trait.handler.validate
-                if validate is not None:
-                    value = validate( object, self.name, value )
+                item_trait = self.trait.item_trait
+                if item_trait.handler.validate is not None:
+                    value = item_trait.validate( self.object(), self.name,
+                                                 value )
 
                 set.add( self, value )
 
-                if self.name_items is not None:
+                if items_observed( self ):
                     self._send_trait_items_event( self.name_items,
                         TraitSetEvent( None, set( [ value ] ) ) )
             except TraitError, excp:
@@ -2838,7 +3519,7 @@ class TraitSetObject ( set ):
     def remove ( self, value ):
         set.remove( self, value )
 
-        if self.name_items is not None:
+        if items_observed( self ):
             self._send_trait_items_event( self.name_items,
                 TraitSetEvent( set( [ value ] ) ) )
 
@@ -2849,19 +3530,22 @@ class TraitSetObject ( set ):
     def pop ( self ):
         value = set.pop( self )
 
-        if self.name_items is not None:
+        if items_observed( self ):
             self._send_trait_items_event( self.name_items,
                 TraitSetEvent( set( [ value ] ) ) )
 
         return value
 
     def clear ( self ):
+        if not items_observed( self ):
+            set.clear( self )
+            return
+
         removed = set( self )
         set.clear( self )
 
-        if self.name_items is not None:
-            self._send_trait_items_event( self.name_items,
-                TraitSetEvent( removed ) )
+        self._send_trait_items_event( self.name_items,
+            TraitSetEvent( removed ) )
 
     def copy ( self ):
         """ Return a true ``set`` object with a copy of the data.
@@ -2876,21 +3560,10 @@ class TraitSetObject ( set ):
                 self.__getstate__())
 
     def __getstate__ ( self ):
-        result = self.__dict__.copy()
-        result.pop('object', None)
-        result.pop('trait', None)
-        return result
+        return container_state( self )
 
     def __setstate__ ( self, state ):
-        name   = state.setdefault('name', '')
-        object = state.pop( 'object', None )
-        if object is not None:
-            self.object = ref( object )
-            self.rename( name )
-        else:
-            self.object = lambda: None
-
-        self.__dict__.update( state )
+        set_container_state( self, state )
 
     def __ior__(self, value):
         self.update(value)
@@ -2914,6 +3587,8 @@ class TraitSetObject ( set ):
 
 class TraitDictEvent ( object ):
 
+    __slots__ = ( 'added', 'changed', 'removed' )
+
     def __init__ ( self, added = None, changed = None, removed = None ):
         """
         Parameters
@@ -3011,6 +3686,9 @@ class TraitDict ( TraitHandler ):
 
     def validate ( self, object, name, value ):
         if isinstance( value, dict ):
+            if is_detached_copy( value, self ):
+                return TraitDictObject.trusted( self, object, name, value )
+
             return TraitDictObject( self, object, name, value )
         self.error( object, name, value )
 
@@ -3051,33 +3729,75 @@ class TraitDict ( TraitHandler ):
 
 class TraitDictObject ( dict ):
 
+    __slots__ = ContainerSlots
+
     def __init__ ( self, trait, object, name, value ):
         self.trait      = trait
         self.object     = ref( object )
         self.name       = name
         self.name_items = None
         if trait.has_items:
-            self.name_items = name + '_items'
+            self.name_items = items_name( name )
 
         if len( value ) > 0:
             dict.update( self, self._validate_dic( value ) )
 
+    def trusted ( cls, trait, object, name, value ):
+        """ Returns a new dictionary object for the *name* trait of *object*
+            containing the items of *value* (a dictionary or a sequence of
+            key/value pairs), which must already have been validated by
+            *trait* (e.g. the items of a copy of another dictionary object for
+            the same trait).
+        """
+        self            = cls.__new__( cls )
+        self.trait      = trait
+        self.object     = ref( object )
+        self.name       = name
+        self.name_items = None
+        if trait.has_items:
+            self.name_items = items_name( name )
+
+        dict.update( self, value )
+
+        return self
+
+    trusted = classmethod( trusted )
+
     def _send_trait_items_event(self, name, event, items_event=None):
         """ Send a TraitDictEvent to the owning object if there is one.
         """
+        if batched_events and defer_items_event( self, name, event,
+                                                 items_event ):
+            return
+
         object = self.object()
         if object is not None:
             if items_event is None and hasattr(self, 'trait'):
                 items_event = self.trait.items_event()
             object.trait_items_event(name, event, items_event)
 
+    def batch ( self ):
+        """ Returns a context manager which defers the items events sent by
+            changes made to the dictionary until the context exits, when
+            they are sent as a single event containing the net changes.
+
+            For example::
+
+                with object.values.batch():
+                    for key, value in items:
+                        object.values[ key ] = value
+        """
+        return batch_items_events( self, merge_dict_events )
+
     def __deepcopy__ ( self, memo ):
         id_self = id( self )
         if id_self in memo:
             return memo[ id_self ]
 
-        memo[ id_self ] = result = TraitDictObject( self.trait, lambda: None,
-                         self.name, dict([ copy.deepcopy( x, memo ) for x in self.iteritems() ]) )
+        # The copied items are already valid, so do not validate them again:
+        memo[ id_self ] = result = TraitDictObject.trusted( self.trait,
+                    lambda: None, self.name,
+                    [ copy.deepcopy( x, memo ) for x in self.iteritems() ] )
 
         return result
 
@@ -3102,7 +3822,8 @@ class TraitDictObject ( dict ):
             if validate is not None:
                 value = validate( object, self.name, value )
 
-            if self.name_items is not None:
+            observed = items_observed( self )
+            if observed:
                 if key in self:
                     added   = None
                     old     = self[ key ]
@@ -3113,7 +3834,7 @@ class TraitDictObject ( dict ):
 
             dict.__setitem__( self, key, value )
 
-            if self.name_items is not None:
+            if observed:
                 if added is None:
                     try:
                         if old == value:
@@ -3129,23 +3850,25 @@ class TraitDictObject ( dict ):
             raise excp
 
     def __delitem__ ( self, key ):
-        if self.name_items is not None:
+        observed = items_observed( self )
+        if observed:
             removed = { key: self[ key ] }
 
         dict.__delitem__( self, key )
 
-        if self.name_items is not None:
+        if observed:
             self._send_trait_items_event( self.name_items,
                 TraitDictEvent( removed = removed ) )
 
     def clear ( self ):
         if len( self ) > 0:
-            if self.name_items is not None:
+            observed = items_observed( self )
+            if observed:
                 removed = self.copy()
 
             dict.clear( self )
 
-            if self.name_items is not None:
+            if observed:
                 self._send_trait_items_event( self.name_items,
                     TraitDictEvent( removed = removed ) )
 
@@ -3158,7 +3881,7 @@ class TraitDictObject ( dict ):
         if len( dic ) > 0:
             new_dic = self._validate_dic( dic )
 
-            if self.name_items is not None:
+            if items_observed( self ):
                 added   = {}
                 changed = {}
                 for key, value in new_dic.iteritems():
@@ -3181,7 +3904,7 @@ class TraitDictObject ( dict ):
         self[ key ] = value
         result      = self[ key ]
 
-        if self.name_items is not None:
+        if items_observed( self ):
             self._send_trait_items_event( self.name_items,
                 TraitDictEvent( added = { key: result } ) )
 
@@ -3191,7 +3914,7 @@ class TraitDictObject ( dict ):
         if (value is Undefined) or key in self:
             result = dict.pop( self, key )
 
-            if self.name_items is not None:
+            if items_observed( self ):
                 self._send_trait_items_event( self.name_items,
                     TraitDictEvent( removed = { key: result } ) )
 
@@ -3202,7 +3925,7 @@ class TraitDictObject ( dict ):
     def popitem ( self ):
         result = dict.popitem( self )
 
-        if self.name_items is not None:
+        if items_observed( self ):
             self._send_trait_items_event( self.name_items,
                 TraitDictEvent( removed = { result[0]: result[1] } ) )
 
@@ -3218,53 +3941,36 @@ class TraitDictObject ( dict ):
                           ( self.object(), name ) )
 
     def __getstate__ ( self ):
-        result = self.__dict__.copy()
-        result.pop('object', None)
-        result.pop('trait', None)
-        return result
+        return container_state( self )
 
     def __setstate__ ( self, state ):
-        name   = state.setdefault('name', '')
-        object = state.pop( 'object', None )
-        if object is not None:
-            self.object = ref( object )
-            self.rename( name )
-        else:
-            self.object = lambda: None
-
-        self.__dict__.update( state )
+        set_container_state( self, state )
 
 #-- Private Methods ------------------------------------------------------------
 
     def _validate_dic ( self, dic ):
-        name    = self.name
-        new_dic = {}
-
-        key_validate = self.trait.key_trait.handler.validate
-        if key_validate is None:
-            key_validate = lambda object, name, key: key
-
-        value_validate = self.trait.value_trait.handler.validate
-        if value_validate is None:
-            value_validate = lambda object, name, value: value
-
-        object = self.object()
-        for key, value in dic.iteritems():
+        object      = self.object()
+        name        = self.name
+        key_trait   = self.trait.key_trait
+        value_trait = self.trait.value_trait
+        keys        = dic.keys()
+        values      = dic.values()
+
+        if key_trait.handler.validate is not None:
             try:
-                key = key_validate( object, name, key )
+                keys = key_trait.validate_items( object, name, keys )
             except TraitError, excp:
                 excp.set_prefix( 'Each key of the' )
                 raise excp
 
+        if value_trait.handler.validate is not None:
             try:
-                value = value_validate( object, name, value )
+                values = value_trait.validate_items( object, name, values )
             except TraitError, excp:
                 excp.set_prefix( 'Each value of the' )
                 raise excp
 
-            new_dic[ key ] = value
-
-        return new_dic
+        return dict( zip( keys, values ) )
 
 #-------------------------------------------------------------------------------
 #  Tell the C-based traits module about 'TraitListObject', 'TraitSetObject and
@@ -24,9 +24,11 @@
 
 from __future__ import absolute_import
 
+from collections import deque
 import contextlib
+from functools import partial
 from threading import local as thread_local
-from threading import Thread
+from threading import Lock, Thread
 from thread import get_ident
 import traceback
 from types import MethodType
@@ -36,6 +38,11 @@ import sys
 from .trait_base import Uninitialized
 from .trait_errors import TraitNotificationError
 
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
 #-------------------------------------------------------------------------------
 #  Global Data:
 #-------------------------------------------------------------------------------
@@ -46,6 +53,9 @@ ui_thread = -1
 # The handler for notifications that must be run on the UI thread
 ui_handler = None
 
+# The queue for notifications that must be run on an asyncio event loop
+async_queue = None
+
 #-------------------------------------------------------------------------------
 #  Sets up the user interface thread handler:
 #-------------------------------------------------------------------------------
@@ -64,6 +74,43 @@ def ui_dispatch( handler, *args, **kw ):
     else:
         ui_handler( handler, *args, **kw )
 
+#-------------------------------------------------------------------------------
+#  Sets up the event loop used for 'async' notifications:
+#-------------------------------------------------------------------------------
+
+def set_async_event_loop ( loop ):
+    """ Sets the asyncio event loop on which 'async' notifications are run.
+
+    Notifications still pending on a previously set event loop are run on
+    that loop. Passing None disables 'async' dispatch until a new event loop
+    is set.
+    """
+    global async_queue
+
+    if loop is None:
+        async_queue = None
+    elif asyncio is None:
+        raise TraitNotificationError(
+            "'async' trait change notifications require asyncio." )
+    else:
+        async_queue = AsyncNotificationQueue( loop )
+
+def wait_for_async_notifications ( ):
+    """ Returns a future which completes once every pending 'async'
+    notification has run.
+
+    The future must be awaited on the event loop set using
+    set_async_event_loop. Notifications generated by the handlers while
+    waiting are waited for as well. If the exception handler re-raises an
+    exception raised by a handler, the future raises it.
+    """
+    if async_queue is None:
+        raise TraitNotificationError(
+            "No event loop has been set for 'async' trait change "
+            "notifications." )
+
+    return async_queue.drained()
+
 #-------------------------------------------------------------------------------
 #  'NotificationExceptionHandlerState' class:
 #-------------------------------------------------------------------------------
@@ -648,3 +695,195 @@ class NewTraitChangeNotifyWrapper ( TraitChangeNotifyWrapper ):
 
     def dispatch ( self, handler, *args ):
         Thread( target = handler, args = args ).start()
+
+#-------------------------------------------------------------------------------
+#  'AsyncTraitChangeNotifyWrapper' class:
+#-------------------------------------------------------------------------------
+
+class AsyncTraitChangeNotifyWrapper ( TraitChangeNotifyWrapper ):
+    """ Dynamic change notify wrapper, dispatching on an asyncio event loop.
+
+    This class is in charge to dispatch trait change events to dynamic
+    listener, typically created using the `on_trait_change` method and the
+    `dispatch` parameter set to 'async'. Handlers may be coroutine
+    functions, in which case the coroutine they return is run to completion
+    on the event loop.
+    """
+
+    def _dispatch_change_event(self, object, trait_name, old, new, handler):
+        """ Prepare and queue a trait change event for a listener. """
+
+        queue = async_queue
+        if queue is None:
+            raise TraitNotificationError(
+                "No event loop has been set for 'async' trait change "
+                "notifications; use set_async_event_loop to set one." )
+
+        # Extract the arguments needed from the handler.
+        args = self.argument_transform( object, trait_name, old, new )
+        queue.put( ( object, trait_name, old, new, handler, args ) )
+
+#-------------------------------------------------------------------------------
+#  'AsyncNotificationQueue' class:
+#-------------------------------------------------------------------------------
+
+class AsyncNotificationQueue ( object ):
+    """ Runs 'async' notifications on an asyncio event loop.
+
+    Notifications for the same object run in the order they were dispatched,
+    each one (including any coroutine returned by its handler) completing
+    before the next one starts. Notifications for different objects may be
+    interleaved while a coroutine handler is waiting.
+
+    Only **put** may be called from a thread other than the event loop's.
+    """
+
+    def __init__ ( self, loop ):
+        self.loop = loop
+
+        # Mapping from id(object) to the deque of its pending notifications.
+        # Each pending notification holds a reference to its object, so the
+        # id cannot be reused while the deque exists.
+        self._queues = {}
+
+        # Number of notifications queued but not yet complete:
+        self._pending = 0
+        self._lock = Lock()
+
+        # Futures waiting for the pending count to reach zero:
+        self._waiters = []
+
+        # First exception re-raised by the exception handler since the queue
+        # was last drained:
+        self._exception = None
+
+    def put ( self, notification ):
+        """ Queues a notification from any thread.
+        """
+        with self._lock:
+            self._pending += 1
+        try:
+            self.loop.call_soon_threadsafe( self._append, notification )
+        except:
+            with self._lock:
+                self._pending -= 1
+            raise
+
+    def drained ( self ):
+        """ Returns a future which completes when no notifications are
+        pending.
+        """
+        future = self.loop.create_future()
+        with self._lock:
+            pending = self._pending
+        if pending == 0:
+            future.set_result( None )
+        else:
+            self._waiters.append( future )
+
+        return future
+
+    def _append ( self, notification ):
+        key   = id( notification[0] )
+        queue = self._queues.get( key )
+        if queue is None:
+            self._queues[ key ] = queue = deque( [ notification ] )
+            self._run( key, queue )
+        else:
+            queue.append( notification )
+
+    def _run ( self, key, queue ):
+        """ Runs the notifications queued for one object until one of them
+            must wait for a coroutine.
+        """
+        while queue:
+            object, trait_name, old, new, handler, args = queue[0]
+            future = exception = None
+            try:
+                future = self._call( object, trait_name, old, new, handler,
+                                     args )
+            except Exception as e:
+                exception = e
+
+            if future is not None:
+                future.add_done_callback( partial( self._resume, key, queue ) )
+                return
+
+            queue.popleft()
+            self._finished( exception )
+
+        del self._queues[ key ]
+
+    def _resume ( self, key, queue, future ):
+        """ Completes a coroutine notification and runs the ones after it.
+        """
+        object, trait_name, old, new, handler, args = queue.popleft()
+        exception = None
+        try:
+            try:
+                future.result()
+            except ( Exception, asyncio.CancelledError ) as e:
+                if _post_change_event_tracer is not None:
+                    _post_change_event_tracer( object, trait_name, old, new,
+                                               handler, exception=e )
+                handle_exception( object, trait_name, old, new )
+            else:
+                if _post_change_event_tracer is not None:
+                    _post_change_event_tracer( object, trait_name, old, new,
+                                               handler, exception=None )
+        except Exception as e:
+            exception = e
+
+        self._finished( exception )
+        self._run( key, queue )
+
+    def _call ( self, object, trait_name, old, new, handler, args ):
+        """ Calls a handler, returning a future if it returned a coroutine.
+        """
+        if _pre_change_event_tracer is not None:
+            _pre_change_event_tracer( object, trait_name, old, new, handler )
+
+        try:
+            result = handler( *args )
+            if (asyncio.iscoroutine( result ) or
+                isinstance( result, asyncio.Future )):
+                return asyncio.ensure_future( result, loop = self.loop )
+        except Exception as e:
+            if _post_change_event_tracer is not None:
+                _post_change_event_tracer( object, trait_name, old, new,
+                                           handler, exception=e )
+            handle_exception( object, trait_name, old, new )
+        else:
+            if _post_change_event_tracer is not None:
+                _post_change_event_tracer( object, trait_name, old, new,
+                                           handler, exception=None )
+
+        return None
+
+    def _finished ( self, exception ):
+        """ Records the completion of a notification, waking up any waiters
+            once none are pending.
+        """
+        if (exception is not None) and (self._exception is None):
+            self._exception = exception
+
+        with self._lock:
+            self._pending -= 1
+            pending = self._pending
+        if pending > 0:
+            return
+
+        waiters, self._waiters     = self._waiters, []
+        exception, self._exception = self._exception, None
+        for waiter in waiters:
+            if waiter.done():
+                continue
+            if exception is None:
+                waiter.set_result( None )
+            else:
+                waiter.set_exception( exception )
+
+        if (exception is not None) and (len( waiters ) == 0):
+            self.loop.call_exception_handler( {
+                'message':   "Exception in 'async' trait change handler",
+                'exception': exception } )
@@ -24,19 +24,52 @@
 
 from __future__ import absolute_import
 
+import os
+import sys
 import warnings
 
-from .trait_base import SequenceTypes
+from array import array
+
+from .trait_base import SequenceTypes, class_of
 from .trait_errors import TraitError
-from .trait_handlers import TraitType, OBJECT_IDENTITY_COMPARE
-from .trait_types import Str, Any, Int as TInt, Float as TFloat
+from .trait_handlers import (TraitType, TraitNumericListObject,
+    OBJECT_IDENTITY_COMPARE, is_detached_copy, items_event)
+from .trait_types import Str, Any, Event, Int as TInt, Float as TFloat
 
 #-------------------------------------------------------------------------------
 #  Deferred imports from numpy:
 #-------------------------------------------------------------------------------
 
-ndarray = None
-asarray = None
+ndarray    = None
+asarray    = None
+frombuffer = None
+
+# The numpy.memmap subclass used as the value of MemmapArray traits (created
+# on first use):
+TraitMemmap = None
+
+#-------------------------------------------------------------------------------
+#  Pickle protocol 5 support:
+#-------------------------------------------------------------------------------
+
+try:
+    from pickle import PickleBuffer
+except ImportError:
+    # Out-of-band buffers require pickle protocol 5 (Python 3.8 or later):
+    PickleBuffer = None
+
+# The types of buffer objects accepted as array values without copying:
+if PickleBuffer is None:
+    BufferTypes = ( memoryview, )
+else:
+    BufferTypes = ( memoryview, PickleBuffer )
+
+# The resizable buffer protocol objects accepted as array values. Their data
+# is copied, since an array sharing it would be invalidated by (or, on Python
+# 3, would prevent) resizing them:
+ResizableBufferTypes = ( bytearray, array )
+
+ArrayBufferTypes = BufferTypes + ResizableBufferTypes
 
 #-------------------------------------------------------------------------------
 #  numpy dtype mapping:
@@ -60,6 +93,163 @@ def dtype2trait ( dtype ):
     else:
         return Any
 
+def typecode2trait ( typecode ):
+    """ Get the corresponding trait for an 'array' module typecode.
+    """
+    try:
+        import numpy
+    except ImportError:
+        if typecode in 'fd':
+            return TFloat
+
+        return TInt
+
+    return dtype2trait( numpy.dtype( typecode ) )
+
+#-------------------------------------------------------------------------------
+#  Reconstructs an array from a (possibly out-of-band) pickled data buffer:
+#-------------------------------------------------------------------------------
+
+def array_from_buffer ( buffer, dtype, shape, order ):
+    """ Reconstructs an array pickled by an ArrayBuffer, using the restored
+        data buffer without copying it.
+    """
+    from numpy import frombuffer
+
+    if (PickleBuffer is not None) and isinstance( buffer, PickleBuffer ):
+        buffer = buffer.raw()
+
+    return frombuffer( buffer, dtype ).reshape( shape, order = order )
+
+#-------------------------------------------------------------------------------
+#  'ArrayBuffer' class:
+#-------------------------------------------------------------------------------
+
+class ArrayBuffer ( object ):
+    """ Wraps an array trait value so that pickle protocol 5 (or later)
+        emits the array's data as an out-of-band PickleBuffer.
+
+        Only contiguous arrays of plain ndarray type whose data does not
+        contain Python objects are emitted out-of-band; all other arrays (and
+        all earlier protocols) use the array's normal pickled form.
+    """
+
+    __slots__ = ( 'array', )
+
+    def __init__ ( self, array ):
+        self.array = array
+
+    def __reduce_ex__ ( self, protocol ):
+        array = self.array
+        if (protocol >= 5) and self.is_buffered( array ):
+            flags = array.flags
+            order = 'C'
+            if flags.f_contiguous and not flags.c_contiguous:
+                order = 'F'
+
+            return ( array_from_buffer, ( PickleBuffer( array ), array.dtype,
+                                          array.shape, order ) )
+
+        return array.__reduce_ex__( protocol )
+
+    def is_buffered ( array ):
+        """ Returns whether the data of an array value can be pickled as an
+            out-of-band buffer.
+        """
+        if ((PickleBuffer is None) or (ndarray is None) or
+            (type( array ) is not ndarray) or array.dtype.hasobject):
+            return False
+
+        flags = array.flags
+
+        return (flags.c_contiguous or flags.f_contiguous)
+
+    is_buffered = staticmethod( is_buffered )
+
+#-------------------------------------------------------------------------------
+#  'ArrayCopyStats' class:
+#-------------------------------------------------------------------------------
+
+class ArrayCopyStats ( object ):
+    """ Records how many of the values validated by an array trait had to be
+        copied (e.g. to convert a list or to cast an array to the trait's
+        dtype), and whether the most recently validated value was copied.
+
+        Each array trait has an instance as its **copy_stats** metadata. The
+        statistics are shared by all objects using the same trait definition
+        (e.g. all instances of a class), and so are running totals for the
+        trait definition rather than a report of a particular assignment:
+        call **reset** before making the assignments to be measured.
+    """
+
+    __slots__ = ( 'validated', 'copies', 'copied' )
+
+    def __init__ ( self ):
+        self.reset()
+
+    def reset ( self ):
+        """ Resets the statistics.
+        """
+        self.validated = self.copies = 0
+        self.copied    = False
+
+    def __repr__ ( self ):
+        return 'ArrayCopyStats(validated=%d, copies=%d, copied=%s)' % (
+               self.validated, self.copies, self.copied )
+
+#-------------------------------------------------------------------------------
+#  'TraitArrayEvent' class:
+#-------------------------------------------------------------------------------
+
+class TraitArrayEvent ( object ):
+    """ The value of the items event of an array trait, describing an in-place
+        change made to part of the array using HasTraits.trait_array_update().
+    """
+
+    __slots__ = ( 'index', 'removed', 'added' )
+
+    def __init__ ( self, index, removed, added ):
+        # The index (or tuple of indices or slices) of the modified region:
+        self.index = index
+
+        # A copy of the previous contents of the region:
+        self.removed = removed
+
+        # The new contents of the region (a view of the array when *index*
+        # uses basic indexing):
+        self.added = added
+
+# The (shared) items event trait of array traits (created on first use):
+_array_items_event = None
+
+def array_items_event ( ):
+    global _array_items_event
+
+    if _array_items_event is None:
+        _array_items_event = Event( TraitArrayEvent,
+                                    is_base = False ).as_ctrait()
+
+    return _array_items_event
+
+#-------------------------------------------------------------------------------
+#  Compiles an array trait shape into the bounds of each axis:
+#-------------------------------------------------------------------------------
+
+def shape_bounds ( shape ):
+    """ Returns a tuple containing the ( minimum, maximum ) size of each axis
+        of an array trait *shape*, where a maximum of None means unbounded.
+    """
+    bounds = []
+    for item in shape:
+        if item is None:
+            bounds.append( ( 0, None ) )
+        elif type( item ) is int:
+            bounds.append( ( item, item ) )
+        else:
+            bounds.append( tuple( item ) )
+
+    return tuple( bounds )
+
 #-------------------------------------------------------------------------------
 #  'AbstractArray' trait base class:
 #-------------------------------------------------------------------------------
@@ -72,7 +262,7 @@ class AbstractArray ( TraitType ):
                          coerce = False, typecode = None, **metadata ):
         """ Returns an AbstractArray trait.
         """
-        global ndarray, asarray
+        global ndarray, asarray, frombuffer
 
         try:
             import numpy
@@ -80,7 +270,7 @@ class AbstractArray ( TraitType ):
             raise TraitError( "Using Array or CArray trait types requires the "
                               "numpy package to be installed." )
 
-        from numpy import asarray, ndarray
+        from numpy import asarray, frombuffer, ndarray
 
         # Mark this as being an 'array' trait:
         metadata[ 'array' ] = True
@@ -128,50 +318,77 @@ class AbstractArray ( TraitType ):
         self.shape  = shape
         self.coerce = coerce
 
+        # The per-axis size bounds checked by 'validate':
+        self.bounds = None
+        if shape is not None:
+            self.bounds = shape_bounds( shape )
+
+        self.copy_stats = metadata.setdefault( 'copy_stats',
+                                               ArrayCopyStats() )
+
+        # The read-only default value shared by all objects when the
+        # 'copy_on_write' metadata is set (created on first use):
+        self._shared_default = None
+
+        # Define an '_items' event for in-place changes unless disabled:
+        self.has_items = metadata.pop( 'items', True )
+
         super( AbstractArray, self ).__init__( value, **metadata )
 
     def validate ( self, object, name, value ):
         """ Validates that the value is a valid array.
         """
+        dtype  = self.dtype
+        copied = False
         try:
-            # Make sure the value is an array:
-            type_value = type( value )
-            if not isinstance( value, ndarray ):
-                if not isinstance( value, SequenceTypes ):
+            # Make sure the value is an array, without copying the data of
+            # arrays and non-resizable buffers:
+            if isinstance( value, ndarray ):
+                pass
+            elif isinstance( value, ArrayBufferTypes ):
+                # Wrap buffers (such as restored out-of-band pickle buffers)
+                # using their own item format and shape, so that their items
+                # are converted (rather than reinterpreted) below:
+                resizable = isinstance( value, ResizableBufferTypes )
+                try:
+                    value = asarray( memoryview( value ) )
+                except TypeError:
+                    # 'array' objects only support the old buffer interface
+                    # on Python 2:
+                    value = frombuffer( value, value.typecode )
+
+                if resizable and ((dtype is None) or (value.dtype == dtype)):
+                    value  = value.copy()
+                    copied = True
+            elif isinstance( value, SequenceTypes ):
+                value  = asarray( value, dtype )
+                copied = True
+            else:
+                self.error( object, name, value )
+
+            # Make sure the array is of the right type. Note that Array traits
+            # also cast (rather than only upcast) arrays of a different type:
+            if (dtype is not None) and (value.dtype != dtype):
+                value  = value.astype( dtype )
+                copied = True
+
+            # Make sure that the value's shape is compatible:
+            bounds = self.bounds
+            if bounds is not None:
+                value_shape = value.shape
+                if len( bounds ) != len( value_shape ):
                     self.error( object, name, value )
-                if self.dtype is not None:
-                    value = asarray( value, self.dtype )
-                else:
-                    value = asarray( value )
-
-            # Make sure the array is of the right type:
-            if ((self.dtype is not None) and
-                (value.dtype != self.dtype)):
-                if self.coerce:
-                    value = value.astype( self.dtype )
-                else:
-                    # XXX: this also coerces.
-                    value = asarray( value, self.dtype )
-
-            # If no shape requirements, then return the value:
-            trait_shape = self.shape
-            if trait_shape is None:
-                return value
 
-            # Else make sure that the value's shape is compatible:
-            value_shape = value.shape
-            if len( trait_shape ) == len( value_shape ):
-                for i, dim in enumerate( value_shape ):
-                    item = trait_shape[i]
-                    if item is not None:
-                        if type( item ) is int:
-                            if dim != item:
-                                break
-                        elif ((dim < item[0]) or
-                              ((item[1] is not None) and (dim > item[1]))):
-                            break
-                else:
-                    return value
+                for dim, ( low, high ) in zip( value_shape, bounds ):
+                    if (dim < low) or ((high is not None) and (dim > high)):
+                        self.error( object, name, value )
+
+            stats            = self.copy_stats
+            stats.validated += 1
+            stats.copies    += copied
+            stats.copied     = copied
+
+            return value
         except:
             pass
 
@@ -228,12 +445,52 @@ class AbstractArray ( TraitType ):
                                   enter_set = enter_set  )
         return editor
 
+    def writeable_value ( self, object, name ):
+        """ Returns the value of the *object* trait *name*, first replacing the
+            shared read-only default value (if that is the current value) with
+            a private writeable copy.
+        """
+        value = getattr( object, name )
+        if (value is not None) and (value is self._shared_default):
+            value = value.copy()
+            object.trait_setq( **{ name: value } )
+
+        return value
+
+    def update_items ( self, object, name, index, values ):
+        """ Assigns *values* to the region *index* of the array value of the
+            *object* trait *name* in place, and sends a TraitArrayEvent
+            describing the change to any handlers of its '_items' event.
+        """
+        value = self.writeable_value( object, name )
+        if value is None:
+            raise TraitError( "The '%s' trait of a '%s' instance has no array "
+                              "to update." % ( name,
+                                               object.__class__.__name__ ) )
+
+        items_name = name + '_items'
+        if not (self.has_items and object._trait_items_observed( items_name )):
+            value[ index ] = values
+            return
+
+        removed = value[ index ].copy()
+        value[ index ] = values
+        object.trait_items_event( items_name,
+            TraitArrayEvent( index, removed, value[ index ] ),
+            array_items_event() )
+
+    def items_event ( self ):
+        return array_items_event()
+
     #-- Private Methods --------------------------------------------------------
 
     def get_default_value ( self ):
         """ Returns the default value constructor for the type (called from the
             trait factory.
         """
+        if self.copy_on_write:
+            return ( 0, self.shared_default_value() )
+
         return ( 7, ( self.copy_default_value,
                  ( self.validate( None, None, self.default_value ), ), None ) )
 
@@ -243,6 +500,18 @@ class AbstractArray ( TraitType ):
         """
         return value.copy()
 
+    def shared_default_value ( self ):
+        """ Returns the read-only copy of the default value shared by all
+            objects using 'copy_on_write' defaults.
+        """
+        value = self._shared_default
+        if value is None:
+            value = self.validate( None, None, self.default_value ).copy()
+            value.flags.writeable = False
+            self._shared_default = value
+
+        return value
+
     def _default_for_dtype_and_shape ( self, dtype, shape ):
         """ Invent a suitable default value for a given dtype and shape. """
         from numpy import zeros
@@ -303,7 +572,10 @@ class Array ( AbstractArray ):
         -------------
         *value* or ``zeros(min(shape))``, where ``min(shape)`` refers to the
         minimum shape allowed by the array. If *shape* is not specified, the
-        minimum shape is (0,).
+        minimum shape is (0,). Each object normally gets its own copy of the
+        default value; if the *copy_on_write* metadata is True, objects instead
+        share a single read-only copy until a new value is assigned or a
+        writeable copy is requested using HasTraits.trait_array_writeable().
 
         Description
         -----------
@@ -350,7 +622,10 @@ class CArray ( AbstractArray ):
         -------------
         *value* or ``zeros(min(shape))``, where ``min(shape)`` refers to the
         minimum shape allowed by the array. If *shape* is not specified, the
-        minimum shape is (0,).
+        minimum shape is (0,). Each object normally gets its own copy of the
+        default value; if the *copy_on_write* metadata is True, objects instead
+        share a single read-only copy until a new value is assigned or a
+        writeable copy is requested using HasTraits.trait_array_writeable().
 
         Description
         -----------
@@ -387,10 +662,382 @@ class ArrayOrNone ( CArray ):
         if dv is None:
             return ( 0, dv )
         else:
-            return ( 7, ( self.copy_default_value,
-                          ( self.validate( None, None, dv ), ), None ) )
+            return super( ArrayOrNone, self ).get_default_value()
 
     def _default_for_dtype_and_shape ( self, dtype, shape ):
         # For ArrayOrNone, if no default is explicitly specified, we
         # always default to `None`.
         return None
+
+#-------------------------------------------------------------------------------
+#  Memory-mapped array support:
+#-------------------------------------------------------------------------------
+
+def memmap_class ( ):
+    """ Returns the numpy.memmap subclass used as the value of MemmapArray
+        traits, whose pickled form contains only the location of its data.
+    """
+    global TraitMemmap
+
+    if TraitMemmap is None:
+        import mmap
+        import numpy
+
+        class TraitMemmap ( numpy.memmap ):
+
+            def __reduce__ ( self ):
+                if not isinstance( self.base, mmap.mmap ):
+                    # Views of a mapped array are pickled as plain arrays:
+                    return self.view( numpy.ndarray ).__reduce__()
+
+                order = 'C'
+                if self.flags.f_contiguous and not self.flags.c_contiguous:
+                    order = 'F'
+
+                return ( open_memmap, ( self.filename, self.dtype, self.shape,
+                                        self.offset, order, self.mode ) )
+
+            def __reduce_ex__ ( self, protocol ):
+                return self.__reduce__()
+
+        TraitMemmap.__name__ = 'TraitMemmap'
+
+    return TraitMemmap
+
+def open_memmap ( path, dtype, shape, offset = 0, order = 'C', mode = 'r' ):
+    """ Returns an array of the specified *dtype* and *shape* mapped from the
+        data starting at *offset* in the file *path*.
+    """
+    return memmap_class()( path, dtype = dtype, mode = mode, offset = offset,
+                           shape = shape, order = order )
+
+def read_npy_header ( path ):
+    """ Returns the ( dtype, shape, offset, order ) of the array stored in the
+        .npy file *path*, without reading its data.
+    """
+    from numpy.lib import format
+
+    with open( path, 'rb' ) as fh:
+        version = format.read_magic( fh )
+        if version == ( 1, 0 ):
+            shape, fortran_order, dtype = format.read_array_header_1_0( fh )
+        else:
+            shape, fortran_order, dtype = format.read_array_header_2_0( fh )
+
+        if dtype.hasobject:
+            raise ValueError( 'arrays of Python objects cannot be mapped' )
+
+        return ( dtype, shape, fh.tell(), 'CF'[ fortran_order ] )
+
+def reset_memmap_arrays ( object, name, old, new ):
+    """ Resets the MemmapArray traits of *object* whose file path is given by
+        its *name* trait, so that they are mapped from the new file the next
+        time they are used. Each MemmapArray trait names it as the
+        'static_listener' of its path trait, so that MetaHasTraits attaches it
+        to the class trait of the path and it handles every object of the
+        class.
+
+        Arrays already mapped from the new file (e.g. those assigned by
+        copy_traits or __setstate__ before the path itself) are kept.
+    """
+    path  = os.path.abspath( new ) if new else None
+    names = []
+    for trait_name in object.trait_names( memmap_path = name ):
+        if object._trait_has_value( trait_name ):
+            filename = getattr( getattr( object, trait_name ), 'filename',
+                                None )
+            if (filename is not None) and (filename == path):
+                continue
+
+        names.append( trait_name )
+
+    object.reset_traits( names )
+
+#-------------------------------------------------------------------------------
+#  'MemmapArray' trait:
+#-------------------------------------------------------------------------------
+
+class MemmapArray ( AbstractArray ):
+    """ Defines a trait whose value is a numpy array memory-mapped from a
+        file, for arrays too large to keep in memory.
+    """
+
+    def __init__ ( self, path = None, dtype = None, shape = None,
+                   offset = 0, mode = 'r', **metadata ):
+        """ Returns a MemmapArray trait.
+
+        Parameters
+        ----------
+        path : string
+            The name of the object trait containing the path of the file the
+            array is mapped from. The file is opened when the array is first
+            used, and the array is reset whenever the path changes.
+        dtype : a numpy dtype (e.g., float64)
+            The type of elements in the array. The dtype of a .npy file must
+            match it exactly (the data is never cast). Required for raw
+            (non-.npy) files.
+        shape : a tuple
+            Describes the required shape of the array, as for Array. For raw
+            files, at most one dimension can be unspecified, and its size is
+            derived from the size of the file.
+        offset : integer
+            The offset of the data in raw files (.npy files specify their own
+            data offset).
+        mode : 'r', 'r+' or 'c'
+            The mode used to map the file: read-only, read-write or
+            copy-on-write.
+
+        Default Value
+        -------------
+        The array mapped from the file named by the *path* trait, or the
+        default value of an Array with the same dtype and shape if the path is
+        empty (or if *path* is not specified).
+
+        Description
+        -----------
+        A file path string can also be assigned to the trait directly. Any
+        other value assigned to the trait is validated as for Array (and need
+        not be memory-mapped). When pickled, the mapped array is stored as the
+        location of its data rather than the data itself.
+        """
+        metadata[ 'memmap_path' ] = path
+        if path is not None:
+            metadata[ 'static_listener' ] = ( path, reset_memmap_arrays )
+
+        # Clones share the mapped array rather than reading it into memory:
+        metadata.setdefault( 'copy', 'ref' )
+
+        super( MemmapArray, self ).__init__( dtype, shape, **metadata )
+
+        self.path   = path
+        self.offset = offset
+        self.mode   = mode
+
+    def validate ( self, object, name, value ):
+        """ Validates that the value is a valid array, mapping it from the
+            file if it is a file path.
+        """
+        if isinstance( value, basestring ):
+            if value == '':
+                return self._default_for_dtype_and_shape( self.dtype,
+                                                          self.shape )
+            try:
+                value = self.open( value )
+            except Exception, excp:
+                raise TraitError( "The '%s' trait of %s could not be mapped "
+                    "from '%s': %s" % ( name, class_of( object ), value,
+                                        excp ) )
+
+            if (self.dtype is not None) and (value.dtype != self.dtype):
+                self.error( object, name, value )
+
+        return super( MemmapArray, self ).validate( object, name, value )
+
+    def info ( self ):
+        """ Returns descriptive information about the trait.
+        """
+        return '%s, or the path of a file containing one' % super(
+               MemmapArray, self ).info()
+
+    def open ( self, path ):
+        """ Returns the array mapped from the file *path*.
+        """
+        if path.endswith( '.npy' ):
+            dtype, shape, offset, order = read_npy_header( path )
+
+            return open_memmap( path, dtype, shape, offset, order,
+                                self.mode )
+
+        dtype = self.dtype
+        if dtype is None:
+            raise ValueError( 'the dtype of a raw file must be specified' )
+
+        shape = self.shape
+        if shape is not None:
+            shape = [ item if (item is None) or (type( item ) is int)
+                      else None for item in shape ]
+            if shape.count( None ) > 1:
+                raise ValueError( 'the shape of a raw file can only have one '
+                                  'unspecified dimension' )
+
+            if None in shape:
+                known = 1
+                for item in shape:
+                    if item is not None:
+                        known *= item
+
+                size = ((os.path.getsize( path ) - self.offset) //
+                        dtype.itemsize)
+                shape[ shape.index( None ) ] = size // max( known, 1 )
+
+            shape = tuple( shape )
+
+        return open_memmap( path, dtype, shape, self.offset, 'C', self.mode )
+
+    #-- Private Methods --------------------------------------------------------
+
+    def get_default_value ( self ):
+        """ Returns the default value constructor for the type (called from the
+            trait factory).
+        """
+        return ( 8, self.copy_default_value )
+
+    def copy_default_value ( self, object ):
+        """ Returns the path of the file the array is mapped from (called from
+            the C code on first reference to a trait with no current value,
+            which then validates it). No array data is read or copied.
+        """
+        if self.path is None:
+            return ''
+
+        return getattr( object, self.path )
+
+#-------------------------------------------------------------------------------
+#  'NumericList' trait:
+#-------------------------------------------------------------------------------
+
+# The 'array' module typecodes of the numeric types supported by NumericList:
+NumericTypecodes = 'bBhHiIlLfd'
+try:
+    array( 'q' )
+    NumericTypecodes += 'qQ'
+except ValueError:
+    pass
+
+# Python numeric types and their corresponding 'array' module typecodes:
+PythonTypecodes = { float: 'd', int: 'l' }
+
+# The types of the values (other than numpy arrays) that can be assigned to a
+# NumericList trait:
+NumericValueTypes = SequenceTypes + ( array, ) + BufferTypes
+
+class NumericList ( TraitType ):
+    """ Defines a trait whose value is a list of numbers of a single numeric
+        type, stored in a contiguous 'array.array' buffer.
+    """
+
+    info_trait = None
+
+    def __init__ ( self, dtype = 'd', value = None, minlen = 0,
+                   maxlen = sys.maxint, items = True, **metadata ):
+        """ Returns a NumericList trait.
+
+        Parameters
+        ----------
+        dtype : an 'array' module typecode, numpy dtype or Python type
+            The type of the numbers in the list (e.g. 'd', 'int32' or float).
+            Numpy dtypes can only be used if numpy is installed, and must
+            correspond to an 'array' module typecode.
+        value : sequence
+            Default value for the list.
+        minlen : integer
+            The minimum length of a list that can be assigned to the trait.
+        maxlen : integer
+            The maximum length of a list that can be assigned to the trait.
+
+        Default Value
+        -------------
+        *value* or an empty list
+
+        Description
+        -----------
+        The value of a NumericList trait is a TraitNumericListObject, an
+        'array.array' subclass which sends the same items events as the value
+        of a List trait, and which exposes its data using the buffer protocol
+        (e.g. ``numpy.frombuffer(object.values)`` does not copy the data).
+        Assigned and added values are validated by converting them to the
+        list's type, and can be any sequences of numbers or objects exposing
+        a buffer of the list's type (such as numpy arrays).
+        """
+        metadata.setdefault( 'copy', 'deep' )
+
+        typecode = PythonTypecodes.get( dtype, dtype )
+        if not (isinstance( typecode, basestring ) and
+                (len( typecode ) == 1)):
+            try:
+                import numpy
+
+                typecode = numpy.dtype( dtype ).char
+            except Exception:
+                typecode = None
+
+        if typecode not in NumericTypecodes:
+            raise TraitError( 'could not convert %r to a numeric array '
+                              'typecode' % ( dtype, ) )
+
+        if value is None:
+            value = []
+
+        self.typecode   = typecode
+        self.item_trait = typecode2trait( typecode )().as_ctrait()
+        self.item_info  = self.item_trait.handler.info()
+        self.minlen     = max( 0, minlen )
+        self.maxlen     = max( minlen, maxlen )
+        self.has_items  = items
+
+        super( NumericList, self ).__init__( array( typecode, value ),
+                                             **metadata )
+
+    def validate ( self, object, name, value ):
+        """ Validates that the value is a valid numeric list.
+        """
+        if (isinstance( value, NumericValueTypes ) or
+            hasattr( value, '__array_interface__' )):
+            if object is None:
+                return value
+
+            if (is_detached_copy( value, self ) and
+                (value.typecode == self.typecode)):
+                return TraitNumericListObject.trusted( self, object, name,
+                                                       value )
+
+            return TraitNumericListObject( self, object, name, value )
+
+        self.error( object, name, value )
+
+    def info ( self ):
+        """ Returns descriptive information about the trait.
+        """
+        if self.minlen == 0:
+            if self.maxlen == sys.maxint:
+                size = 'items'
+            else:
+                size = 'at most %d items' % self.maxlen
+        else:
+            if self.maxlen == sys.maxint:
+                size = 'at least %d items' % self.minlen
+            else:
+                size = 'from %s to %s items' % ( self.minlen, self.maxlen )
+
+        return "a list of %s which are %s (stored as array typecode '%s')" % (
+                   size, self.item_info, self.typecode )
+
+    def inner_traits ( self ):
+        """ Returns the *inner trait* (or traits) for this trait.
+        """
+        return ( self.item_trait, )
+
+    def create_editor ( self ):
+        """ Returns the default UI editor for the trait.
+        """
+        from traitsui.api import ListEditor
+
+        return ListEditor( trait_handler = self,
+                           rows          = self.rows or 5 )
+
+    #-- Private Methods --------------------------------------------------------
+
+    def get_default_value ( self ):
+        """ Returns the default value constructor for the type (called from the
+            trait factory).
+        """
+        return ( 8, self.copy_default_value )
+
+    def copy_default_value ( self, object ):
+        """ Returns a copy of the default value (called from the C code on
+            first reference to a trait with no current value).
+        """
+        return array( self.typecode, self.default_value )
+
+    def items_event ( self ):
+        return items_event()
@@ -0,0 +1,756 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2014, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+
+""" A compact, schema-driven binary serializer for graphs of HasTraits
+    objects.
+
+    The schema of each HasTraits class is derived from its class traits: an
+    object is written as the values of its persisted traits (i.e. those
+    without any 'transient' metadata, and delegates with 'transient = False'
+    metadata) in a fixed order, so that the trait names are written only once
+    per class in each stream. Objects (and lists, dictionaries and sets) are
+    recorded in an object table as they are written, so that shared
+    references and reference cycles are preserved.
+    Values which have no compact encoding are embedded as pickles.
+
+    Objects whose class customizes pickling, or which have instance-defined
+    traits, do not fit their class's schema. Those whose class overrides
+    *__reduce__* or *__reduce_ex__* are embedded as pickles, and the others
+    are written as the state returned by their *__getstate__* method, which
+    is restored using their *__setstate__* method.
+
+    Other restored objects have their trait values assigned without
+    generating trait change notifications, in the same way as by
+    *trait_setq*. As with pickle, reading a stream imports the modules
+    defining the classes it refers to, so only read data from trusted
+    sources.
+"""
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+from __future__ import absolute_import
+
+import cPickle as pickle
+import sys
+
+from struct import Struct
+from weakref import WeakKeyDictionary
+
+from .has_traits import HasTraits
+from .ctraits import CHasTraits
+from .trait_errors import TraitError
+from .trait_numeric import AbstractArray
+from .trait_types import (BaseBool, BaseFloat, BaseInstance, BaseInt,
+    BaseLong, BaseStr, BaseUnicode, Dict, List, Set)
+
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# The header written at the start of each stream:
+Magic   = b'TRS'
+Version = 2
+Header  = Magic + Struct( 'B' ).pack( Version )
+
+# The type tags of the encoded values:
+NONE    = 0
+FALSE   = 1
+TRUE    = 2
+INT     = 3
+FLOAT   = 4
+COMPLEX = 5
+TEXT    = 6
+BYTES   = 7
+LIST    = 8
+TUPLE   = 9
+DICT    = 10
+SET     = 11
+OBJECT  = 12
+REF     = 13
+ARRAY   = 14
+PICKLED = 15
+STATE   = 16
+
+# The encoded form of each byte value:
+_byte = [ Struct( 'B' ).pack( i ) for i in range( 256 ) ]
+
+_float   = Struct( '<d' )
+_complex = Struct( '<dd' )
+
+# The integer types:
+IntTypes = ( int, long )
+
+#-------------------------------------------------------------------------------
+#  Variable length integer encoding:
+#-------------------------------------------------------------------------------
+
+def _varint ( n ):
+    """ Returns the encoding of a non-negative integer as a little-endian
+        sequence of 7-bit groups.
+    """
+    if n < 0x80:
+        return _byte[ n ]
+
+    result = bytearray()
+    while n >= 0x80:
+        result.append( (n & 0x7F) | 0x80 )
+        n >>= 7
+    result.append( n )
+
+    return bytes( result )
+
+def _zigzag ( n ):
+    """ Maps a signed integer onto a non-negative integer, so that values of
+        small magnitude have short encodings.
+    """
+    if n >= 0:
+        return n << 1
+
+    return ((-n) << 1) - 1
+
+#-------------------------------------------------------------------------------
+#  'TraitWriter' class:
+#-------------------------------------------------------------------------------
+
+class TraitWriter ( object ):
+    """ Writes a graph of values (including HasTraits objects) to a binary
+        stream.
+    """
+
+    def __init__ ( self ):
+        # The encoded chunks of the stream:
+        self.chunks = [ Header ]
+
+        # Maps the id of each object written to its index in the object
+        # table:
+        self.objects = {}
+
+        # The objects written (kept alive so that their ids remain unique):
+        self.written = []
+
+        # Maps each class written to the encoded prefix of its objects and its
+        # schema:
+        self.classes = {}
+
+    def getvalue ( self ):
+        """ Returns the encoded stream.
+        """
+        return b''.join( self.chunks )
+
+    def write_value ( self, value ):
+        """ Writes an arbitrary value to the stream.
+        """
+        writer = _writers.get( type( value ) )
+        if writer is None:
+            writer = _find_writer( value )
+
+        writer( self, value )
+
+    def write_none ( self, value ):
+        self.chunks.append( _byte[ NONE ] )
+
+    def write_bool ( self, value ):
+        if value:
+            self.chunks.append( _byte[ TRUE ] )
+        else:
+            self.chunks.append( _byte[ FALSE ] )
+
+    def write_int ( self, value ):
+        self.chunks.extend( ( _byte[ INT ], _varint( _zigzag( value ) ) ) )
+
+    def write_float ( self, value ):
+        self.chunks.extend( ( _byte[ FLOAT ], _float.pack( value ) ) )
+
+    def write_complex ( self, value ):
+        self.chunks.extend( ( _byte[ COMPLEX ],
+                              _complex.pack( value.real, value.imag ) ) )
+
+    def write_text ( self, value ):
+        data = value.encode( 'utf-8' )
+        self.chunks.extend( ( _byte[ TEXT ], _varint( len( data ) ), data ) )
+
+    def write_bytes ( self, value ):
+        self.chunks.extend( ( _byte[ BYTES ], _varint( len( value ) ),
+                              bytes( value ) ) )
+
+    def write_list ( self, value ):
+        if not self._write_ref( value ):
+            self._write_items( LIST, value )
+
+    def write_tuple ( self, value ):
+        self._write_items( TUPLE, value )
+
+    def write_set ( self, value ):
+        if not self._write_ref( value ):
+            self._write_items( SET, value )
+
+    def write_dict ( self, value ):
+        if self._write_ref( value ):
+            return
+
+        self.chunks.extend( ( _byte[ DICT ], _varint( len( value ) ) ) )
+        write_value = self.write_value
+        for key, item in value.items():
+            write_value( key )
+            write_value( item )
+
+    def write_object ( self, value ):
+        """ Writes a HasTraits object (or a reference to a previously written
+            one) to the stream.
+        """
+        klass = value.__class__
+        hooks = _pickling_hooks( klass )
+        if hooks == 'reduce':
+            self.write_pickled( value )
+            return
+
+        if self._write_ref( value ):
+            return
+
+        # Objects which do not fit their class's schema are written as their
+        # pickled state:
+        tag = OBJECT
+        if (hooks == 'state') or value._has_instance_defined_traits():
+            tag = STATE
+
+        chunks = self.chunks
+        entry  = self.classes.get( ( klass, tag ) )
+        if entry is None:
+            # Write the class definition the first time the class is used:
+            schema = None
+            if tag == OBJECT:
+                schema = trait_schema( klass )
+
+            entry = self.classes[ ( klass, tag ) ] = (
+                _byte[ tag ] + _varint( len( self.classes ) ), schema )
+            chunks.append( entry[0] )
+            self._write_name( klass.__module__ )
+            self._write_name( klass.__name__ )
+            if schema is not None:
+                chunks.append( _varint( len( schema ) ) )
+                for name, writer in schema:
+                    self._write_name( name )
+        else:
+            chunks.append( entry[0] )
+
+        if tag == STATE:
+            self.write_value( value.__getstate__() )
+        else:
+            for name, writer in entry[1]:
+                writer( self, getattr( value, name ) )
+
+    def write_array ( self, value ):
+        """ Writes a numpy array to the stream.
+        """
+        if value.dtype.hasobject or (value.dtype.fields is not None):
+            self.write_pickled( value )
+            return
+
+        chunks = self.chunks
+        data   = value.tobytes()
+        chunks.append( _byte[ ARRAY ] )
+        self._write_name( value.dtype.str )
+        chunks.append( _varint( value.ndim ) )
+        chunks.extend( [ _varint( dim ) for dim in value.shape ] )
+        chunks.extend( ( _varint( len( data ) ), data ) )
+
+    def write_pickled ( self, value ):
+        data = pickle.dumps( value, pickle.HIGHEST_PROTOCOL )
+        self.chunks.extend( ( _byte[ PICKLED ], _varint( len( data ) ),
+                              data ) )
+
+    #-- Private Methods --------------------------------------------------------
+
+    def _write_ref ( self, value ):
+        """ Writes a reference to *value* if it has already been written, and
+            returns True. Otherwise adds it to the object table and returns
+            False.
+        """
+        objects = self.objects
+        index   = objects.get( id( value ) )
+        if index is not None:
+            self.chunks.extend( ( _byte[ REF ], _varint( index ) ) )
+            return True
+
+        objects[ id( value ) ] = len( objects )
+        self.written.append( value )
+
+        return False
+
+    def _write_items ( self, tag, value ):
+        self.chunks.extend( ( _byte[ tag ], _varint( len( value ) ) ) )
+        write_value = self.write_value
+        for item in value:
+            write_value( item )
+
+    def _write_name ( self, name ):
+        data = name.encode( 'utf-8' )
+        self.chunks.extend( ( _varint( len( data ) ), data ) )
+
+#-------------------------------------------------------------------------------
+#  Value writer dispatch:
+#-------------------------------------------------------------------------------
+
+# Maps value types to the TraitWriter method used to write them:
+_writers = {
+    type( None ): TraitWriter.write_none,
+    bool:         TraitWriter.write_bool,
+    int:          TraitWriter.write_int,
+    long:         TraitWriter.write_int,
+    float:        TraitWriter.write_float,
+    complex:      TraitWriter.write_complex,
+    unicode:      TraitWriter.write_text,
+    bytes:        TraitWriter.write_bytes,
+    list:         TraitWriter.write_list,
+    tuple:        TraitWriter.write_tuple,
+    dict:         TraitWriter.write_dict,
+    set:          TraitWriter.write_set
+}
+
+def _find_writer ( value ):
+    """ Returns the TraitWriter method used to write a value of a type not
+        in the writer dispatch table, adding it to the table.
+    """
+    klass = type( value )
+    numpy = sys.modules.get( 'numpy' )
+    if isinstance( value, HasTraits ):
+        writer = TraitWriter.write_object
+    elif (numpy is not None) and (klass is numpy.ndarray):
+        writer = TraitWriter.write_array
+    elif isinstance( value, list ):
+        writer = TraitWriter.write_list
+    elif isinstance( value, dict ):
+        writer = TraitWriter.write_dict
+    elif isinstance( value, set ):
+        writer = TraitWriter.write_set
+    else:
+        # Note that subclasses of the basic types are pickled, so that their
+        # type is preserved:
+        return TraitWriter.write_pickled
+
+    _writers[ klass ] = writer
+
+    return writer
+
+#-------------------------------------------------------------------------------
+#  Trait value writers:
+#-------------------------------------------------------------------------------
+
+def _field_writer ( types, writer ):
+    """ Returns a function which writes values of the specified *types* using
+        the specified TraitWriter method, and all other values using the
+        general purpose *write_value* method.
+    """
+    def write_field ( self, value ):
+        if type( value ) in types:
+            writer( self, value )
+        else:
+            self.write_value( value )
+
+    return write_field
+
+def _write_instance ( self, value ):
+    if value is None:
+        self.chunks.append( _byte[ NONE ] )
+    elif isinstance( value, HasTraits ):
+        self.write_object( value )
+    else:
+        self.write_value( value )
+
+# The trait value writers used for each kind of trait handler:
+_trait_writers = (
+    ( BaseBool,      _field_writer( ( bool, ),  TraitWriter.write_bool ) ),
+    ( BaseInt,       _field_writer( IntTypes,   TraitWriter.write_int ) ),
+    ( BaseLong,      _field_writer( IntTypes,   TraitWriter.write_int ) ),
+    ( BaseFloat,     _field_writer( ( float, ), TraitWriter.write_float ) ),
+    ( BaseUnicode,   _field_writer( ( unicode, ), TraitWriter.write_text ) ),
+    ( BaseStr,       _field_writer( ( unicode, ), TraitWriter.write_text ) ),
+    ( List,          TraitWriter.write_value ),
+    ( Dict,          TraitWriter.write_value ),
+    ( Set,           TraitWriter.write_value ),
+    ( BaseInstance,  _write_instance ),
+    ( AbstractArray, TraitWriter.write_value )
+)
+
+#-------------------------------------------------------------------------------
+#  Returns how a HasTraits class customizes pickling:
+#-------------------------------------------------------------------------------
+
+# Maps each class to the pickling hooks it overrides:
+_hooks = WeakKeyDictionary()
+
+# The classes whose pickling methods are used by the serializer:
+_standard_classes = ( HasTraits, CHasTraits, object )
+
+def _pickling_hooks ( klass ):
+    """ Returns 'reduce' if a HasTraits class overrides the *__reduce__* or
+        *__reduce_ex__* methods, 'state' if it overrides the *__getstate__*
+        or *__setstate__* methods, and None otherwise.
+    """
+    hooks = _hooks.get( klass, False )
+    if hooks is False:
+        hooks = None
+        for kind, names in (
+                ( 'reduce', ( '__reduce__',   '__reduce_ex__' ) ),
+                ( 'state',  ( '__getstate__', '__setstate__' ) ) ):
+            for name in names:
+                for base in klass.__mro__:
+                    if name in base.__dict__:
+                        if base not in _standard_classes:
+                            hooks = kind
+                        break
+
+            if hooks is not None:
+                break
+
+        _hooks[ klass ] = hooks
+
+    return hooks
+
+#-------------------------------------------------------------------------------
+#  Returns the serialization schema of a HasTraits class:
+#-------------------------------------------------------------------------------
+
+# Maps each class to its pickling plan and the schema derived from it:
+_schemas = WeakKeyDictionary()
+
+def trait_schema ( klass ):
+    """ Returns the serialization schema of a HasTraits class.
+
+        The schema is a tuple of ( name, writer ) pairs, one for each of the
+        class's persisted traits and delegates (in sorted order), where
+        *writer* is the function used to write the trait's value. The schema
+        is derived from the class's pickling plan, and so is rebuilt whenever
+        a trait is added to the class.
+    """
+    plan  = klass._trait_pickle_plan()
+    entry = _schemas.get( klass )
+    if (entry is not None) and (entry[0] is plan):
+        return entry[1]
+
+    class_traits = klass.__class_traits__
+    schema       = []
+    for name in sorted( plan[0] + plan[1] ):
+        writer  = TraitWriter.write_value
+        handler = class_traits[ name ].handler
+        for handler_class, trait_writer in _trait_writers:
+            if isinstance( handler, handler_class ):
+                writer = trait_writer
+                break
+
+        schema.append( ( name, writer ) )
+
+    schema = tuple( schema )
+    _schemas[ klass ] = ( plan, schema )
+
+    return schema
+
+#-------------------------------------------------------------------------------
+#  'TraitReader' class:
+#-------------------------------------------------------------------------------
+
+class TraitReader ( object ):
+    """ Reads a graph of values written by a TraitWriter from a binary stream.
+    """
+
+    def __init__ ( self, data ):
+        if bytes( data[ : len( Magic ) ] ) != Magic:
+            raise TraitError( 'The data is not a serialized trait stream.' )
+
+        self.data = data = bytearray( data )
+        if data[ len( Magic ) ] != Version:
+            raise TraitError( 'Unsupported trait stream version: %d.' %
+                              data[ len( Magic ) ] )
+
+        self.pos = len( Header )
+
+        # The objects read, indexed by their position in the object table:
+        self.objects = []
+
+        # The ( class, trait names ) of the classes read, indexed by their
+        # position in the class table:
+        self.classes = []
+
+    def read_value ( self ):
+        """ Reads the next value from the stream.
+        """
+        data = self.data
+        try:
+            tag = data[ self.pos ]
+        except IndexError:
+            raise TraitError( 'Unexpected end of trait stream.' )
+
+        self.pos += 1
+
+        return _readers[ tag ]( self )
+
+    def read_none ( self ):
+        return None
+
+    def read_false ( self ):
+        return False
+
+    def read_true ( self ):
+        return True
+
+    def read_int ( self ):
+        n = self._read_varint()
+        if n & 1:
+            return -((n + 1) >> 1)
+
+        return n >> 1
+
+    def read_float ( self ):
+        return _float.unpack_from( self.data, self._advance( 8 ) )[0]
+
+    def read_complex ( self ):
+        return complex( *_complex.unpack_from( self.data,
+                                               self._advance( 16 ) ) )
+
+    def read_text ( self ):
+        return self._read_bytes().decode( 'utf-8' )
+
+    def read_bytes ( self ):
+        return bytes( self._read_bytes() )
+
+    def read_list ( self ):
+        result = []
+        self.objects.append( result )
+        read_value = self.read_value
+        for i in range( self._read_varint() ):
+            result.append( read_value() )
+
+        return result
+
+    def read_tuple ( self ):
+        read_value = self.read_value
+        return tuple( [ read_value() for i in range( self._read_varint() ) ] )
+
+    def read_set ( self ):
+        result = set()
+        self.objects.append( result )
+        read_value = self.read_value
+        for i in range( self._read_varint() ):
+            result.add( read_value() )
+
+        return result
+
+    def read_dict ( self ):
+        result = {}
+        self.objects.append( result )
+        read_value = self.read_value
+        for i in range( self._read_varint() ):
+            key           = read_value()
+            result[ key ] = read_value()
+
+        return result
+
+    def read_object ( self ):
+        """ Reads a HasTraits object, restoring its trait values without
+            generating any trait change notifications.
+        """
+        klass, names = self._read_class( True )
+        object       = klass.__new__( klass )
+        self.objects.append( object )
+
+        read_value = self.read_value
+        values     = dict( [ ( name, read_value() ) for name in names ] )
+
+        object._init_trait_listeners()
+        object.trait_setq( **values )
+        object._post_init_trait_listeners()
+        object.traits_init()
+        object.traits_inited( True )
+
+        return object
+
+    def read_state ( self ):
+        """ Reads a HasTraits object written as its pickled state, restoring
+            it using its __setstate__ method.
+        """
+        klass, names = self._read_class( False )
+        object       = klass.__new__( klass )
+        self.objects.append( object )
+        object.__setstate__( self.read_value() )
+
+        return object
+
+    def read_ref ( self ):
+        index = self._read_varint()
+        try:
+            return self.objects[ index ]
+        except IndexError:
+            raise TraitError( 'Invalid object reference in trait stream.' )
+
+    def read_array ( self ):
+        import numpy
+
+        dtype = numpy.dtype( self._read_name() )
+        shape = tuple( [ self._read_varint()
+                         for i in range( self._read_varint() ) ] )
+
+        # Note that slicing the bytearray copies the data, so the resulting
+        # array is writable:
+        return numpy.frombuffer( self._read_bytes(), dtype ).reshape( shape )
+
+    def read_pickled ( self ):
+        return pickle.loads( bytes( self._read_bytes() ) )
+
+    #-- Private Methods --------------------------------------------------------
+
+    def _read_class ( self, has_names ):
+        """ Returns the ( class, trait names ) of the next class reference,
+            reading the class definition if it is the first reference to it.
+        """
+        index   = self._read_varint()
+        classes = self.classes
+        if index == len( classes ):
+            module = self._read_name()
+            name   = self._read_name()
+            names  = None
+            if has_names:
+                names = [ self._read_name()
+                          for i in range( self._read_varint() ) ]
+            classes.append( ( _import_class( module, name ), names ) )
+        elif index > len( classes ):
+            raise TraitError( 'Invalid class reference in trait stream.' )
+
+        entry = classes[ index ]
+        if (entry[1] is None) == has_names:
+            raise TraitError( 'Invalid class reference in trait stream.' )
+
+        return entry
+
+    def _read_varint ( self ):
+        data = self.data
+        pos  = self.pos
+        try:
+            result = data[ pos ]
+        except IndexError:
+            raise TraitError( 'Unexpected end of trait stream.' )
+
+        if result < 0x80:
+            # Handle the common single byte case quickly:
+            self.pos = pos + 1
+            return result
+
+        result = shift = 0
+        try:
+            while True:
+                byte    = data[ pos ]
+                pos    += 1
+                result |= (byte & 0x7F) << shift
+                if byte < 0x80:
+                    break
+                shift += 7
+        except IndexError:
+            raise TraitError( 'Unexpected end of trait stream.' )
+
+        self.pos = pos
+
+        return result
+
+    def _advance ( self, n ):
+        """ Advances the stream position past the next *n* bytes, returning
+            the position of the first of them.
+        """
+        pos = self.pos
+        end = self.pos = pos + n
+        if end > len( self.data ):
+            raise TraitError( 'Unexpected end of trait stream.' )
+
+        return pos
+
+    def _read_bytes ( self ):
+        n   = self._read_varint()
+        pos = self._advance( n )
+
+        return self.data[ pos: pos + n ]
+
+    def _read_name ( self ):
+        return str( self._read_bytes().decode( 'utf-8' ) )
+
+# The TraitReader methods used to read each type of value, indexed by tag:
+_readers = [
+    TraitReader.read_none,
+    TraitReader.read_false,
+    TraitReader.read_true,
+    TraitReader.read_int,
+    TraitReader.read_float,
+    TraitReader.read_complex,
+    TraitReader.read_text,
+    TraitReader.read_bytes,
+    TraitReader.read_list,
+    TraitReader.read_tuple,
+    TraitReader.read_dict,
+    TraitReader.read_set,
+    TraitReader.read_object,
+    TraitReader.read_ref,
+    TraitReader.read_array,
+    TraitReader.read_pickled,
+    TraitReader.read_state
+]
+
+def _import_class ( module, name ):
+    """ Returns the HasTraits class with the specified module and name.
+    """
+    try:
+        __import__( module )
+        klass = getattr( sys.modules[ module ], name )
+    except ( ImportError, AttributeError, KeyError ):
+        raise TraitError( "Could not find the class '%s.%s' used in the trait "
+                          "stream." % ( module, name ) )
+
+    if not (isinstance( klass, type ) and issubclass( klass, HasTraits )):
+        raise TraitError( "The class '%s.%s' used in the trait stream is not "
+                          "a HasTraits subclass." % ( module, name ) )
+
+    return klass
+
+#-------------------------------------------------------------------------------
+#  Public API:
+#-------------------------------------------------------------------------------
+
+def dumps ( value ):
+    """ Returns the serialized form of a value (typically a HasTraits object,
+        or a container of HasTraits objects) as a byte string.
+    """
+    writer = TraitWriter()
+    writer.write_value( value )
+
+    return writer.getvalue()
+
+def loads ( data ):
+    """ Returns the value restored from the serialized form created by
+        *dumps*.
+    """
+    reader = TraitReader( data )
+    value  = reader.read_value()
+    if reader.pos != len( reader.data ):
+        raise TraitError( 'Unexpected data at the end of the trait stream.' )
+
+    return value
+
+def dump ( value, file ):
+    """ Writes the serialized form of a value to a binary file.
+    """
+    file.write( dumps( value ) )
+
+def load ( file ):
+    """ Returns the value restored from the serialized form read from a
+        binary file.
+    """
+    return loads( file.read() )
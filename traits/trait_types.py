@@ -38,7 +38,7 @@ from .trait_base import (strx, get_module_name, class_of, SequenceTypes, TypeTyp
 
 from .trait_handlers import (TraitType, TraitInstance, TraitListObject,
         TraitSetObject, TraitSetEvent, TraitDictObject, TraitDictEvent,
-        ThisClass, items_event, RangeTypes, HandleWeakRef)
+        ThisClass, items_event, RangeTypes, HandleWeakRef, is_detached_copy)
 
 from .traits import (Trait, trait_from, _TraitMaker, _InstanceArgs, code_editor,
         html_editor, password_editor, shell_editor, date_editor, time_editor)
@@ -2334,6 +2334,9 @@ class List ( TraitType ):
             if object is None:
                 return value
 
+            if is_detached_copy( value, self ):
+                return TraitListObject.trusted( self, object, name, value )
+
             return TraitListObject( self, object, name, value )
 
         self.error( object, name, value )
@@ -2469,6 +2472,9 @@ class Set ( TraitType ):
             if object is None:
                 return value
 
+            if is_detached_copy( value, self ):
+                return TraitSetObject.trusted( self, object, name, value )
+
             return TraitSetObject( self, object, name, value )
 
         self.error( object, name, value )
@@ -2623,6 +2629,10 @@ class Dict ( TraitType ):
         if isinstance( value, dict ):
             if object is None:
                 return value
+
+            if is_detached_copy( value, self ):
+                return TraitDictObject.trusted( self, object, name, value )
+
             return TraitDictObject( self, object, name, value )
 
         self.error( object, name, value )
@@ -3002,7 +3012,7 @@ class Instance ( BaseInstance ):
             self.fast_validate = tuple( fast_validate )
         else:
             self.fast_validate = ( 19, self.klass, self.adapt,
-                                   self._allow_none )
+                                   self._allow_none, {} )
 
 class Supports( Instance ):
     """ A traits whose value must support a specified protocol.
@@ -87,6 +87,18 @@ name_pat   = re.compile( r'([a-zA-Z_]\w*)\s*(.*)' )
 # Characters valid in a traits name:
 name_chars = string.ascii_letters + string.digits + '_'
 
+# The maximum number of parsed listener templates to cache:
+MAX_LISTENER_TEMPLATES = 1000
+
+# Cache of parsed listener templates, keyed by the extended trait name pattern
+# they were parsed from. Each template is an immutable tuple of nodes (see
+# 'listener_template'):
+listener_templates = {}
+
+# Listener template node kinds:
+ITEM_NODE  = 0
+GROUP_NODE = 1
+
 #-------------------------------------------------------------------------------
 # Utility functions:
 #-------------------------------------------------------------------------------
@@ -686,7 +698,7 @@ class ListenerItem ( ListenerBase ):
         if remove:
             return next.unregister( getattr( object, name ) )
 
-        if not self.deferred or name in object.__dict__:
+        if not self.deferred or object._trait_has_value( name ):
             # Sometimes, the trait may already be assigned. This can happen when
             # there are chains of dynamic initializers and 'delegate'
             # notifications. If 'trait_a' and 'trait_b' have dynamic
@@ -1304,6 +1316,127 @@ class ListenerParser ( HasPrivateTraits ):
         self.len_text = len( self.text )
         self.listener = self.parse()
 
+#-------------------------------------------------------------------------------
+#  Returns the template for a specified extended trait name pattern:
+#-------------------------------------------------------------------------------
+
+def listener_template ( text ):
+    """ Returns the immutable template for the extended trait name pattern
+        specified by *text* (or None if the pattern is empty).
+
+        Each pattern is only parsed once. The template is a tuple of nodes,
+        the first of which is the root of the pattern. An item node is a
+        tuple of the form:
+
+            ( ITEM_NODE, name, metadata_name, metadata_defined, is_any_trait,
+              is_list_handler, notify, next_index )
+
+        where *next_index* is the index of the next node (or -1), and a group
+        node is a tuple of the form ( GROUP_NODE, item_indices ). Nodes refer
+        to each other by index, so that cyclic patterns can be represented.
+    """
+    template = listener_templates.get( text )
+    if template is None:
+        listener = ListenerParser( text ).listener
+        if listener is None:
+            return None
+
+        nodes   = []
+        indices = {}
+
+        def index_of ( listener ):
+            index = indices.get( listener )
+            if index is None:
+                indices[ listener ] = index = len( nodes )
+                nodes.append( None )
+                if isinstance( listener, ListenerGroup ):
+                    nodes[ index ] = ( GROUP_NODE, tuple(
+                        [ index_of( item ) for item in listener.items ] ) )
+                else:
+                    next = listener.next
+                    nodes[ index ] = (
+                        ITEM_NODE, listener.name, listener.metadata_name,
+                        listener.metadata_defined, listener.is_any_trait,
+                        listener.is_list_handler, listener.notify,
+                        -1 if next is None else index_of( next ) )
+
+            return index
+
+        index_of( listener )
+        template = tuple( nodes )
+
+        if len( listener_templates ) >= MAX_LISTENER_TEMPLATES:
+            listener_templates.clear()
+
+        listener_templates[ text ] = template
+
+    return template
+
+#-------------------------------------------------------------------------------
+#  Returns a new listener for a specified extended trait name pattern:
+#-------------------------------------------------------------------------------
+
+def parse_listener ( text, handler = None, wrapped_handler_ref = None,
+                     type = ANY_LISTENER, dispatch = '', priority = False,
+                     deferred = False ):
+    """ Returns a new, unregistered ListenerBase object for the extended trait
+        name pattern specified by *text*, built from the pattern's cached
+        template (see **listener_template**).
+
+        The *handler*, *wrapped_handler_ref*, *dispatch* and *priority*
+        values are assigned to every item of the new listener, and the *type*
+        and *deferred* values to its top level items, just as assigning them
+        to the listener would. The values are stored directly, without
+        validation or change notification.
+    """
+    template = listener_template( text )
+    if template is None:
+        return None
+
+    listeners = [ ListenerItem() if node[0] == ITEM_NODE else ListenerGroup()
+                  for node in template ]
+    for listener, node in zip( listeners, template ):
+        if node[0] == ITEM_NODE:
+            ( kind, name, metadata_name, metadata_defined, is_any_trait,
+              is_list_handler, notify, next ) = node
+            next = None if next < 0 else listeners[ next ]
+            listener.__dict__.update( {
+                'name':                name,
+                'metadata_name':       metadata_name,
+                'metadata_defined':    metadata_defined,
+                'is_any_trait':        is_any_trait,
+                'is_list_handler':     is_list_handler,
+                'notify':              notify,
+                'next':                next,
+                'handler':             handler,
+                'wrapped_handler_ref': wrapped_handler_ref,
+                'dispatch':            dispatch,
+                'priority':            priority } )
+        else:
+            listener.trait_setq(
+                items = [ listeners[ index ] for index in node[1] ] )
+            if handler is not None:
+                listener._handler             = handler
+                listener._wrapped_handler_ref = wrapped_handler_ref
+                listener._dispatch            = dispatch
+
+    # Assign the values only set on the top level items:
+    pending = [ 0 ]
+    seen    = set()
+    while len( pending ) > 0:
+        index = pending.pop()
+        if index not in seen:
+            seen.add( index )
+            node = template[ index ]
+            if node[0] == ITEM_NODE:
+                listeners[ index ].__dict__.update( {
+                    'type':     type,
+                    'deferred': deferred } )
+            else:
+                pending.extend( node[1] )
+
+    return listeners[0]
+
 #-------------------------------------------------------------------------------
 #  'ListenerNotifyWrapper' class:
 #-------------------------------------------------------------------------------